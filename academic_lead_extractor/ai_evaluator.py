@@ -5,9 +5,12 @@ AI-powered evaluation for academic contact relevance scoring.
 import json
 import time
 import asyncio
-from typing import List, Dict
+from typing import List
 from collections import defaultdict
 
+from academic_lead_extractor.contact import Contact
+from academic_lead_extractor import metrics
+from academic_lead_extractor.log import get_logger
 from config import (
     KEYWORDS_INCLUDE,
     KEYWORDS_BY_LANGUAGE,
@@ -15,8 +18,29 @@ from config import (
     AI_PRICING
 )
 
+log = get_logger("ai")
 
-async def ai_evaluate_contacts(contacts: List[Dict], use_ai: bool, client, ai_model: str, 
+
+def record_usage(response, ai_model: str) -> dict:
+    """Token usage and estimated cost of one API response; also counted in the run metrics."""
+    usage = getattr(response, "usage", None)
+    if not usage:
+        return {"total_tokens": 0, "input_tokens": 0, "output_tokens": 0, "estimated_cost": 0.0}
+    input_tokens = getattr(usage, 'prompt_tokens', 0)
+    output_tokens = getattr(usage, 'completion_tokens', 0)
+    total_tokens = getattr(usage, 'total_tokens', input_tokens + output_tokens)
+    cost = 0.0
+    if ai_model in AI_PRICING:
+        pricing = AI_PRICING[ai_model]
+        cost = (input_tokens / 1_000_000 * pricing["input"]) + (output_tokens / 1_000_000 * pricing["output"])
+    metrics.inc("ai_tokens_total", input_tokens, kind="input")
+    metrics.inc("ai_tokens_total", output_tokens, kind="output")
+    metrics.inc("ai_cost_usd_total", cost)
+    return {"total_tokens": total_tokens, "input_tokens": input_tokens, "output_tokens": output_tokens,
+            "estimated_cost": cost}
+
+
+async def ai_evaluate_contacts(contacts: List[Contact], use_ai: bool, client, ai_model: str, 
                                ai_batch_size: int, ai_min_score: float) -> tuple:
     """Evaluate contacts with AI and add scoring.
     
@@ -37,16 +61,16 @@ async def ai_evaluate_contacts(contacts: List[Dict], use_ai: bool, client, ai_mo
     
     if not use_ai or not contacts:
         # Fallback: multi-language keyword matching
-        print(f"🔍 Evaluating {len(contacts)} contacts with keyword matching (multi-language)")
+        log.info(f"🔍 Evaluating {len(contacts)} contacts with keyword matching (multi-language)")
         
         for c in contacts:
-            text = (c.get("Title", "") + " " + c.get("Role", "") + " " + c.get("page_text", "")).lower()
+            text = (c.Title + " " + c.Role + " " + c.page_text).lower()
             
             # Get keywords for this contact's country/language
             keywords_to_check = list(KEYWORDS_INCLUDE)  # Start with English keywords
             
             # Add language-specific keywords if available
-            country = c.get("Country", "")
+            country = c.Country
             if country in COUNTRY_LANGUAGE:
                 language = COUNTRY_LANGUAGE[country]
                 if language in KEYWORDS_BY_LANGUAGE:
@@ -56,23 +80,23 @@ async def ai_evaluate_contacts(contacts: List[Dict], use_ai: bool, client, ai_mo
             matched_keywords = [k for k in keywords_to_check if k.lower() in text]
             relevant = len(matched_keywords) > 0
             
-            c["AI_Score"] = 1.0 if relevant else 0.3
-            c["AI_Field"] = c.get("Field_of_study", "Unknown")
+            c.AI_Score = 1.0 if relevant else 0.3
+            c.AI_Field = c.Field_of_study
             if relevant:
-                c["AI_Reason"] = f"Keyword match: {', '.join(matched_keywords[:3])}"
+                c.AI_Reason = f"Keyword match: {', '.join(matched_keywords[:3])}"
             else:
-                c["AI_Reason"] = "No ICP keywords found"
+                c.AI_Reason = "No ICP keywords found"
         
         # Count matches by language
         by_language = defaultdict(int)
         for c in contacts:
-            if c["AI_Score"] >= 0.5:
-                country = c.get("Country", "Unknown")
+            if c.AI_Score >= 0.5:
+                country = c.Country or "Unknown"
                 language = COUNTRY_LANGUAGE.get(country, "English")
                 by_language[language] += 1
         
         if by_language:
-            print(f"  ✅ Found matches in: {', '.join([f'{lang} ({count})' for lang, count in by_language.items()])}")
+            log.info(f"  ✅ Found matches in: {', '.join([f'{lang} ({count})' for lang, count in by_language.items()])}")
         
         return contacts, token_stats
 
@@ -101,29 +125,29 @@ async def ai_evaluate_contacts(contacts: List[Dict], use_ai: bool, client, ai_mo
     if ai_model_lower in model_name_mapping:
         normalized_model = model_name_mapping[ai_model_lower]
         if original_model != normalized_model:
-            print(f"   ⚠️  Model name corrected: '{original_model}' → '{normalized_model}'")
+            log.warning(f"   ⚠️  Model name corrected: '{original_model}' → '{normalized_model}'")
         ai_model = normalized_model
     
     # Validate model name - only gpt-4o-mini and gpt-4o are allowed
     valid_models = ["gpt-4o-mini", "gpt-4o"]
     if ai_model not in valid_models:
-        print(f"❌ Error: Invalid model name '{original_model}'")
-        print(f"   Supported models: {', '.join(valid_models)}")
-        print(f"   💡 Tip: gpt-4o-mini is recommended (faster, cheaper, works with all API tiers)")
-        print(f"   Defaulting to: gpt-4o-mini")
+        log.warning(f"❌ Error: Invalid model name '{original_model}'")
+        log.warning(f"   Supported models: {', '.join(valid_models)}")
+        log.warning(f"   💡 Tip: gpt-4o-mini is recommended (faster, cheaper, works with all API tiers)")
+        log.warning(f"   Defaulting to: gpt-4o-mini")
         ai_model = "gpt-4o-mini"
     
-    print(f"🤖 Evaluating {len(contacts)} contacts with AI ({ai_model})...")
+    log.info(f"🤖 Evaluating {len(contacts)} contacts with AI ({ai_model})...")
     
     # Validate client is available
     if not client:
-        print("❌ Error: AI client is not available. Cannot evaluate contacts.")
-        print("   Check that OPENAI_API_KEY is set in .env file")
+        log.warning("❌ Error: AI client is not available. Cannot evaluate contacts.")
+        log.warning("   Check that OPENAI_API_KEY is set in .env file")
         # Return contacts with default scores
         for c in contacts:
-            c["AI_Score"] = 0.5
-            c["AI_Field"] = c.get("Field_of_study", "Unknown")
-            c["AI_Reason"] = "AI client not available"
+            c.AI_Score = 0.5
+            c.AI_Field = c.Field_of_study
+            c.AI_Reason = "AI client not available"
         return contacts, token_stats
     
     evaluated = []
@@ -135,19 +159,19 @@ async def ai_evaluate_contacts(contacts: List[Dict], use_ai: bool, client, ai_mo
         # Build prompt
         items = []
         for idx, c in enumerate(batch):
-            page_text = c.get("page_text", "")
+            page_text = c.page_text
             # Include page text up to 10000 chars for better context
             text_snippet = page_text[:10000] if page_text else ""
             
-            # Combine Title and Role if available, fallback to Title_role for backward compatibility
-            title = c.get("Title", "")
-            role = c.get("Role", "")
-            title_role_combined = f"{title}, {role}".strip(", ") if title or role else c.get("Title_role", "")
+            # Combine Title and Role if available
+            title = c.Title
+            role = c.Role
+            title_role_combined = f"{title}, {role}".strip(", ") if title or role else ""
             
             items.append({
                 "id": idx,
-                "name": c.get("Full_name", "Unknown"),
-                "email": c.get("Email", ""),
+                "name": c.Full_name,
+                "email": c.Email,
                 "title": title,
                 "role": role or title_role_combined,
                 "text": text_snippet
@@ -155,8 +179,8 @@ async def ai_evaluate_contacts(contacts: List[Dict], use_ai: bool, client, ai_mo
             
             # Warn if page text is very short (might affect scoring)
             if len(text_snippet) < 100 and idx == 0:
-                print(f"   ⚠️  Warning: First contact has very short page text ({len(text_snippet)} chars)")
-                print(f"      This might affect AI scoring quality.")
+                log.warning(f"   ⚠️  Warning: First contact has very short page text ({len(text_snippet)} chars)")
+                log.warning(f"      This might affect AI scoring quality.")
 
         prompt = f"""You are an expert at qualifying academic contacts for power electronics and energy systems research.
 
@@ -235,8 +259,8 @@ Contacts to evaluate:
 
         # Debug: Show batch info before API call
         if i == 0:
-            print(f"   📋 DEBUG: Batch size: {len(batch)}, Prompt length: {len(prompt)} chars")
-            print(f"   📋 DEBUG: Using model: {ai_model}")
+            log.debug(f"   📋 Batch size: {len(batch)}, Prompt length: {len(prompt)} chars")
+            log.debug(f"   📋 Using model: {ai_model}")
         
         # Retry logic with exponential backoff
         max_retries = 3
@@ -245,12 +269,13 @@ Contacts to evaluate:
         
         for attempt in range(max_retries):
             try:
-                response = client.chat.completions.create(
-                    model=ai_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    response_format={"type": "json_object"}  # Force JSON output
-                )
+                with metrics.span("ai_call", purpose="contact_scoring"):
+                    response = client.chat.completions.create(
+                        model=ai_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.2,
+                        response_format={"type": "json_object"}  # Force JSON output
+                    )
                 # Success! Break out of retry loop
                 break
                 
@@ -265,8 +290,8 @@ Contacts to evaluate:
                 
                 if attempt < max_retries - 1 and should_retry:
                     wait_time = retry_delay * (attempt + 1)  # 30s, 60s, 90s
-                    print(f"   ⚠️  API error (attempt {attempt + 1}/{max_retries}): {type(api_error).__name__}")
-                    print(f"   ⏳ Waiting {wait_time} seconds before retry...")
+                    log.warning(f"   ⚠️  API error (attempt {attempt + 1}/{max_retries}): {type(api_error).__name__}")
+                    log.warning(f"   ⏳ Waiting {wait_time} seconds before retry...")
                     time.sleep(wait_time)
                 else:
                     # Last attempt or non-retryable error - raise it to be caught by outer try/except
@@ -276,23 +301,9 @@ Contacts to evaluate:
             if not response:
                 raise Exception("Failed to get response after all retries")
             
-            # Track token usage from response
-            if hasattr(response, 'usage') and response.usage:
-                usage = response.usage
-                input_tokens = getattr(usage, 'prompt_tokens', 0)
-                output_tokens = getattr(usage, 'completion_tokens', 0)
-                total_tokens = getattr(usage, 'total_tokens', input_tokens + output_tokens)
-                
-                token_stats["input_tokens"] += input_tokens
-                token_stats["output_tokens"] += output_tokens
-                token_stats["total_tokens"] += total_tokens
-                
-                # Calculate cost for this batch
-                if ai_model in AI_PRICING:
-                    pricing = AI_PRICING[ai_model]
-                    batch_cost = (input_tokens / 1_000_000 * pricing["input"]) + \
-                                 (output_tokens / 1_000_000 * pricing["output"])
-                    token_stats["estimated_cost"] += batch_cost
+            # Track token usage and cost from response
+            for key, value in record_usage(response, ai_model).items():
+                token_stats[key] += value
             
             # Parse response (strip markdown if present)
             content = response.choices[0].message.content
@@ -311,10 +322,10 @@ Contacts to evaluate:
             
             # Debug: Check if we got the expected number of results
             if len(data) != len(batch):
-                print(f"⚠️ Warning: Expected {len(batch)} results, got {len(data)}")
+                log.warning(f"⚠️ Warning: Expected {len(batch)} results, got {len(data)}")
                 # Handle mismatch: pad or trim data to match batch size
                 if len(data) < len(batch):
-                    print(f"   ⚠️ AI returned fewer results. Padding missing contacts with default scores.")
+                    log.warning(f"   ⚠️ AI returned fewer results. Padding missing contacts with default scores.")
                     # Pad with default entries for missing contacts
                     for missing_idx in range(len(data), len(batch)):
                         data.append({
@@ -325,24 +336,24 @@ Contacts to evaluate:
                             "field": "unknown"
                         })
                 elif len(data) > len(batch):
-                    print(f"   ⚠️ AI returned more results. Trimming excess results.")
+                    log.warning(f"   ⚠️ AI returned more results. Trimming excess results.")
                     data = data[:len(batch)]
             
             # Debug: Show sample of first result in first batch
             if i == 0 and len(data) > 0:
-                print(f"   📋 Sample AI response keys: {list(data[0].keys())}")
-                print(f"   📋 Sample score: {data[0].get('score', 'MISSING')}")
-                print(f"   📋 Sample reason: {data[0].get('reason', 'MISSING')[:100]}")
-                print(f"   📋 Sample field: {data[0].get('field', 'MISSING')}")
+                log.debug(f"   📋 Sample AI response keys: {list(data[0].keys())}")
+                log.debug(f"   📋 Sample score: {data[0].get('score', 'MISSING')}")
+                log.debug(f"   📋 Sample reason: {data[0].get('reason', 'MISSING')[:100]}")
+                log.debug(f"   📋 Sample field: {data[0].get('field', 'MISSING')}")
                 # Show sample of what was sent to AI
                 if len(items) > 0:
                     original_name = items[0].get('name', 'N/A')
                     cleaned_name = data[0].get('cleaned_name', 'N/A')
-                    print(f"   📋 Sample input - Original name: {original_name[:60]}")
+                    log.debug(f"   📋 Sample input - Original name: {original_name[:60]}")
                     if cleaned_name and cleaned_name != 'N/A':
-                        print(f"   📋 Sample output - Cleaned name: {cleaned_name[:60]}")
-                    print(f"   📋 Sample input - Title: {items[0].get('title', 'N/A')[:100]}")
-                    print(f"   📋 Sample input - Text length: {len(items[0].get('text', ''))} chars")
+                        log.debug(f"   📋 Sample output - Cleaned name: {cleaned_name[:60]}")
+                    log.debug(f"   📋 Sample input - Title: {items[0].get('title', 'N/A')[:100]}")
+                    log.debug(f"   📋 Sample input - Text length: {len(items[0].get('text', ''))} chars")
             
             # Merge results with improved error handling
             for idx, (contact, ai_data) in enumerate(zip(batch, data)):
@@ -351,48 +362,48 @@ Contacts to evaluate:
                 if score is None:
                     score = ai_data.get("confidence", ai_data.get("relevance_score", 0.0))
                     if score == 0.0:
-                        print(f"⚠️ Contact #{i+idx}: No score in AI response! Keys: {list(ai_data.keys())}")
+                        log.warning(f"⚠️ Contact #{i+idx}: No score in AI response! Keys: {list(ai_data.keys())}")
                 
                 # Ensure score is a float
                 try:
                     score = float(score)
                 except (ValueError, TypeError):
-                    print(f"⚠️ Contact #{i+idx}: Invalid score '{score}', defaulting to 0.0")
+                    log.warning(f"⚠️ Contact #{i+idx}: Invalid score '{score}', defaulting to 0.0")
                     score = 0.0
                 
-                contact["AI_Score"] = score
-                contact["AI_Field"] = ai_data.get("field", contact.get("Field_of_study", "Unknown"))
-                contact["AI_Reason"] = ai_data.get("reason", "No reason provided")
+                contact.AI_Score = score
+                contact.AI_Field = ai_data.get("field", contact.Field_of_study)
+                contact.AI_Reason = ai_data.get("reason", "No reason provided")
                 
                 # Use AI-cleaned name if provided, otherwise keep original
                 cleaned_name = ai_data.get("cleaned_name")
                 if cleaned_name and cleaned_name.strip():
-                    contact["Full_name"] = cleaned_name.strip()
+                    contact.Full_name = cleaned_name.strip()
                 
                 # Use AI-extracted role if provided and better than existing
                 ai_role = ai_data.get("role")
                 if ai_role and ai_role.strip() and len(ai_role.strip()) > 10:
                     # Only replace if current role is empty or very short
-                    current_role = contact.get("Role", "")
+                    current_role = contact.Role
                     if not current_role or len(current_role) < 10:
-                        contact["Role"] = ai_role.strip()
+                        contact.Role = ai_role.strip()
                 
                 evaluated.append(contact)
                 
         except json.JSONDecodeError as e:
-            print(f"⚠️ AI evaluation failed for batch: JSON parsing error")
-            print(f"   Error: {e}")
-            print(f"   Response content preview: {content[:200] if 'content' in locals() else 'N/A'}")
+            log.warning(f"⚠️ AI evaluation failed for batch: JSON parsing error")
+            log.warning(f"   Error: {e}")
+            log.warning(f"   Response content preview: {content[:200] if 'content' in locals() else 'N/A'}")
             # Fallback for this batch
             for c in batch:
-                c["AI_Score"] = 0.5
-                c["AI_Field"] = c.get("Field_of_study", "Unknown")
-                c["AI_Reason"] = "AI evaluation failed: JSON parsing error"
+                c.AI_Score = 0.5
+                c.AI_Field = c.Field_of_study
+                c.AI_Reason = "AI evaluation failed: JSON parsing error"
                 evaluated.append(c)
         except Exception as e:
             error_type = type(e).__name__
             error_msg = str(e)
-            print(f"⚠️ AI evaluation failed for batch: {error_type}: {error_msg}")
+            log.warning(f"⚠️ AI evaluation failed for batch: {error_type}: {error_msg}")
             
             # Check for OpenAI APIError and extract error details
             try:
@@ -403,39 +414,39 @@ Contacts to evaluate:
                     error_message = error_info.get('message', '')
                     
                     if error_code == 'model_not_found':
-                        print(f"   ❌ Model '{ai_model}' not found or you don't have access")
-                        print(f"   Error message: {error_message}")
-                        print(f"   Valid models: gpt-4o-mini, gpt-4o")
-                        print(f"   Check your model name in .env (AI_MODEL) or --ai-model argument")
+                        log.warning(f"   ❌ Model '{ai_model}' not found or you don't have access")
+                        log.warning(f"   Error message: {error_message}")
+                        log.warning(f"   Valid models: gpt-4o-mini, gpt-4o")
+                        log.warning(f"   Check your model name in .env (AI_MODEL) or --ai-model argument")
                     elif error_code == 'invalid_api_key':
-                        print(f"   ❌ Invalid API key - check your OPENAI_API_KEY in .env")
+                        log.warning(f"   ❌ Invalid API key - check your OPENAI_API_KEY in .env")
                     elif error_code == 'rate_limit_exceeded':
-                        print(f"   ⚠️  Rate limit exceeded - wait a moment and try again")
+                        log.warning(f"   ⚠️  Rate limit exceeded - wait a moment and try again")
             except:
                 pass
             
             # Check for common API errors in error message
             if "authentication" in error_msg.lower() or "api key" in error_msg.lower():
-                print(f"   ❌ Authentication error - check your OPENAI_API_KEY in .env")
+                log.warning(f"   ❌ Authentication error - check your OPENAI_API_KEY in .env")
             elif "rate limit" in error_msg.lower():
-                print(f"   ⚠️  Rate limit exceeded - wait a moment and try again")
-                print(f"   💡 Tip: Reduce AI_BATCH_SIZE in .env to process fewer contacts at once")
+                log.warning(f"   ⚠️  Rate limit exceeded - wait a moment and try again")
+                log.warning(f"   💡 Tip: Reduce AI_BATCH_SIZE in .env to process fewer contacts at once")
             elif "model" in error_msg.lower() and ("not found" in error_msg.lower() or "does not exist" in error_msg.lower()):
-                print(f"   ❌ Model '{ai_model}' not found or not accessible with your API key")
-                print(f"   💡 Supported models: gpt-4o-mini (recommended), gpt-4o")
-                print(f"   💡 Note: gpt-4o requires higher API tier - use gpt-4o-mini if you see this error")
+                log.warning(f"   ❌ Model '{ai_model}' not found or not accessible with your API key")
+                log.warning(f"   💡 Supported models: gpt-4o-mini (recommended), gpt-4o")
+                log.warning(f"   💡 Note: gpt-4o requires higher API tier - use gpt-4o-mini if you see this error")
             elif "invalid" in error_msg.lower() and "model" in error_msg.lower():
-                print(f"   ❌ Model '{ai_model}' rejected by OpenAI API")
-                print(f"   💡 Possible reasons:")
-                print(f"      - Your API key tier doesn't have access to this model")
-                print(f"      - Temporary API issue (try again)")
-                print(f"   💡 Solution: Use --ai-model gpt-4o-mini (works with all API tiers)")
+                log.warning(f"   ❌ Model '{ai_model}' rejected by OpenAI API")
+                log.warning(f"   💡 Possible reasons:")
+                log.warning(f"      - Your API key tier doesn't have access to this model")
+                log.warning(f"      - Temporary API issue (try again)")
+                log.warning(f"   💡 Solution: Use --ai-model gpt-4o-mini (works with all API tiers)")
             
             # Fallback for this batch
             for c in batch:
-                c["AI_Score"] = 0.5
-                c["AI_Field"] = c.get("Field_of_study", "Unknown")
-                c["AI_Reason"] = f"AI evaluation failed: {error_type}"
+                c.AI_Score = 0.5
+                c.AI_Field = c.Field_of_study
+                c.AI_Reason = f"AI evaluation failed: {error_type}"
                 evaluated.append(c)
         
         # Progress with percentage and bar
@@ -444,40 +455,40 @@ Contacts to evaluate:
         bar_length = 20
         filled = int(bar_length * current / total)
         bar = '█' * filled + '░' * (bar_length - filled)
-        print(f"   Evaluated {current}/{total} contacts    [{percentage:5.1f}%] {bar}")
+        log.info(f"   Evaluated {current}/{total} contacts    [{percentage:5.1f}%] {bar}")
     
     # Final validation: Check score distribution
     if evaluated:
-        scores = [c.get("AI_Score", 0.0) for c in evaluated]
+        scores = [c.AI_Score for c in evaluated]
         avg_score = sum(scores) / len(scores)
         max_score = max(scores)
         min_score = min(scores)
         above_threshold = sum(1 for s in scores if s >= ai_min_score)
         
-        print(f"\n   📊 Score Distribution:")
-        print(f"      Average: {avg_score:.3f} | Min: {min_score:.3f} | Max: {max_score:.3f}")
-        print(f"      Above threshold ({ai_min_score}): {above_threshold}/{len(evaluated)}")
+        log.info(f"\n   📊 Score Distribution:")
+        log.info(f"      Average: {avg_score:.3f} | Min: {min_score:.3f} | Max: {max_score:.3f}")
+        log.info(f"      Above threshold ({ai_min_score}): {above_threshold}/{len(evaluated)}")
         
         # Warning if all scores are suspiciously low
         if max_score < 0.3:
-            print(f"\n   ⚠️  WARNING: All scores are very low (max={max_score:.3f})!")
-            print(f"      This could indicate:")
-            print(f"      1. AI model is being too strict")
-            print(f"      2. Contacts truly don't match the criteria")
-            print(f"      3. Page text doesn't contain enough information")
-            print(f"      Check sample AI response above to verify parsing is working correctly.")
+            log.warning(f"\n   ⚠️  WARNING: All scores are very low (max={max_score:.3f})!")
+            log.warning(f"      This could indicate:")
+            log.warning(f"      1. AI model is being too strict")
+            log.warning(f"      2. Contacts truly don't match the criteria")
+            log.warning(f"      3. Page text doesn't contain enough information")
+            log.warning(f"      Run with LOG_LEVEL = 'DEBUG' to see a sample AI response and verify parsing.")
         elif max_score < 0.5 and above_threshold == 0:
-            print(f"\n   ⚠️  WARNING: No contacts passed threshold, but max score is {max_score:.3f}")
-            print(f"      Consider lowering --ai-score threshold or checking if contacts are truly relevant.")
+            log.warning(f"\n   ⚠️  WARNING: No contacts passed threshold, but max score is {max_score:.3f}")
+            log.warning(f"      Consider lowering --ai-score threshold or checking if contacts are truly relevant.")
     
     # Display token usage summary
     if token_stats["total_tokens"] > 0:
-        print(f"\n   💰 Token Usage & Cost:")
-        print(f"      Input tokens:  {token_stats['input_tokens']:,}")
-        print(f"      Output tokens: {token_stats['output_tokens']:,}")
-        print(f"      Total tokens:  {token_stats['total_tokens']:,}")
-        print(f"      Estimated cost: ${token_stats['estimated_cost']:.4f} USD")
-        print(f"      Model: {ai_model}")
+        log.info(f"\n   💰 Token Usage & Cost:")
+        log.info(f"      Input tokens:  {token_stats['input_tokens']:,}")
+        log.info(f"      Output tokens: {token_stats['output_tokens']:,}")
+        log.info(f"      Total tokens:  {token_stats['total_tokens']:,}")
+        log.info(f"      Estimated cost: ${token_stats['estimated_cost']:.4f} USD")
+        log.info(f"      Model: {ai_model}")
     
     return evaluated, token_stats
 
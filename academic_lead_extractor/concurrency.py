@@ -0,0 +1,162 @@
+"""
+Adaptive per-host concurrency for the crawler (AIMD).
+
+Instead of one hand-tuned connection limit and fixed sleeps for every
+server, each host gets a HostLimiter whose limit on requests in flight moves
+with the responses it sees:
+
+    additive increase        a fast, successful response raises the limit by
+                             CONCURRENCY_INCREASE / limit, i.e. by about
+                             CONCURRENCY_INCREASE per round of requests, up to
+                             CONCURRENCY_MAX
+    multiplicative decrease  a timeout, connection error, 429 or 5xx multiplies
+                             it by CONCURRENCY_BACKOFF; latency rising above
+                             CONCURRENCY_LATENCY_TOLERANCE times the host's
+                             best by CONCURRENCY_LATENCY_BACKOFF
+
+Only requests sent after the last decrease can cause another one, so a burst
+of failures from the same round halves the limit once, not once per request.
+A Retry-After header (429/503) pauses all requests to the host for that long
+(at most MAX_RETRY_AFTER seconds).
+"""
+
+import asyncio
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from config import (
+    CONCURRENCY_INITIAL,
+    CONCURRENCY_MIN,
+    CONCURRENCY_MAX,
+    CONCURRENCY_INCREASE,
+    CONCURRENCY_BACKOFF,
+    CONCURRENCY_LATENCY_TOLERANCE,
+    CONCURRENCY_LATENCY_BACKOFF,
+    MAX_RETRY_AFTER,
+)
+from academic_lead_extractor import metrics
+
+LATENCY_SLACK = 0.05  # seconds always tolerated on top of the best latency (very fast hosts jitter)
+BEST_LATENCY_DRIFT = 1.01  # the best latency creeps up per response, so it follows a slower server
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date); 0 if absent or invalid."""
+    if not value:
+        return 0.0
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, OverflowError):
+            return 0.0
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HostLimiter:
+    """Requests in flight to one host, limited by an AIMD-controlled limit."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.limit = float(CONCURRENCY_INITIAL)
+        self.in_flight = 0
+        self.best_latency: Optional[float] = None
+        self.blocked_until = 0.0  # monotonic time before which no request is sent (Retry-After)
+        self.last_decrease = 0.0
+        self.decreases = 0
+        self._waiters = deque()
+
+    async def acquire(self) -> float:
+        """Wait for a free slot; returns the time the request starts (pass it to release())."""
+        loop = asyncio.get_running_loop()
+        while True:
+            pause = self.blocked_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return time.monotonic()
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done():
+                    self._wake()  # woken but cancelled: pass the free slot on
+                raise
+
+    def release(self, started: float, latency: Optional[float] = None, signal: str = "", retry_after: float = 0.0):
+        """
+        Free the slot and adapt the limit.
+
+        latency: time to the response headers (None if there was no response);
+        signal: "error" for a timeout or connection error, "throttled" for 429/5xx.
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+        if signal:
+            self._decrease(started, now, CONCURRENCY_BACKOFF, signal)
+        elif latency is not None:
+            if self.best_latency is None or latency < self.best_latency:
+                self.best_latency = latency
+            else:
+                self.best_latency *= BEST_LATENCY_DRIFT
+            if latency <= self.best_latency * CONCURRENCY_LATENCY_TOLERANCE + LATENCY_SLACK:
+                self.limit = min(float(CONCURRENCY_MAX), self.limit + CONCURRENCY_INCREASE / self.limit)
+            else:
+                self._decrease(started, now, CONCURRENCY_LATENCY_BACKOFF, "latency")
+        metrics.set_gauge("host_concurrency_limit", round(self.limit, 2), host=self.host)
+        self._wake()
+
+    def _decrease(self, started: float, now: float, factor: float, reason: str):
+        if started <= self.last_decrease:
+            return  # sent before the last decrease: that one already accounts for it
+        self.limit = max(float(CONCURRENCY_MIN), self.limit * factor)
+        self.last_decrease = now
+        self.decreases += 1
+        metrics.inc("concurrency_decreases_total", reason=reason)
+
+    def _wake(self):
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class HostLimiters:
+    """HostLimiter per host, shared by all crawls of a run (one event loop)."""
+
+    def __init__(self):
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._loop = None
+
+    def get(self, host: str) -> HostLimiter:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:  # waiters belong to one event loop
+            self._limiters = {}
+            self._loop = loop
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = HostLimiter(host)
+        return limiter
+
+    def snapshot(self) -> Dict[str, dict]:
+        """{host: limit, in flight, blocked seconds} (callable from other threads)."""
+        now = time.monotonic()
+        return {host: {"limit": round(limiter.limit, 1), "in_flight": limiter.in_flight,
+                       "paused": round(max(0.0, limiter.blocked_until - now), 1)}
+                for host, limiter in list(self._limiters.items())}
+
+
+HOST_LIMITERS = HostLimiters()
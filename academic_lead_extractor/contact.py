@@ -0,0 +1,67 @@
+"""
+Contact record type shared by the scraper, AI evaluator, enrichment and export.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Dict, Any
+
+
+# Column order of results/<country>.csv
+CSV_COLUMNS = [
+    "Full_name", "Email", "Title", "Role", "Field_of_study",
+    "Country", "University", "University_Website_URL", "University_Field_of_Study",
+    "Source_URL", "AI_Field", "AI_Score", "AI_Reason", "Publications"
+]
+
+# Fields used only inside the pipeline (never exported)
+INTERNAL_FIELDS = ("page_text",)
+
+
+@dataclass(slots=True)
+class Contact:
+    """
+    One extracted academic contact.
+
+    Field names match the exported CSV/JSON columns, so rows can be produced
+    without any key renaming. ``page_text`` is the page context passed to the
+    AI evaluator; contacts from the same page share a single string object.
+    """
+    Full_name: str = ""
+    Email: str = ""
+    Title: str = ""  # Academic title (Prof., Dr., etc.)
+    Role: str = ""  # Position/function (Head of..., Researcher in..., etc.)
+    Field_of_study: str = ""  # Individual's field (keyword-based)
+    University_Field_of_Study: str = ""  # Department/institute field
+    Source_URL: str = ""
+    Country: str = ""
+    University: str = ""
+    University_Website_URL: str = ""
+    AI_Field: str = ""
+    AI_Score: float = 0.0
+    AI_Reason: str = ""
+    Publications: List[str] = field(default_factory=list)
+    page_text: str = ""
+
+    def to_csv_row(self) -> Dict[str, Any]:
+        """Row for the semicolon CSV export (Publications as comma-separated string)."""
+        row = {col: getattr(self, col) for col in CSV_COLUMNS}
+        row["Publications"] = ", ".join(self.Publications) if self.Publications else ""
+        return row
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Structured record for the JSON export (Publications kept as a list)."""
+        row = {col: getattr(self, col) for col in CSV_COLUMNS}
+        row["Publications"] = list(self.Publications)
+        return row
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Contact":
+        """Build a contact from an exported JSON record (unknown keys are ignored)."""
+        contact = cls()
+        for name in cls.__slots__:
+            if name in data and data[name] is not None:
+                setattr(contact, name, data[name])
+        publications = contact.Publications
+        if isinstance(publications, str):
+            contact.Publications = [p.strip() for p in publications.split(",") if p.strip()]
+        return contact
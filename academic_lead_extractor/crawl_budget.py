@@ -0,0 +1,206 @@
+"""
+Adaptive crawl budget per university, under an optional budget for the run.
+
+A fixed page limit is wrong in both directions: a small site is exhausted
+long before it, while a big one spends it on news, events and course pages
+once its staff directories are done. CrawlBudget therefore watches the
+marginal yield of the crawl, i.e. new contacts (unique emails) and staff
+pages among the last CRAWL_BUDGET_WINDOW pages fetched:
+
+    - the crawl starts with MAX_PAGES_PER_DOMAIN pages; when that is used up
+      while the recent yield is at least CRAWL_BUDGET_EXTEND_YIELD, the limit
+      grows by CRAWL_BUDGET_EXTEND_STEP pages, up to CRAWL_BUDGET_MAX_PAGES
+    - after CRAWL_BUDGET_MIN_PAGES pages, while the recent pages bring fewer
+      than CRAWL_BUDGET_MIN_YIELD new contacts per page, links below the
+      homepage are only followed if their URL looks like a staff or department
+      page: deep branches of news, project and library pages are cut, while
+      department -> staff directory paths are still found (and lift the
+      restriction again once they yield)
+    - while staff pages are frequent (CRAWL_BUDGET_DEEP_STAFF_RATE), links are
+      followed one level deeper than MAX_CRAWL_DEPTH
+
+RunBudget caps the pages (CRAWL_RUN_MAX_PAGES) and the crawl time
+(CRAWL_RUN_MAX_SECONDS) of the whole run; both are off by default. Once it is
+used up, crawlers stop fetching new pages and keep what they have; budget
+extensions are only granted while the remaining pages leave every university
+still to be crawled its starting budget. Time is also enforced from outside
+the crawl: crawl_timeout() is the deadline process_university() puts on a
+university (UNIVERSITY_TIMEOUT, or the end of the run if that comes first).
+"""
+
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+from config import (
+    MAX_PAGES_PER_DOMAIN,
+    MAX_CRAWL_DEPTH,
+    CRAWL_BUDGET_MAX_PAGES,
+    CRAWL_BUDGET_EXTEND_STEP,
+    CRAWL_BUDGET_EXTEND_YIELD,
+    CRAWL_BUDGET_MIN_PAGES,
+    CRAWL_BUDGET_MIN_YIELD,
+    CRAWL_BUDGET_WINDOW,
+    CRAWL_BUDGET_DEEP_STAFF_RATE,
+    CRAWL_RUN_MAX_PAGES,
+    CRAWL_RUN_MAX_SECONDS,
+    UNIVERSITY_TIMEOUT,
+)
+from academic_lead_extractor import metrics
+
+
+class RunBudget:
+    """Pages and crawl time of the whole run (0 = unlimited), shared by all crawlers."""
+
+    def __init__(self, universities: int, max_pages: int = CRAWL_RUN_MAX_PAGES,
+                 max_seconds: float = CRAWL_RUN_MAX_SECONDS):
+        self.universities = universities
+        self.max_pages = max_pages
+        self.max_seconds = max_seconds
+        self.pages = 0
+        self.finished = 0  # universities done crawling
+        self.started = time.monotonic()
+
+    def exhausted(self) -> str:
+        """Why no more pages may be fetched ("" while the budget lasts)."""
+        if self.max_pages and self.pages >= self.max_pages:
+            return "run page budget"
+        if self.max_seconds and time.monotonic() - self.started >= self.max_seconds:
+            return "run time budget"
+        return ""
+
+    def remaining_seconds(self) -> Optional[float]:
+        """Time left until the run deadline (None without one)."""
+        if not self.max_seconds:
+            return None
+        return max(0.0, self.max_seconds - (time.monotonic() - self.started))
+
+    def can_extend(self, step: int) -> bool:
+        """Whether one university may take `step` pages beyond its starting budget."""
+        if not self.max_pages:
+            return True
+        waiting = max(self.universities - self.finished - 1, 0)
+        return self.max_pages - self.pages - step >= waiting * MAX_PAGES_PER_DOMAIN
+
+    def university_done(self):
+        self.finished += 1
+
+
+def crawl_timeout(run: Optional[RunBudget] = None) -> Tuple[Optional[float], str]:
+    """(seconds, reason) after which a university's crawl is cancelled; (None, "") without a limit."""
+    timeout, reason = (UNIVERSITY_TIMEOUT, "university time budget") if UNIVERSITY_TIMEOUT else (None, "")
+    remaining = run.remaining_seconds() if run is not None else None
+    if remaining is not None and (timeout is None or remaining < timeout):
+        timeout, reason = remaining, "run time budget"
+    return timeout, reason
+
+
+class CrawlBudget:
+    """Page and depth budget of one university's crawl, adapted to its recent yield."""
+
+    def __init__(self, run: Optional[RunBudget] = None):
+        self.run = run
+        self.limit = MAX_PAGES_PER_DOMAIN
+        self.pages = 0
+        self.staff_pages = 0
+        self.new_contacts = 0
+        self.extensions = 0
+        self.narrowed_at = 0  # pages fetched when the yield first dropped (0 = never)
+        self.stop_reason = ""
+        self._emails = set()
+        # (pages, staff pages, new contacts) when each of the last pages was fetched
+        self._history = deque(maxlen=CRAWL_BUDGET_WINDOW)
+
+    # -- yield --
+
+    def record(self, contacts) -> None:
+        """Credit a staff page and its contacts (only emails not seen before count as new)."""
+        self.staff_pages += 1
+        for contact in contacts:
+            email = (contact.Email or "").lower()
+            if email and email not in self._emails:
+                self._emails.add(email)
+                self.new_contacts += 1
+
+    def _window(self):
+        """(pages, staff pages, new contacts) over the last CRAWL_BUDGET_WINDOW pages."""
+        if not self._history:
+            return 0, 0, 0
+        pages, staff, contacts = self._history[0]
+        return self.pages - pages, self.staff_pages - staff, self.new_contacts - contacts
+
+    def recent_yield(self) -> float:
+        pages, _, contacts = self._window()
+        return contacts / pages if pages else 0.0
+
+    def staff_rate(self) -> float:
+        pages, staff, _ = self._window()
+        return staff / pages if pages else 0.0
+
+    # -- decisions --
+
+    @property
+    def max_depth(self) -> int:
+        """MAX_CRAWL_DEPTH, one level more while staff pages are frequent."""
+        deep = len(self._history) == CRAWL_BUDGET_WINDOW and self.staff_rate() >= CRAWL_BUDGET_DEEP_STAFF_RATE
+        return MAX_CRAWL_DEPTH + 1 if deep else MAX_CRAWL_DEPTH
+
+    def low_yield(self) -> bool:
+        """Whether the recent pages have stopped bringing new contacts."""
+        if self.pages < CRAWL_BUDGET_MIN_PAGES or len(self._history) < CRAWL_BUDGET_WINDOW:
+            return False
+        if self.recent_yield() >= CRAWL_BUDGET_MIN_YIELD:
+            return False
+        if not self.narrowed_at:
+            self.narrowed_at = self.pages
+            metrics.inc("crawl_budget_narrowed_total")
+        return True
+
+    def follow(self, depth: int) -> bool:
+        """Whether links at `depth` are still crawled (see low_yield() for the rest)."""
+        return not self.stop_reason and depth <= self.max_depth
+
+    def allow(self) -> bool:
+        """Take one page from the budget; False once the crawl has to stop."""
+        if self.stop_reason:
+            return False
+        reason = self.run.exhausted() if self.run is not None else ""
+        if not reason and self.pages >= self.limit:
+            reason = self._extend()
+        if reason:
+            self.stop_reason = reason
+            metrics.inc("crawl_budget_stops_total", reason=reason)
+            return False
+
+        self._history.append((self.pages, self.staff_pages, self.new_contacts))
+        self.pages += 1
+        if self.run is not None:
+            self.run.pages += 1
+        return True
+
+    def _extend(self) -> str:
+        """Grow the limit while the crawl is still productive; else why it stops."""
+        if self.limit >= CRAWL_BUDGET_MAX_PAGES:
+            return "page budget"
+        if self.recent_yield() < CRAWL_BUDGET_EXTEND_YIELD:
+            return "page budget"
+        if self.run is not None and not self.run.can_extend(CRAWL_BUDGET_EXTEND_STEP):
+            return "run page budget"
+        self.limit = min(self.limit + CRAWL_BUDGET_EXTEND_STEP, CRAWL_BUDGET_MAX_PAGES)
+        self.extensions += 1
+        metrics.inc("crawl_budget_extensions_total")
+        return ""
+
+    def summary(self) -> str:
+        """How the budget shaped the crawl (empty if the site simply ran out of links)."""
+        notes = []
+        if self.extensions:
+            notes.append(f"extended {self.extensions}x to {self.limit} pages")
+        if self.narrowed_at:
+            notes.append(f"staff/department links only after {self.narrowed_at} pages (low yield)")
+        if self.stop_reason:
+            notes.append(f"stopped by the {self.stop_reason}")
+        if not notes:
+            return ""
+        return (f"{self.pages} pages, {self.new_contacts} new contacts ({self.new_contacts / max(1, self.pages):.2f}/page); "
+                + ", ".join(notes))
@@ -0,0 +1,265 @@
+"""
+Live status of a running pipeline: throughput, queue depth, requests in
+flight, AI spend and an ETA.
+
+StatusBoard reads the run metrics (metrics.py) and the crawlers in progress
+from a background thread every SAMPLE_INTERVAL seconds, so it keeps answering
+while the event loop is busy or blocked (the OpenAI client is synchronous).
+It logs a one-line status every STATUS_LOG_INTERVAL seconds; with --status it
+also serves
+
+    http://127.0.0.1:<port>/          compact panel, refreshes itself
+    http://127.0.0.1:<port>/status    the same as JSON
+    http://127.0.0.1:<port>/metrics   all run metrics, Prometheus text
+
+Current rates are measured over the last STATUS_RATE_WINDOW seconds. The ETA
+is the number of remaining universities times the observed wall time per
+finished university (AI, enrichment and export included): with universities
+that differ 100x in size, the whole-run average is far steadier than the rate
+of the last few.
+"""
+
+import html
+import json
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from config import STATUS_LOG_INTERVAL, STATUS_RATE_WINDOW
+from academic_lead_extractor import metrics
+from academic_lead_extractor.log import get_logger
+from academic_lead_extractor.scraper import ACTIVE_CRAWLERS
+from academic_lead_extractor.concurrency import HOST_LIMITERS
+
+log = get_logger("status")
+
+SAMPLE_INTERVAL = 2.0  # seconds between readings of the counters
+SLOW_FACTOR = 3  # a university is flagged slow after this many times the average crawl time
+
+# Batch-level spans (processor.py) -> stage shown on the board; crawling otherwise
+STAGES = {
+    "export_finalize": "finalizing",
+    "export": "export",
+    "enrichment_batch": "enrichment",
+    "ai_evaluation": "AI scoring",
+}
+
+# Counters sampled into the history: key -> (kind, metric name)
+SERIES = {
+    "pages": ("histogram", "fetch_seconds"),
+    "contacts": ("counter", "contacts_extracted_total"),
+    "scored": ("counter", "contacts_scored_total"),
+    "enriched": ("counter", "contacts_enriched_total"),
+    "exported": ("counter", "contacts_exported_total"),
+    "tokens": ("counter", "ai_tokens_total"),
+}
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "–"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class StatusBoard:
+    """Samples the run metrics in a thread; logs a status line and optionally serves it over HTTP."""
+
+    def __init__(self, total_universities: int, port: Optional[int] = None):
+        self.total_universities = total_universities
+        self.port = port
+        self.started = time.perf_counter()
+        self.history = deque()  # (time, {series: value}) within the rate window
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    # -- lifecycle --
+
+    def start(self) -> "StatusBoard":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="status", daemon=True)
+        self._thread.start()
+        if self.port:
+            try:
+                self._server = ThreadingHTTPServer(("127.0.0.1", self.port), _handler(self))
+            except OSError as e:
+                log.warning(f"⚠️  Live status not served on port {self.port}: {e}")
+            else:
+                threading.Thread(target=self._server.serve_forever, name="status-http", daemon=True).start()
+                log.info(f"📟 Live status: http://127.0.0.1:{self.port}/ (JSON: /status, Prometheus: /metrics)")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _run(self):
+        last_log = time.perf_counter()
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            self._sample()
+            if STATUS_LOG_INTERVAL and time.perf_counter() - last_log >= STATUS_LOG_INTERVAL:
+                last_log = time.perf_counter()
+                log.info(self.status_line())
+
+    def _sample(self):
+        values = {}
+        for key, (kind, name) in SERIES.items():
+            values[key] = metrics.METRICS.histogram_total(name)[0] if kind == "histogram" else metrics.METRICS.total(name)
+        now = time.perf_counter()
+        self.history.append((now, values))
+        while len(self.history) > 2 and now - self.history[1][0] >= STATUS_RATE_WINDOW:
+            self.history.popleft()
+
+    # -- status --
+
+    def snapshot(self) -> dict:
+        registry = metrics.METRICS
+        now = time.perf_counter()
+        elapsed = now - self.started
+        history = list(self.history)
+        (first_time, first), (last_time, last) = history[0], history[-1]
+        window = max(last_time - first_time, 1e-9)
+
+        def rates(key: str) -> dict:
+            return {"total": last[key],
+                    "now": round((last[key] - first[key]) / window, 2) if len(history) > 1 else 0.0,
+                    "average": round(last[key] / max(last_time - self.started, 1e-9), 2)}
+
+        done, crawl_seconds = registry.histogram_total("university_seconds")
+        average_crawl = crawl_seconds / done if done else None
+        running = []
+        for tags, seconds in sorted(registry.running("university"), key=lambda x: -x[1]):
+            name = tags.get("university", "?")
+            crawler = ACTIVE_CRAWLERS.get(name)
+            running.append({
+                "university": name,
+                "seconds": round(seconds, 1),
+                "pages": len(crawler.visited) if crawler else 0,
+                "queued": crawler.pending() if crawler else 0,
+                "slow": bool(average_crawl and done >= 3 and seconds > SLOW_FACTOR * average_crawl),
+            })
+        remaining = max(self.total_universities - done, 0)
+        eta = remaining * elapsed / done if done else None
+
+        stage = "crawl" if running else "idle" if done else "starting"
+        active = {name for name, _, _ in list(registry.active.values())}
+        for span_name, label in STAGES.items():
+            if span_name in active:
+                stage = label
+                break
+
+        requests = Counter(tags.get("host", "?") for tags, _ in registry.running("fetch"))
+        limits = HOST_LIMITERS.snapshot()
+        return {
+            "elapsed_seconds": round(elapsed, 1),
+            "stage": stage,
+            "universities": {"total": self.total_universities, "done": done, "running": len(running),
+                             "queued": max(remaining - len(running), 0)},
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "pages": rates("pages"),
+            "contacts": rates("contacts"),
+            "scored": rates("scored"),
+            "enriched": rates("enriched"),
+            "exported": rates("exported"),
+            "queue_depth": sum(item["queued"] for item in running),
+            "requests_in_flight": dict(requests.most_common()),
+            "host_limits": {host: limits[host] for host in requests if host in limits},
+            "ai_calls_in_flight": len(registry.running("ai_call")),
+            "ai_tokens": {"total": last["tokens"], "per_minute": rates("tokens")["now"] * 60},
+            "ai_cost_usd": round(registry.total("ai_cost_usd_total"), 4),
+            "fetch_retries": registry.total("fetch_retries_total"),
+            "throttled": registry.total("http_responses_total", status=429)
+                         + registry.total("http_responses_total", status=503),
+            "fetch_failures": registry.total("fetch_failures_total"),
+            "running": running,
+        }
+
+    def status_line(self) -> str:
+        s = self.snapshot()
+        unis = s["universities"]
+        line = (f"📟 {unis['done']}/{unis['total']} universities ({unis['running']} running, {s['stage']}) · "
+                f"{s['pages']['now']:.1f} pages/s · {s['contacts']['now']:.1f} contacts/s · "
+                f"queue {s['queue_depth']:,} · in flight {sum(s['requests_in_flight'].values())}")
+        if s["ai_tokens"]["total"]:
+            line += f" · AI {s['ai_tokens']['per_minute']:,.0f} tokens/min, ${s['ai_cost_usd']:.2f}"
+        if s["throttled"]:
+            line += f" · {s['throttled']:.0f} throttled (429/503)"
+        return line + f" · ETA {_duration(s['eta_seconds'])}"
+
+    def render(self) -> str:
+        s = self.snapshot()
+        unis = s["universities"]
+
+        def rate_row(label: str, key: str) -> str:
+            r = s[key]
+            return f"{label:10s} {r['total']:10,.0f}   {r['now']:7.1f}/s now   {r['average']:7.1f}/s avg"
+
+        limits = s["host_limits"]
+        hosts = ", ".join(f"{host} {n}" + (f"/{limits[host]['limit']:g}" if host in limits else "")
+                          for host, n in list(s["requests_in_flight"].items())[:8]) or "none"
+        lines = [
+            f"elapsed {_duration(s['elapsed_seconds'])}   stage: {s['stage']}   "
+            f"universities {unis['done']}/{unis['total']} done, {unis['running']} running, {unis['queued']} queued   "
+            f"ETA {_duration(s['eta_seconds'])}",
+            "",
+            rate_row("pages", "pages") + f"   queue {s['queue_depth']:,}",
+            rate_row("contacts", "contacts"),
+            rate_row("scored", "scored"),
+            rate_row("enriched", "enriched"),
+            rate_row("exported", "exported"),
+            "",
+            f"requests   {sum(s['requests_in_flight'].values())} in flight (per host: now/limit): {hosts}",
+            f"           {s['fetch_retries']:.0f} retries, {s['throttled']:.0f} throttled (429/503), "
+            f"{s['fetch_failures']:.0f} failures",
+            f"AI         {s['ai_calls_in_flight']} calls in flight, {s['ai_tokens']['total']:,.0f} tokens "
+            f"({s['ai_tokens']['per_minute']:,.0f}/min), ${s['ai_cost_usd']:.4f}",
+        ]
+        if s["running"]:
+            lines.append("")
+            for item in s["running"]:
+                flag = "   ⚠️ slow" if item["slow"] else ""
+                lines.append(f"running    {item['university'][:40]:40s} {_duration(item['seconds']):>7s}   "
+                             f"{item['pages']:6,d} pages   {item['queued']:6,d} queued{flag}")
+        return "\n".join(lines)
+
+
+def _handler(board: StatusBoard):
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/status":
+                self._send(json.dumps(board.snapshot(), ensure_ascii=False), "application/json")
+            elif path == "/metrics":
+                self._send(metrics.METRICS.to_prometheus(), "text/plain; version=0.0.4")
+            elif path == "/":
+                page = (f'<!doctype html><meta charset="utf-8"><meta http-equiv="refresh" content="{SAMPLE_INTERVAL:g}">'
+                        f"<title>Academic Lead Extractor</title><pre>{html.escape(board.render())}</pre>")
+                self._send(page, "text/html")
+            else:
+                self.send_error(404)
+
+        def _send(self, body: str, content_type: str):
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass  # no access log on the terminal
+
+    return StatusHandler
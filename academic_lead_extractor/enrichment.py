@@ -3,17 +3,19 @@ Publication enrichment via Crossref API.
 """
 
 from aiohttp import ClientSession
-from typing import Dict, Any
 
+from academic_lead_extractor.contact import Contact
+from academic_lead_extractor import metrics
 
-async def enrich_publications(session: ClientSession, contact: Dict[str, Any]) -> Dict[str, Any]:
+
+async def enrich_publications(session: ClientSession, contact: Contact) -> Contact:
     """
     Fetch publication URLs via Crossref API.
     Searches by author name and returns up to 10 most recent publications.
     """
-    name = contact.get("Full_name", "")
+    name = contact.Full_name
     if not name or len(name) < 3:
-        contact["Publications"] = []
+        contact.Publications = []
         return contact
     
     # Try Crossref API
@@ -26,23 +28,25 @@ async def enrich_publications(session: ClientSession, contact: Dict[str, Any]) -
             "order": "desc"
         }
         
-        async with session.get(url, params=params, timeout=10, ssl=False) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                items = data.get("message", {}).get("items", [])
-                pubs = []
+        with metrics.span("enrichment"):
+            async with session.get(url, params=params, timeout=10, ssl=False) as resp:
+                metrics.inc("enrichment_responses_total", status=resp.status)
+                if resp.status == 200:
+                    data = await resp.json()
+                    items = data.get("message", {}).get("items", [])
+                    pubs = []
                 
-                for item in items:
-                    pub_url = item.get("URL")
-                    if pub_url:
-                        pubs.append(pub_url)
+                    for item in items:
+                        pub_url = item.get("URL")
+                        if pub_url:
+                            pubs.append(pub_url)
                 
-                contact["Publications"] = pubs[:10]
-                return contact
+                    contact.Publications = pubs[:10]
+                    return contact
     except Exception as e:
         # Silently fail - publication enrichment is optional
         pass
     
-    contact["Publications"] = []
+    contact.Publications = []
     return contact
 
@@ -0,0 +1,217 @@
+"""
+Incremental result writers.
+
+Contacts are appended to ``results/<country>.csv`` and ``results/<country>.jsonl``
+as soon as their batch of universities is scored and enriched. At the end of
+the run the JSON Lines file is merged into the structured
+``results/<country>.json`` export and the CSV is rewritten in the same order.
+
+Optionally the final (deduplicated) rows are also written to a columnar
+dataset (Parquet or Arrow IPC, partitioned by Country/University) under
+``results/dataset/`` so results of many runs can be queried together without
+reparsing JSON. Each row carries the Run_ID of the run that wrote it.
+"""
+
+import csv
+import json
+import os
+import time
+import uuid
+from typing import Dict, List, Iterable
+
+from academic_lead_extractor.contact import Contact, CSV_COLUMNS
+
+
+class CountryExportWriter:
+    """
+    Append-only CSV/JSONL writer for one country.
+
+    Deduplication keeps the contact with the highest AI_Score for each email
+    (first seen wins ties), the same rule the end-of-run export used. A later
+    university can still beat an email that was already appended; the better
+    record goes to the JSONL file. finalize() rewrites the CSV once from the
+    merged records, sorted by AI_Score across all universities.
+    """
+
+    def __init__(self, output_dir: str, country: str):
+        self.country = country
+        self.csv_path = os.path.join(output_dir, f"{country}.csv")
+        self.jsonl_path = os.path.join(output_dir, f"{country}.jsonl")
+        self.json_path = os.path.join(output_dir, f"{country}.json")
+        self.best_scores: Dict[str, float] = {}  # email -> AI_Score of the record kept so far
+        self.contacts_seen = 0
+        self.records: List[dict] = []  # final JSON records, set by finalize()
+
+        # Start fresh files for this run (header written once)
+        with open(self.csv_path, "w", encoding="utf-8", newline="") as f:
+            csv.DictWriter(f, fieldnames=CSV_COLUMNS, delimiter=";").writeheader()
+        open(self.jsonl_path, "w", encoding="utf-8").close()
+
+    def append(self, contacts: Iterable[Contact]) -> List[Contact]:
+        """Append one university's contacts; returns the rows that were written."""
+        kept: List[Contact] = []
+        # Highest score first, so duplicates inside this batch keep the best record
+        for contact in sorted(contacts, key=lambda c: c.AI_Score, reverse=True):
+            self.contacts_seen += 1
+            previous = self.best_scores.get(contact.Email)
+            if previous is not None and contact.AI_Score <= previous:
+                continue
+            self.best_scores[contact.Email] = contact.AI_Score
+            kept.append(contact)
+
+        if not kept:
+            return kept
+
+        with open(self.csv_path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, delimiter=";")
+            writer.writerows(c.to_csv_row() for c in kept)
+        with open(self.jsonl_path, "a", encoding="utf-8") as f:
+            for c in kept:
+                f.write(json.dumps(c.to_json_dict(), ensure_ascii=False))
+                f.write("\n")
+        return kept
+
+    def finalize(self) -> int:
+        """Merge the JSON Lines file into the structured JSON export; returns the contact count."""
+        merged: Dict[str, dict] = {}
+        with open(self.jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                email = record.get("Email", "")
+                current = merged.get(email)
+                if current is None or record.get("AI_Score", 0) > current.get("AI_Score", 0):
+                    merged[email] = record
+
+        # Stable sort: highest AI_Score first, arrival order within equal scores
+        contacts = sorted(merged.values(), key=lambda r: r.get("AI_Score", 0), reverse=True)
+
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "country": self.country,
+                "extraction_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "total_contacts": len(contacts),
+                "contacts": contacts
+            }, f, indent=2, ensure_ascii=False)
+
+        # Same order as the JSON export, without the rows superseded by higher-scoring duplicates
+        with open(self.csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, delimiter=";")
+            writer.writeheader()
+            writer.writerows(Contact.from_dict(r).to_csv_row() for r in contacts)
+
+        self.records = contacts
+        return len(contacts)
+
+    @property
+    def duplicates_removed(self) -> int:
+        return self.contacts_seen - len(self.best_scores)
+
+
+class ColumnarDatasetWriter:
+    """
+    Writes contacts as a Parquet or Arrow IPC dataset partitioned by Country/University.
+
+    ResultsWriter calls write() once per run, with the deduplicated rows of
+    every country, so a run never leaves superseded duplicates behind. Each run
+    adds new fragment files named after its Run_ID (timestamp plus a random
+    suffix, so two runs started in the same second don't overwrite each other)
+    and never rewrites existing ones: the dataset accumulates rows across runs,
+    and the Run_ID column tells the runs apart (see load_results_dataset()).
+    Requires the optional ``pyarrow`` dependency.
+    """
+
+    FORMATS = {"parquet": "parquet", "arrow": "ipc"}
+
+    def __init__(self, output_dir: str, fmt: str = "parquet"):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        if fmt not in self.FORMATS:
+            raise ValueError(f"columnar format must be one of: {', '.join(self.FORMATS)} (got {fmt})")
+        self._pa = pa
+        self._ds = ds
+        self.format = fmt
+        self.base_dir = os.path.join(output_dir, "dataset")
+        # Sorts by start time; the suffix keeps runs started in the same second apart
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.fragments_written = 0
+        self.schema = pa.schema(
+            [(col, pa.string()) for col in CSV_COLUMNS if col not in ("AI_Score", "Publications")]
+            + [("AI_Score", pa.float64()), ("Publications", pa.list_(pa.string())), ("Run_ID", pa.string())]
+        )
+
+    def write(self, contacts: List[Contact]):
+        if not contacts:
+            return
+        columns = {name: [getattr(c, name) for c in contacts] for name in self.schema.names if name != "Run_ID"}
+        columns["Run_ID"] = [self.run_id] * len(contacts)
+        columns["AI_Score"] = [float(score) for score in columns["AI_Score"]]
+        table = self._pa.Table.from_pydict(columns, schema=self.schema)
+        extension = "parquet" if self.format == "parquet" else "arrow"
+        self._ds.write_dataset(
+            table,
+            self.base_dir,
+            format=self.FORMATS[self.format],
+            partitioning=["Country", "University"],
+            partitioning_flavor="hive",
+            basename_template=f"part-{self.run_id}-{self.fragments_written}-{{i}}.{extension}",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        self.fragments_written += 1
+
+
+def load_results_dataset(path: str = os.path.join("results", "dataset"), fmt: str = "parquet"):
+    """
+    Open the combined columnar dataset written with ``--columnar``.
+
+    Returns a ``pyarrow.dataset.Dataset``; filters are pushed down to the
+    partitions, e.g.::
+
+        import pyarrow.dataset as ds
+        dataset = load_results_dataset()
+        table = dataset.to_table(filter=(ds.field("Country") == "Germany") & (ds.field("AI_Score") >= 0.7))
+
+    The dataset holds every run's rows, so an email found in several runs
+    appears once per run. Run IDs sort by start time; to query only the latest
+    run::
+
+        import pyarrow.compute as pc
+        latest = pc.max(dataset.to_table(columns=["Run_ID"])["Run_ID"]).as_py()
+        table = dataset.to_table(filter=ds.field("Run_ID") == latest)
+    """
+    import pyarrow.dataset as ds
+
+    return ds.dataset(path, format=ColumnarDatasetWriter.FORMATS[fmt], partitioning="hive")
+
+
+class ResultsWriter:
+    """Routes finished contacts to one CountryExportWriter per country."""
+
+    def __init__(self, output_dir: str = "results", columnar_format: str = None):
+        self.output_dir = output_dir
+        self.writers: Dict[str, CountryExportWriter] = {}
+        os.makedirs(output_dir, exist_ok=True)
+        # Optional Parquet/Arrow dataset alongside the CSV/JSON files
+        self.columnar = ColumnarDatasetWriter(output_dir, columnar_format) if columnar_format else None
+
+    def write(self, contacts: Iterable[Contact]) -> int:
+        """Append contacts (typically one university's) to their country files."""
+        by_country: Dict[str, List[Contact]] = {}
+        for c in contacts:
+            by_country.setdefault(c.Country, []).append(c)
+
+        written = 0
+        for country, country_contacts in by_country.items():
+            writer = self.writers.get(country)
+            if writer is None:
+                writer = self.writers[country] = CountryExportWriter(self.output_dir, country)
+            written += len(writer.append(country_contacts))
+        return written
+
+    def finalize(self) -> Dict[str, int]:
+        """Produce the final JSON files (and the columnar rows); returns {country: contact count}."""
+        counts = {country: writer.finalize() for country, writer in self.writers.items()}
+        if self.columnar:
+            # Written once, from the deduplicated records: superseded rows never reach the dataset
+            self.columnar.write([Contact.from_dict(r) for writer in self.writers.values() for r in writer.records])
+        return counts
@@ -0,0 +1,217 @@
+"""
+SQLite lead store that accumulates results across runs (--store).
+
+Leads are upserted by email, so merging a run into an existing history is an
+indexed operation per contact instead of reloading and deduplicating every
+export file. Tables:
+
+    universities  one row per university website (name, country, last run)
+    pages         staff pages contacts were found on
+    contacts      one row per email, with the latest AI evaluation
+    publications  publication URLs (Crossref links) of the contact record kept for an email
+
+Emails are stored lowercased (so addresses that differ only in case are one
+lead); the CSV/JSON exports keep each address as it was found on the page.
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+from academic_lead_extractor.contact import Contact
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS universities (
+    id          INTEGER PRIMARY KEY,
+    url         TEXT NOT NULL UNIQUE,
+    name        TEXT NOT NULL DEFAULT '',
+    country     TEXT NOT NULL DEFAULT '',
+    last_run    TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id              INTEGER PRIMARY KEY,
+    url             TEXT NOT NULL UNIQUE,
+    university_id   INTEGER REFERENCES universities(id),
+    last_seen       TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS contacts (
+    email                       TEXT PRIMARY KEY,
+    full_name                   TEXT NOT NULL DEFAULT '',
+    title                       TEXT NOT NULL DEFAULT '',
+    role                        TEXT NOT NULL DEFAULT '',
+    field_of_study              TEXT NOT NULL DEFAULT '',
+    university_field_of_study   TEXT NOT NULL DEFAULT '',
+    ai_field                    TEXT NOT NULL DEFAULT '',
+    ai_score                    REAL NOT NULL DEFAULT 0,
+    ai_reason                   TEXT NOT NULL DEFAULT '',
+    university_id               INTEGER REFERENCES universities(id),
+    page_id                     INTEGER REFERENCES pages(id),
+    run_id                      TEXT NOT NULL DEFAULT '',
+    first_seen                  TEXT NOT NULL DEFAULT '',
+    last_seen                   TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS publications (
+    email   TEXT NOT NULL REFERENCES contacts(email) ON DELETE CASCADE,
+    title   TEXT NOT NULL,  -- publication URL (Contact.Publications)
+    PRIMARY KEY (email, title)
+);
+CREATE INDEX IF NOT EXISTS idx_universities_name ON universities(name);
+CREATE INDEX IF NOT EXISTS idx_contacts_university ON contacts(university_id);
+CREATE INDEX IF NOT EXISTS idx_contacts_ai_score ON contacts(ai_score);
+CREATE INDEX IF NOT EXISTS idx_pages_university ON pages(university_id);
+"""
+
+# Columns replaced when a contact is seen again
+_UPDATED_COLUMNS = (
+    "full_name", "title", "role", "field_of_study", "university_field_of_study",
+    "ai_field", "ai_score", "ai_reason", "university_id", "page_id",
+)
+
+# The first record of a run replaces data from older runs; within one run the
+# highest AI_Score wins, first seen on ties (same rule as the CSV/JSON export).
+# Re-applying the same rows leaves the table unchanged. _replaces() is the same
+# rule in Python (used to decide which rows' publications are stored).
+_REPLACE = "(excluded.ai_score > contacts.ai_score OR contacts.run_id <> excluded.run_id)"
+
+UPSERT_CONTACT = f"""
+INSERT INTO contacts (email, {", ".join(_UPDATED_COLUMNS)}, run_id, first_seen, last_seen)
+VALUES (:email, {", ".join(":" + col for col in _UPDATED_COLUMNS)}, :run_id, :seen, :seen)
+ON CONFLICT(email) DO UPDATE SET
+    {", ".join(f"{col} = CASE WHEN {_REPLACE} THEN excluded.{col} ELSE contacts.{col} END" for col in _UPDATED_COLUMNS)},
+    run_id = excluded.run_id,
+    last_seen = excluded.last_seen
+"""
+
+SQLITE_MAX_PARAMS = 999  # bound parameters per statement on older SQLite builds
+
+
+def _replaces(row: dict, stored: Optional[tuple]) -> bool:
+    """Whether the upsert replaces the stored (ai_score, run_id) with row (see _REPLACE)."""
+    return stored is None or row["ai_score"] > stored[0] or stored[1] != row["run_id"]
+
+
+class LeadStore:
+    """Indexed SQLite history of all leads; every write() is one transaction."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self.run_id = time.strftime("%Y%m%d-%H%M%S")
+        self.contacts_at_start = self.count()
+        self._university_ids: Dict[str, int] = {}
+        self._page_ids: Dict[str, int] = {}
+
+    def _university_id(self, url: str, name: str = "", country: str = "") -> int:
+        uni_id = self._university_ids.get(url)
+        if uni_id is None:
+            self.conn.execute(
+                "INSERT INTO universities (url, name, country) VALUES (?, ?, ?) ON CONFLICT(url) DO NOTHING",
+                (url, name, country)
+            )
+            uni_id = self.conn.execute("SELECT id FROM universities WHERE url = ?", (url,)).fetchone()[0]
+            self._university_ids[url] = uni_id
+        return uni_id
+
+    def _page_id(self, url: str, university_id: int, seen: str) -> int:
+        page_id = self._page_ids.get(url)
+        if page_id is None:
+            self.conn.execute(
+                "INSERT INTO pages (url, university_id, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET university_id = excluded.university_id, last_seen = excluded.last_seen",
+                (url, university_id, seen)
+            )
+            page_id = self.conn.execute("SELECT id FROM pages WHERE url = ?", (url,)).fetchone()[0]
+            self._page_ids[url] = page_id
+        return page_id
+
+    def write(self, universities: Iterable[dict], contacts: Iterable[Contact]) -> int:
+        """Upsert a batch of universities and their contacts in one transaction; returns contacts written."""
+        seen = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO universities (url, name, country, last_run) VALUES (:url, :name, :country, :seen) "
+                "ON CONFLICT(url) DO UPDATE SET name = excluded.name, country = excluded.country, last_run = excluded.last_run",
+                [{"url": u.get("url", ""), "name": u.get("name", ""), "country": u.get("country", ""), "seen": seen}
+                 for u in universities]
+            )
+
+            rows = []
+            for c in contacts:
+                email = c.Email.lower()
+                if not email:
+                    continue
+                uni_id = self._university_id(c.University_Website_URL, c.University, c.Country)
+                rows.append({
+                    "email": email,
+                    "full_name": c.Full_name,
+                    "title": c.Title,
+                    "role": c.Role,
+                    "field_of_study": c.Field_of_study,
+                    "university_field_of_study": c.University_Field_of_Study,
+                    "ai_field": c.AI_Field,
+                    "ai_score": float(c.AI_Score),
+                    "ai_reason": c.AI_Reason,
+                    "university_id": uni_id,
+                    "page_id": self._page_id(c.Source_URL, uni_id, seen) if c.Source_URL else None,
+                    "run_id": self.run_id,
+                    "seen": seen,
+                    "publications": c.Publications,
+                })
+
+            # Publications follow the record the upsert keeps, never a rejected one: replay
+            # the batch against the stored (ai_score, run_id) of its emails
+            stored = self._stored_scores({row["email"] for row in rows})
+            kept_publications: Dict[str, list] = {}
+            for row in rows:
+                current = stored.get(row["email"])
+                if _replaces(row, current):
+                    stored[row["email"]] = (row["ai_score"], row["run_id"])
+                    kept_publications[row["email"]] = row["publications"]
+                else:
+                    stored[row["email"]] = (current[0], row["run_id"])
+
+            self.conn.executemany(UPSERT_CONTACT, rows)
+            self.conn.executemany("DELETE FROM publications WHERE email = ?", [(e,) for e in kept_publications])
+            self.conn.executemany("INSERT OR IGNORE INTO publications (email, title) VALUES (?, ?)",
+                                  [(email, url) for email, urls in kept_publications.items() for url in urls])
+        return len(rows)
+
+    def _stored_scores(self, emails: set) -> Dict[str, tuple]:
+        """{email: (ai_score, run_id)} of the stored contacts among emails (primary key lookups)."""
+        emails = list(emails)
+        stored = {}
+        for i in range(0, len(emails), SQLITE_MAX_PARAMS):
+            chunk = emails[i:i + SQLITE_MAX_PARAMS]
+            stored.update((email, (score, run_id)) for email, score, run_id in self.conn.execute(
+                f"SELECT email, ai_score, run_id FROM contacts WHERE email IN ({', '.join('?' * len(chunk))})", chunk))
+        return stored
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def top_leads(self, min_score: float = 0.0, university: Optional[str] = None, limit: int = 100) -> List[dict]:
+        """Highest-scoring leads, optionally for one university (by name); served by the indexes."""
+        query = (
+            "SELECT c.*, u.name AS university, u.country AS country, p.url AS source_url "
+            "FROM contacts c LEFT JOIN universities u ON u.id = c.university_id "
+            "LEFT JOIN pages p ON p.id = c.page_id WHERE c.ai_score >= ?"
+        )
+        params: list = [min_score]
+        if university:
+            query += " AND c.university_id IN (SELECT id FROM universities WHERE name = ?)"
+            params.append(university)
+        query += " ORDER BY c.ai_score DESC LIMIT ?"
+        params.append(limit)
+
+        cursor = self.conn.execute(query, params)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def close(self):
+        self.conn.close()
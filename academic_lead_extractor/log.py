@@ -0,0 +1,139 @@
+"""
+Leveled, sampled logging that writes off the event loop.
+
+Modules log through a category logger (get_logger("fetch"), "crawl",
+"classify", ...). Records go into a queue and are written to the terminal
+(and optionally to a JSON Lines file) by a QueueListener thread, so the crawl
+never blocks on stdout. DEBUG records of each category can be sampled
+(LOG_SAMPLING) and rate-limited (LOG_RATE_LIMIT records per second); what was
+dropped is reported when logging shuts down.
+
+    LOG_LEVEL = "INFO"    per-university summaries, warnings, the run report
+    LOG_LEVEL = "DEBUG"   also every URL, classification and extraction (config.DEBUG)
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from config import LOG_LEVEL, LOG_FILE, LOG_SAMPLING, LOG_RATE_LIMIT
+from academic_lead_extractor.metrics import current_tags
+
+ROOT = "lead_extractor"
+
+_listener: Optional[QueueListener] = None
+_filter: Optional["SamplingFilter"] = None
+
+
+def get_logger(category: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT}.{category}")
+
+
+class SamplingFilter(logging.Filter):
+    """Per-category sampling and token-bucket rate limit for DEBUG records."""
+
+    def __init__(self, sampling: Dict[str, float], rate_limit: float):
+        super().__init__()
+        self.sampling = sampling
+        self.rate_limit = rate_limit
+        self._buckets: Dict[str, list] = {}  # category -> [tokens, last refill]
+        self.dropped: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        category = record.name.rsplit(".", 1)[-1]
+        rate = self.sampling.get(category, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            return self._drop(category)
+        if self.rate_limit:
+            now = time.monotonic()
+            bucket = self._buckets.get(category)
+            if bucket is None:
+                bucket = self._buckets[category] = [self.rate_limit, now]
+            bucket[0] = min(self.rate_limit, bucket[0] + (now - bucket[1]) * self.rate_limit)
+            bucket[1] = now
+            if bucket[0] < 1:
+                return self._drop(category)
+            bucket[0] -= 1
+        return True
+
+    def _drop(self, category: str) -> bool:
+        self.dropped[category] = self.dropped.get(category, 0) + 1
+        return False
+
+
+class _ContextFilter(logging.Filter):
+    """Attach the metrics tags (university, host) of the logging task to the record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.tags = current_tags()
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "category": record.name.rsplit(".", 1)[-1],
+            "message": record.getMessage().strip(),
+            **getattr(record, "tags", {}),
+        }
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(level: str = LOG_LEVEL, log_file: str = LOG_FILE):
+    """Route all category loggers through the queue (idempotent)."""
+    global _listener, _filter
+    if _listener is not None:
+        return
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    handlers = [console]
+    if log_file:
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+
+    records = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    _filter = SamplingFilter(LOG_SAMPLING, LOG_RATE_LIMIT)
+    queue_handler.addFilter(_filter)
+    queue_handler.addFilter(_ContextFilter())
+
+    root = logging.getLogger(ROOT)
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level)
+    root.propagate = False
+    _listener = QueueListener(records, *handlers, respect_handler_level=False)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Report dropped records and flush the queue (called at exit)."""
+    global _listener
+    if _listener is None:
+        return
+    if _filter is not None and _filter.dropped:
+        total = sum(_filter.dropped.values())
+        detail = ", ".join(f"{category}: {count:,}" for category, count in sorted(_filter.dropped.items()))
+        get_logger("pipeline").warning(f"🔇 {total:,} log messages sampled out or rate-limited ({detail})")
+    _listener.stop()
+    _listener = None
+
+
+# Records logged before setup_logging() (e.g. library use) still reach the terminal
+if not logging.getLogger(ROOT).handlers:
+    _fallback = logging.StreamHandler(sys.stdout)
+    _fallback.setFormatter(logging.Formatter("%(message)s"))
+    logging.getLogger(ROOT).addHandler(_fallback)
+    logging.getLogger(ROOT).setLevel(LOG_LEVEL)
+    logging.getLogger(ROOT).propagate = False
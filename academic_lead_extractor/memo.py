@@ -0,0 +1,58 @@
+"""
+Bounded LRU memo for pure text classification functions.
+
+Keys are short digests of the normalized input, so cached entries stay small
+even when the classified texts are whole pages.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def text_key(*parts: str) -> bytes:
+    """Digest of one or more normalized text parts (parts are kept distinct)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+class LRUMemo:
+    """Least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get_or_compute(self, key, compute: Callable[[], Any]):
+        """Return the cached value for key, computing and storing it on a miss."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            if self.maxsize > 0:
+                self._data[key] = value
+                if len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+            return value
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data),
+                "maxsize": self.maxsize, "hit_rate": self.hit_rate}
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = 0
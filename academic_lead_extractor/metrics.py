@@ -0,0 +1,287 @@
+"""
+Per-stage metrics and tracing for the pipeline.
+
+Counters, gauges and histograms are kept in one process-wide registry
+(METRICS); span() times a stage, records its duration in the histogram
+``<name>_seconds`` and keeps a trace record with its parent span. Tags
+(university, host, ...) set with tags() apply to everything recorded inside
+the block, including asyncio tasks started from it, since they live in a
+context variable.
+
+At the end of a run the registry is written as JSON (metrics.json, including
+the trace) and Prometheus text (metrics.prom); with an OTLP endpoint the
+spans are also sent to an OpenTelemetry collector (needs opentelemetry-sdk and
+opentelemetry-exporter-otlp-proto-http).
+"""
+
+import contextvars
+import itertools
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from config import METRICS_MAX_SPANS
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_TAGS: contextvars.ContextVar[Tuple[Tuple[str, str], ...]] = contextvars.ContextVar("metrics_tags", default=())
+_SPAN: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("metrics_span", default=None)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(extra: Dict[str, object]) -> Labels:
+    merged = dict(_TAGS.get())
+    merged.update((k, str(v)) for k, v in extra.items() if v is not None and v != "")
+    return tuple(sorted(merged.items()))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count", "max")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot: above the highest bound
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile: upper bound of the bucket holding it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "sum": round(self.sum, 6), "max": round(self.max, 6),
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95),
+                "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts))}
+
+
+class MetricsRegistry:
+    """Counters, gauges, histograms and finished spans of one run."""
+
+    def __init__(self, max_spans: int = METRICS_MAX_SPANS):
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.gauges: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self.spans: List[dict] = []
+        self.active: Dict[int, Tuple[str, Labels, float]] = {}  # running spans: id -> (name, labels, start)
+        self.spans_dropped = 0
+        self.max_spans = max_spans
+        self.started = time.time()
+        self._span_ids = itertools.count(1)
+
+    def inc(self, name: str, value: float = 1, **tags):
+        key = (name, _labels(tags))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **tags):
+        self.gauges[(name, _labels(tags))] = value
+
+    def observe(self, name: str, value: float, **tags):
+        key = (name, _labels(tags))
+        hist = self.histograms.get(key)
+        if hist is None:
+            hist = self.histograms[key] = Histogram()
+        hist.observe(value)
+
+    @contextmanager
+    def span(self, name: str, **tags):
+        """Time the block as a span of `name` (also on errors, which are tagged)."""
+        span_id = next(self._span_ids)
+        parent = _SPAN.get()
+        token = _SPAN.set(span_id)
+        start_wall = time.time()
+        start = time.perf_counter()
+        self.active[span_id] = (name, _labels(tags), start)
+        error = ""
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            _SPAN.reset(token)
+            del self.active[span_id]
+            self.observe(f"{name}_seconds", duration, **tags)
+            if error:
+                self.inc(f"{name}_errors_total", error=error, **tags)
+            if len(self.spans) < self.max_spans:
+                record = {"id": span_id, "parent": parent, "name": name, "start": round(start_wall, 6),
+                          "duration": round(duration, 6), "tags": dict(_labels(tags))}
+                if error:
+                    record["error"] = error
+                self.spans.append(record)
+            else:
+                self.spans_dropped += 1
+
+    # -- live reads (safe from other threads: the dicts are copied in one step) --
+
+    def total(self, name: str, **match) -> float:
+        """Sum of counter `name` over all series whose tags include `match`."""
+        wanted = {(k, str(v)) for k, v in match.items()}
+        return sum(value for (series, labels), value in list(self.counters.items())
+                   if series == name and wanted.issubset(labels))
+
+    def histogram_total(self, name: str) -> Tuple[int, float]:
+        """(observations, sum) of histogram `name` over all tags."""
+        count, total = 0, 0.0
+        for (series, _), hist in list(self.histograms.items()):
+            if series == name:
+                count += hist.count
+                total += hist.sum
+        return count, total
+
+    def running(self, name: str) -> List[Tuple[Dict[str, str], float]]:
+        """(tags, seconds so far) of the spans of `name` that have not finished yet."""
+        now = time.perf_counter()
+        return [(dict(labels), now - start) for series, labels, start in list(self.active.values())
+                if series == name]
+
+    def stage_totals(self) -> Dict[str, Tuple[int, float]]:
+        """{span name: (count, total seconds)} over all tags."""
+        totals: Dict[str, Tuple[int, float]] = {}
+        for (name, _), hist in self.histograms.items():
+            if name.endswith("_seconds"):
+                stage = name[:-len("_seconds")]
+                count, total = totals.get(stage, (0, 0.0))
+                totals[stage] = (count + hist.count, total + hist.sum)
+        return totals
+
+    # -- export --
+
+    def to_dict(self) -> dict:
+        def series(items, value):
+            return [{"name": name, "tags": dict(labels), **value(v)} for (name, labels), v in items]
+
+        return {
+            "started": self.started,
+            "finished": time.time(),
+            "counters": series(self.counters.items(), lambda v: {"value": v}),
+            "gauges": series(self.gauges.items(), lambda v: {"value": v}),
+            "histograms": series(self.histograms.items(), lambda h: h.to_dict()),
+            "spans": self.spans,
+            "spans_dropped": self.spans_dropped,
+        }
+
+    def write_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text format (also served live by the status page, i.e. from another thread)."""
+        lines = []
+        prefix = "lead_extractor_"
+
+        def fmt(labels: Labels, extra: Labels = ()) -> str:
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+        typed = set()
+        for kind, items in (("counter", self.counters), ("gauge", self.gauges)):
+            for (name, labels), value in sorted(list(items.items())):
+                metric = prefix + name
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} {kind}")
+                lines.append(f"{metric}{fmt(labels)} {value:g}")
+        for (name, labels), hist in sorted(list(self.histograms.items())):
+            metric = prefix + name
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, n in zip(list(hist.buckets) + ["+Inf"], list(hist.counts)):
+                cumulative += n
+                lines.append(f"{metric}_bucket{fmt(labels, (('le', str(bound)),))} {cumulative}")
+            lines.append(f"{metric}_sum{fmt(labels)} {hist.sum:.6f}")
+            lines.append(f"{metric}_count{fmt(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+    def export(self, output_dir: str) -> Tuple[str, str]:
+        """Write metrics.json and metrics.prom into output_dir; returns both paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        json_path = os.path.join(output_dir, "metrics.json")
+        prom_path = os.path.join(output_dir, "metrics.prom")
+        self.write_json(json_path)
+        self.write_prometheus(prom_path)
+        return json_path, prom_path
+
+    def export_otlp(self, endpoint: str) -> int:
+        """Send the recorded spans to an OTLP/HTTP collector; returns the number sent."""
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        provider = TracerProvider(resource=Resource.create({"service.name": "academic-lead-extractor"}))
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint.rstrip("/") + "/v1/traces")))
+        tracer = provider.get_tracer(__name__)
+        started = {}
+        # Parents finish after their children, so the spans are replayed by start time
+        for record in sorted(self.spans, key=lambda r: (r["start"], r["id"])):
+            parent = started.get(record["parent"])
+            context = trace.set_span_in_context(parent) if parent is not None else None
+            span = tracer.start_span(record["name"], context=context, attributes=record["tags"],
+                                     start_time=int(record["start"] * 1e9))
+            if record.get("error"):
+                span.set_attribute("error.type", record["error"])
+            started[record["id"]] = span
+        for record in self.spans:
+            started[record["id"]].end(end_time=int((record["start"] + record["duration"]) * 1e9))
+        provider.shutdown()  # flushes the exporter
+        return len(self.spans)
+
+
+def current_tags() -> Dict[str, str]:
+    return dict(_TAGS.get())
+
+
+@contextmanager
+def tags(**values):
+    """Tag everything recorded inside the block (and in tasks started from it)."""
+    token = _TAGS.set(_labels(values))
+    try:
+        yield
+    finally:
+        _TAGS.reset(token)
+
+
+METRICS = MetricsRegistry()
+span = METRICS.span
+inc = METRICS.inc
+observe = METRICS.observe
+set_gauge = METRICS.set_gauge
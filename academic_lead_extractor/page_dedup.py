@@ -0,0 +1,172 @@
+"""
+Duplicate page detection for the crawler.
+
+Universities serve the same staff list under several URLs: print views,
+language variants, query-string and trailing-slash variants. Two checks keep
+the crawler from recording it more than once:
+
+    canonical_url()  URL variants (fragments, tracking/session/print parameters,
+                     www., slashes, case) map to one key and are fetched once
+    PageDeduper      staff pages whose text is nearly the same (64-bit SimHash)
+                     and whose emails an earlier page already listed, or that
+                     list exactly the same emails as an earlier page, are
+                     skipped before AI filtering and not recorded; the
+                     fingerprint reuses the page text and the emails of the
+                     page's extraction. Pages without emails (e.g. "Team"
+                     indexes from a shared template that only link to
+                     profiles) are never duplicates, so their links are followed
+"""
+
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from config import URL_IGNORED_PARAMS, SIMHASH_MAX_DISTANCE
+
+_IGNORED_PARAMS = {p.lower() for p in URL_IGNORED_PARAMS}
+_INDEX_PAGE_RE = re.compile(r"/(?:index|default)\.(?:html?|php|aspx?)$", re.IGNORECASE)
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+_WORD_RE = re.compile(r"\w+")
+
+SIMHASH_BITS = 64
+_BANDS = SIMHASH_MAX_DISTANCE + 1  # pigeonhole: near-duplicates agree on at least one band
+_BAND_BITS = SIMHASH_BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+MIN_SIMHASH_WORDS = 50  # shorter texts are compared by their emails only
+MIN_EMAIL_SET = 3  # identical email sets of at least this size mark a duplicate
+# For each bit of a byte: table mapping a byte to 1 if that bit is set, else 0
+_BIT_TABLES = [bytes((b >> bit) & 1 for b in range(256)) for bit in range(8)]
+
+
+def canonical_url(url: str) -> str:
+    """Key under which URL variants of the same page compare equal (not meant to be fetched)."""
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parsed.port and parsed.port not in (80, 443):
+        host = f"{host}:{parsed.port}"
+
+    path = _MULTI_SLASH_RE.sub("/", parsed.path)  # ";jsessionid=..." path parameters are dropped too
+    path = _INDEX_PAGE_RE.sub("/", path).rstrip("/").lower()
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k.lower() not in _IGNORED_PARAMS and not k.lower().startswith("utm_")
+    )
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash of the text's word 3-shingles (None for texts under MIN_SIMHASH_WORDS words).
+
+    Shingles are hashed with Python's built-in hash(), which is salted per process:
+    fingerprints compare within one run only (they are never stored).
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < MIN_SIMHASH_WORDS:
+        return None
+    shingles = len(words) - 2
+    # 8 bytes per shingle hash: every k-th byte holds the same 8 bits of each hash
+    hashes = array("q", [hash((words[i], words[i + 1], words[i + 2])) for i in range(shingles)]).tobytes()
+    # Bit-wise majority vote over all shingle hashes, most significant bit first
+    threshold = shingles / 2
+    value = 0
+    for bit in range(SIMHASH_BITS - 1, -1, -1):
+        ones = hashes[bit // 8::8].translate(_BIT_TABLES[bit % 8]).count(1)
+        value = (value << 1) | (ones > threshold)
+    return value
+
+
+class PageFingerprint(NamedTuple):
+    simhash: Optional[int]
+    emails: frozenset
+
+
+def fingerprint(text: str, emails: Iterable[str]) -> PageFingerprint:
+    return PageFingerprint(simhash(text), frozenset(e.lower() for e in emails if e))
+
+
+@dataclass(slots=True)
+class DedupStats:
+    """What duplicate detection saved."""
+    url_variants: int = 0  # fetches skipped: the URL is a variant of one already crawled
+    near_duplicates: int = 0  # staff pages fetched but not filtered or recorded
+    contacts_skipped: int = 0  # contacts the skipped pages would have re-extracted
+
+    def add(self, other: "DedupStats"):
+        self.url_variants += other.url_variants
+        self.near_duplicates += other.near_duplicates
+        self.contacts_skipped += other.contacts_skipped
+
+
+class PageDeduper:
+    """Per-crawl registry of claimed URLs and staff page fingerprints."""
+
+    def __init__(self):
+        self.stats = DedupStats()
+        self._claimed: Dict[str, str] = {}  # canonical URL -> first URL seen
+        self._variants_skipped = set()
+        self._pages: List[tuple] = []  # (url, fingerprint)
+        self._bands: Dict[tuple, List[int]] = {}  # (band index, band value) -> page indexes
+        self._by_emails: Dict[frozenset, int] = {}
+        self._contacts: Dict[str, int] = {}
+
+    def claim_url(self, url: str) -> bool:
+        """True if url is the first of its variants; False (and counted) for a later variant."""
+        key = canonical_url(url)
+        first = self._claimed.setdefault(key, url)
+        if first == url:
+            return True
+        if url not in self._variants_skipped:
+            self._variants_skipped.add(url)
+            self.stats.url_variants += 1
+        return False
+
+    def is_claimed_variant(self, url: str) -> bool:
+        """True if a different variant of url was already claimed (counted like claim_url)."""
+        first = self._claimed.get(canonical_url(url))
+        if first is None or first == url:
+            return False
+        return not self.claim_url(url)
+
+    def find_duplicate(self, fp: PageFingerprint) -> Optional[str]:
+        """URL of an earlier staff page this one duplicates, or None."""
+        if len(fp.emails) >= MIN_EMAIL_SET and fp.emails in self._by_emails:
+            return self._pages[self._by_emails[fp.emails]][0]
+        if fp.simhash is None or not fp.emails:
+            return None  # no emails: nothing to re-extract, and its links must still be followed
+        for band in range(_BANDS):
+            key = (band, (fp.simhash >> (band * _BAND_BITS)) & _BAND_MASK)
+            for idx in self._bands.get(key, ()):
+                url, other = self._pages[idx]
+                if (bin(fp.simhash ^ other.simhash).count("1") <= SIMHASH_MAX_DISTANCE
+                        and fp.emails <= other.emails):
+                    return url
+        return None
+
+    def add(self, url: str, fp: PageFingerprint):
+        idx = len(self._pages)
+        self._pages.append((url, fp))
+        if len(fp.emails) >= MIN_EMAIL_SET:
+            self._by_emails.setdefault(fp.emails, idx)
+        if fp.simhash is not None and fp.emails:
+            for band in range(_BANDS):
+                key = (band, (fp.simhash >> (band * _BAND_BITS)) & _BAND_MASK)
+                self._bands.setdefault(key, []).append(idx)
+
+    def record_contacts(self, url: str, count: int):
+        """Remember how many contacts a staff page yielded (reported when a duplicate is skipped)."""
+        self._contacts[url] = count
+
+    def skip(self, original_url: str):
+        """Count a staff page skipped as a duplicate of original_url."""
+        self.stats.near_duplicates += 1
+        self.stats.contacts_skipped += self._contacts.get(original_url, 0)
+
+
+# Totals over all universities of this run (reported in the pipeline summary)
+DEDUP_TOTALS = DedupStats()
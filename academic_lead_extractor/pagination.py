@@ -0,0 +1,180 @@
+"""
+Pagination detection for staff directories.
+
+Directory listings spread their people over numbered pages (?page=2, ?start=20,
+/page/3/) or letter tabs (?letter=B). From the links on one directory page the
+detector works out which parameter selects the page and enumerates the whole
+set, so the crawler can fetch every page of the listing at once instead of
+finding them one link (and one depth level) at a time.
+"""
+
+import math
+import re
+import string
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from config import (
+    PAGINATION_PAGE_PARAMS,
+    PAGINATION_OFFSET_PARAMS,
+    PAGINATION_LETTER_PARAMS,
+    MAX_PAGINATION_PAGES,
+)
+
+_KIND_BY_PARAM = {
+    **{p.lower(): "page" for p in PAGINATION_PAGE_PARAMS},
+    **{p.lower(): "offset" for p in PAGINATION_OFFSET_PARAMS},
+    **{p.lower(): "letter" for p in PAGINATION_LETTER_PARAMS},
+}
+
+# Value the unparameterized first page stands for. Page parameters are 0-based
+# on some sites (Drupal: the bare URL is page 0 and ?page=1 the second page) and
+# 1-based on others, so for them it is only known once page 0 is linked; until
+# then every page keeps its parameter (see _first_value()). Path-style pages
+# ("/page/2/") are 1-based: "/page/1/" redirects to the bare listing.
+_FIRST_VALUE = {"offset": 0, "path page": 1}
+
+# Path-style pagination: "/people/page/3/", "/mitarbeiter/seite/2", "/staff/letter/b"
+_PATH_PAGE_RE = re.compile(r"^(?P<prefix>.*/(?:page|seite|pagina))/(?P<value>\d+)/?$", re.IGNORECASE)
+_PATH_LETTER_RE = re.compile(r"^(?P<prefix>.*/(?:letter|buchstabe|initial|a-z|az))/(?P<value>[a-z])/?$", re.IGNORECASE)
+
+
+class _Family:
+    """Links that differ from the directory page only in one pagination parameter."""
+
+    def __init__(self, kind: str, template, param: str = ""):
+        self.kind = kind
+        self.template = template  # parsed URL of one member, used to build the others
+        self.param = param  # query parameter name as written on the site ("" for path style)
+        self.values = set()
+        self.first = None  # value addressed without the parameter (None: every page has it)
+
+    def url_for(self, value) -> str:
+        # The first page is addressed without the parameter, as the directory's own link does
+        first = self.first is not None and value == self.first
+        if self.param:
+            query = [(k, str(value) if k == self.param else v)
+                     for k, v in parse_qsl(self.template.query, keep_blank_values=True)
+                     if not (first and k == self.param)]
+            return urlunparse(self.template._replace(query=urlencode(query), fragment=""))
+        prefix = (_PATH_PAGE_RE if self.kind == "page" else _PATH_LETTER_RE).match(self.template.path).group("prefix")
+        if first:
+            return urlunparse(self.template._replace(path=prefix.rsplit("/", 1)[0] + "/", fragment=""))
+        trailing = "/" if self.template.path.endswith("/") else ""
+        return urlunparse(self.template._replace(path=f"{prefix}/{value}{trailing}", fragment=""))
+
+
+def _first_value(kind: str, style: str, values) -> Optional[object]:
+    """Value of the unparameterized page for a family with these values (None if unknown)."""
+    if kind == "page" and (style == "query" or 0 in values):
+        return 0 if 0 in values else None
+    return _FIRST_VALUE.get(f"path {kind}" if style == "path" else kind)
+
+
+def _parse_value(kind: str, raw: str):
+    if kind == "letter":
+        return raw if len(raw) == 1 and raw in string.ascii_letters else None
+    return int(raw) if raw.isdigit() else None
+
+
+def _rest_of_query(pairs, param: str) -> list:
+    return sorted((k, v) for k, v in pairs if k != param)
+
+
+def _enumerate(family: _Family, own_value) -> List:
+    """All values of a family, or [] when the links do not look like a pagination widget."""
+    values = set(family.values)
+    if own_value is not None:
+        values.add(own_value)
+    if family.kind == "letter":
+        if len({v.lower() for v in values}) < 3:
+            return []
+        letters = string.ascii_uppercase if any(v.isupper() for v in values) else string.ascii_lowercase
+        return list(letters)
+
+    ordered = sorted(values)
+    if family.kind == "page":
+        # A page widget always links the neighbouring page; IDs that merely share the
+        # parameter name (WordPress ?p=123) do not form a consecutive pair
+        if not any(b - a == 1 for a, b in zip(ordered, ordered[1:])):
+            return []
+        return list(range(min(ordered[0], 1), ordered[-1] + 1))
+    step = 0
+    for a, b in zip(ordered, ordered[1:]):
+        step = math.gcd(step, b - a)
+    if step <= 1:
+        return []
+    return list(range(ordered[0] % step, ordered[-1] + step, step))
+
+
+def detect_pagination(page_url: str, hrefs: Iterable[str]) -> List[str]:
+    """
+    URLs of all other pages of the directory listing page_url belongs to.
+
+    hrefs are the page's link targets (relative or absolute). Page numbers and
+    offsets are enumerated from the first page to the highest one linked (so a
+    "last page" link yields the whole range); letter tabs expand to A-Z once at
+    least three letters are linked. At most MAX_PAGINATION_PAGES URLs are returned.
+    """
+    base = urlparse(page_url)
+    base_pairs = parse_qsl(base.query, keep_blank_values=True)
+    base_params = {k.lower(): k for k, _ in base_pairs}
+    families: Dict[tuple, _Family] = {}
+
+    for href in hrefs:
+        link = urlparse(urljoin(page_url, href))
+        if link.netloc != base.netloc:
+            continue
+
+        if link.path == base.path and link.query:
+            pairs = parse_qsl(link.query, keep_blank_values=True)
+            for k, raw in pairs:
+                kind = _KIND_BY_PARAM.get(k.lower())
+                if kind is None or _rest_of_query(pairs, k) != _rest_of_query(base_pairs, base_params.get(k.lower(), k)):
+                    continue
+                value = _parse_value(kind, raw)
+                if value is None:
+                    continue
+                family = families.setdefault(("query", k), _Family(kind, link, k))
+                family.values.add(value)
+            continue
+
+        if link.query != base.query:
+            continue
+        for kind, pattern in (("page", _PATH_PAGE_RE), ("letter", _PATH_LETTER_RE)):
+            match = pattern.match(link.path)
+            if not match:
+                continue
+            value = _parse_value(kind, match.group("value"))
+            prefix = match.group("prefix")
+            # The directory page itself is the prefix ("/people/") or another page of it
+            own = pattern.match(base.path)
+            if value is None or (base.path.rstrip("/") != prefix.rsplit("/", 1)[0] and
+                                 (own is None or own.group("prefix") != prefix)):
+                continue
+            families.setdefault(("path", prefix), _Family(kind, link)).values.add(value)
+
+    urls: List[str] = []
+    seen = {urlunparse(base._replace(fragment=""))}
+    for (style, key), family in families.items():
+        own_value = None
+        if style == "query":
+            raw = dict(base_pairs).get(key)
+            own_value = _parse_value(family.kind, raw) if raw is not None else None
+        else:
+            own = (_PATH_PAGE_RE if family.kind == "page" else _PATH_LETTER_RE).match(base.path)
+            if own and own.group("prefix") == key:
+                own_value = _parse_value(family.kind, own.group("value"))
+        family.first = _first_value(family.kind, style, family.values | ({own_value} if own_value is not None else set()))
+        if own_value is None:
+            own_value = family.first  # the unparameterized page (None: its page number is not known)
+        for value in _enumerate(family, own_value):
+            if own_value is not None and value == own_value:
+                continue
+            url = family.url_for(value)  # URLs equal to the page's own are in `seen`
+            if url not in seen:
+                seen.add(url)
+                urls.append(url)
+            if len(urls) >= MAX_PAGINATION_PAGES:
+                return urls
+    return urls
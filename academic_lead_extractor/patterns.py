@@ -0,0 +1,137 @@
+"""
+Compiled regular expressions used by the scraper's extraction and cleaning paths.
+
+Patterns are compiled once at import instead of going through the ``re``
+module cache on every call. Where only the first or any match matters, the
+former per-pattern loops are merged into a single alternation; pattern lists
+whose matches are all collected (obfuscated email forms) stay separate so the
+results and their order do not change.
+"""
+
+import re
+
+from config import EMAIL_OBFUSCATION_PATTERNS, EMAIL_REGEX
+
+# ---------------------------
+# EMAIL CLEANING
+# ---------------------------
+
+# Spam-protection phrases inserted into addresses
+SPAM_PHRASE_RE = re.compile(r'does-not-exist\.?|no-spam\.?|remove-this\.?', re.IGNORECASE)
+
+# All EMAIL_OBFUSCATION_PATTERNS in one pass; the matching group's index selects the replacement
+OBFUSCATION_REPLACEMENTS = list(EMAIL_OBFUSCATION_PATTERNS.values())
+OBFUSCATION_RE = re.compile(
+    "|".join(f"(?P<o{i}>{pattern})" for i, pattern in enumerate(EMAIL_OBFUSCATION_PATTERNS)),
+    re.IGNORECASE
+)
+
+
+def deobfuscate(text: str) -> str:
+    """Replace [at], (at), ∂, dot, ... markers with '@' and '.' in a single pass."""
+    return OBFUSCATION_RE.sub(lambda m: OBFUSCATION_REPLACEMENTS[int(m.lastgroup[1:])], text)
+
+
+EDGE_DOTS_RE = re.compile(r'^\.+|\.+$')
+EMAIL_RE = re.compile(EMAIL_REGEX, re.IGNORECASE)
+
+# Obfuscated addresses inside link text, table cells and person cards ("first last ∂ kit edu")
+OBFUSCATED_EMAIL_IN_NODE_RES = [
+    re.compile(r'([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)\s*∂\s*(?:does-not-exist\.)?\s*([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)', re.IGNORECASE),
+    re.compile(r'([a-zA-Z.]+)\s*\[at\]\s*([a-zA-Z.]+)', re.IGNORECASE),
+    re.compile(r'([a-zA-Z.]+)\s*\(at\)\s*([a-zA-Z.]+)', re.IGNORECASE),
+]
+OBFUSCATED_EMAIL_IN_LINK_RES = [
+    re.compile(r'([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)\s*∂\s*([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)', re.IGNORECASE),
+    OBFUSCATED_EMAIL_IN_NODE_RES[1],
+    OBFUSCATED_EMAIL_IN_NODE_RES[2],
+]
+OBFUSCATED_EMAIL_IN_PAGE_RES = [
+    re.compile(r'([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*∂\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)?)', re.IGNORECASE),
+    OBFUSCATED_EMAIL_IN_NODE_RES[1],
+    OBFUSCATED_EMAIL_IN_NODE_RES[2],
+]
+
+# ---------------------------
+# NAMES AND TITLES
+# ---------------------------
+
+# Academic title prefixes, longest forms first; the first alternative that matches wins,
+# exactly like trying the former pattern list in order
+ACADEMIC_TITLE_RE = re.compile(
+    r'^(?P<title>'
+    r'Prof\.\s*Dr\.-Ing\.|Professor\s*Dr\.-Ing\.'
+    r'|Prof\.\s*Dr\.|Professor\s*Dr\.'
+    r'|Dr\.-Ing\.|Dr\.\s*Ing\.'
+    r'|Dr\.\s*rer\.\s*nat\.|Dr\.\s*rer\.nat\.'
+    r'|Dr\.\s*phil\.'
+    r'|M\.Sc\.|M\.S\.|MSc'
+    r'|B\.Sc\.|B\.S\.|BSc'
+    r'|Dipl\.-Ing\.|Diplom-Ingenieur'
+    r'|Prof\.'
+    r'|Dr\.'
+    r'|Professor'
+    r'|PhD'
+    r')(?:\s+|,\s*|$)',
+    re.IGNORECASE
+)
+
+# Table row / text snippet containing a "Firstname Lastname"
+NAME_LIKE_RE = re.compile(r'\b[A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß]+)+\b')
+# Name next to a mailto link (2-4 capitalized words)
+LOCAL_NAME_RE = re.compile(r"([A-ZÄÖÜ][a-zäöüß\-']+(?:[\s,]+[A-ZÄÖÜ][a-zäöüß\-']+){1,3})")
+DIGIT_RE = re.compile(r'\d')
+
+# Page-level fallback: block relevance hint, name and title patterns
+FALLBACK_BLOCK_HINT_RE = re.compile(r"\bprof|research|lectur|wissenschaft|ingenieur|engineer|group|chair", re.IGNORECASE)
+FALLBACK_NAME_RE = re.compile(r"([A-ZÄÖÜ][a-zäöüß]+(?:[-\s][A-ZÄÖÜ][a-zäöüß]+){1,3})")
+FALLBACK_TITLE_RE = re.compile(
+    r"(Professor|Prof\.|Dr\.|Lecturer|Research(?:er| Associate| Fellow)|Wissenschaft(?:ler|liche)|Ingenieur|Engineer|Head|Leader)[^.,\n]{0,120}",
+    re.IGNORECASE
+)
+
+# ---------------------------
+# PAGE TEXT AND URLS
+# ---------------------------
+
+# Navigation/footer boilerplate removed from page text. The lookahead on the first
+# letters lets the engine skip most positions without trying every alternative.
+PAGE_NOISE_RE = re.compile(
+    r'(?=[CcPpTtAa])(?:'
+    r'Cookie\s+(?:Policy|Notice|Settings)'
+    r'|Privacy\s+Policy'
+    r'|Terms\s+(?:of\s+)?(?:Service|Use)'
+    r'|Copyright\s+©'
+    r'|All\s+rights\s+reserved'
+    r')',
+    re.IGNORECASE
+)
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Complete directory rows in streamed HTML (nested rows of the same tag are not supported)
+DIRECTORY_ROW_RES = {
+    "tr": re.compile(r"<tr\b.*?</tr\s*>", re.IGNORECASE | re.DOTALL),
+    "li": re.compile(r"<li\b.*?</li\s*>", re.IGNORECASE | re.DOTALL),
+}
+# Link targets in streamed HTML that is never parsed as a whole
+ANCHOR_HREF_RE = re.compile(r"""<a\s[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+# Individual profile pages: ".../123/john-smith"
+PROFILE_ID_URL_RE = re.compile(r'/\d+/[\w-]+(?:-[\w-]+)*/?$', re.IGNORECASE)
+# Individual profile pages: "/profile/john-smith", "/~user", localized variants
+PROFILE_URL_RE = re.compile(
+    r'/(?:profile|staff|people|faculty|researcher|professor'
+    r'|mitarbeiter|personen'          # German
+    r'|personnel|chercheur'           # French
+    r'|personale|ricercatore'         # Italian
+    r'|investigador|profesor'         # Spanish
+    r')/[\w-]+/?$'
+    r'|/~[\w-]+/?$',                  # Unix-style home directories
+    re.IGNORECASE
+)
+# Page titles starting with a person's name followed by a separator ("John Smith | MIT").
+# Uppercase: A-Z, À-Ž, А-Я, Α-Ω (Latin, Latin Extended, Cyrillic, Greek); lowercase likewise.
+# (The former title-less variant only matched a subset of these titles.)
+PROFILE_TITLE_RE = re.compile(
+    r'^(?:Prof\.?|Dr\.?|Professor|Doctor|Assoc\.?|Assistant)?\s*[A-ZÀ-ŽА-ЯΑ-Ω][a-zà-žа-яα-ω]+(?:\s+[A-ZÀ-ŽА-ЯΑ-Ω][a-zà-žа-яα-ω]+){1,3}\s*[|\-–—,]'
+)
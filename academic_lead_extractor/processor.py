@@ -5,22 +5,39 @@ Main pipeline for processing universities and extracting contacts.
 import asyncio
 import os
 import time
-import json
-import pandas as pd
 import aiohttp
 from aiohttp import ClientSession
-from tqdm import tqdm
-from collections import defaultdict
 from urllib.parse import urlparse
 
-from config import UNI_PARALLEL, HEADERS
-from academic_lead_extractor.scraper import process_university
+from config import UNI_PARALLEL, HEADERS, DEBUG
+from academic_lead_extractor.scraper import process_university, FIELD_MEMO
+from academic_lead_extractor.page_dedup import DEDUP_TOTALS
+from academic_lead_extractor.crawl_budget import RunBudget
 from academic_lead_extractor.ai_evaluator import ai_evaluate_contacts
 from academic_lead_extractor.enrichment import enrich_publications
+from academic_lead_extractor.export import ResultsWriter
+from academic_lead_extractor.run_state import RunStateStore
+from academic_lead_extractor.lead_store import LeadStore
+from academic_lead_extractor import metrics
+from academic_lead_extractor.profiling import SamplingProfiler
+from academic_lead_extractor.dashboard import StatusBoard
+from academic_lead_extractor.log import get_logger
+
+log = get_logger("pipeline")
+
+
+async def _scrape_university(session, uni: dict, pbar, *args, **kwargs):
+    """process_university() tagged with the university; returns (contacts, its own wall time)."""
+    start = time.perf_counter()
+    with metrics.tags(university=uni.get("name", "Unknown")), metrics.span("university"):
+        contacts = await process_university(session, uni, pbar, *args, **kwargs)
+    return contacts, time.perf_counter() - start
 
 
 async def main(university_urls=None, use_ai=True, client=None, ai_model="gpt-4o-mini",
-               ai_batch_size=20, ai_min_score=0.5, use_ai_profile_detection=False):
+               ai_batch_size=20, ai_min_score=0.5, use_ai_profile_detection=False, columnar_format=None,
+               incremental=False, store_path=None, otlp_endpoint=None, profile=False,
+               status_port=None):
     """Main pipeline for academic lead extraction."""
     # Validate AI score threshold
     if not 0.0 <= ai_min_score <= 1.0:
@@ -42,210 +59,278 @@ async def main(university_urls=None, use_ai=True, client=None, ai_model="gpt-4o-
                 "url": url
             })
         
-        print(f"\n🎯 Processing {len(universities)} custom URL(s)")
-        print(f"🔍 URLs: {', '.join(university_urls[:3])}{'...' if len(university_urls) > 3 else ''}")
+        log.info(f"\n🎯 Processing {len(universities)} custom URL(s)")
+        log.info(f"🔍 URLs: {', '.join(university_urls[:3])}{'...' if len(university_urls) > 3 else ''}")
     else:
         # Load from universities.csv
         if not os.path.exists("universities.csv"):
-            print("❌ Error: universities.csv not found!")
-            print("   Please provide either:")
-            print("   1. universities.csv file in current directory")
-            print("   2. Custom URLs using --urls argument")
+            log.warning("❌ Error: universities.csv not found!")
+            log.warning("   Please provide either:")
+            log.warning("   1. universities.csv file in current directory")
+            log.warning("   2. Custom URLs using --urls argument")
             return
         
+        import pandas as pd  # loaded here: single-URL runs don't need it
         df = pd.read_csv("universities.csv")
         universities = [
             {"country": row.Country, "name": row.University, "url": row.Website}
             for _, row in df.iterrows() if pd.notna(row.Website)
         ]
         
-        print(f"\n🎯 Loaded {len(universities)} universities from universities.csv")
-    
-    print(f"🔍 Exploration: Aggressive (subdomains + departments)")
-    
-    # STEP 1: Scrape all contacts (V2 logic)
-    all_contacts = []
-    university_times = {}  # Track time per university
-    total_scraping_time = 0
-    
-    # Create session with proper SSL handling and connector
-    connector = aiohttp.TCPConnector(ssl=False, limit=100)
-    timeout = aiohttp.ClientTimeout(total=30, connect=10)
-    scraping_start = time.time()
-    
-    async with ClientSession(connector=connector, headers=HEADERS, timeout=timeout) as session:
-        with tqdm(total=len(universities), desc="🔍 Scanning universities") as pbar:
-            for i in range(0, len(universities), UNI_PARALLEL):
-                batch = universities[i:i + UNI_PARALLEL]
-                # Track time for each university in batch
-                batch_start = time.time()
-                
-                # Pass AI parameters for link discovery and profile detection
-                tasks = [process_university(session, uni, pbar, use_ai, client, ai_model, use_ai_profile_detection) for uni in batch]
-                results = await asyncio.gather(*tasks)
-                
-                batch_elapsed = time.time() - batch_start
-                
-                # Assign time to each university in batch (approximation for parallel execution)
-                for uni, contacts in zip(batch, results):
-                    uni_name = uni.get("name", "Unknown")
-                    university_times[uni_name] = {
-                        "time": batch_elapsed / len(batch),  # Approximate time per uni
-                        "contacts": len(contacts)
-                    }
-                    all_contacts.extend(contacts)
-    
-    total_scraping_time = time.time() - scraping_start
-    
-    print(f"\n✅ Extracted {len(all_contacts)} raw contacts")
-    print(f"⏱️  Scraping time: {total_scraping_time:.1f}s ({total_scraping_time/60:.1f}min)")
+        log.info(f"\n🎯 Loaded {len(universities)} universities from universities.csv")
     
-    # Display per-university timing
-    if university_times:
-        print(f"\n📊 Per-University Extraction Times:")
-        sorted_unis = sorted(university_times.items(), key=lambda x: x[1]["time"], reverse=True)
-        for uni_name, stats in sorted_unis[:10]:  # Show top 10 slowest
-            print(f"   {uni_name:40s}: {stats['time']:6.1f}s → {stats['contacts']} contacts")
-        if len(sorted_unis) > 10:
-            print(f"   ... and {len(sorted_unis) - 10} more universities")
-    
-    # STEP 2: AI evaluation (V3 logic)
-    ai_start = time.time()
-    evaluated_contacts, token_stats = await ai_evaluate_contacts(
-        all_contacts, use_ai, client, ai_model, ai_batch_size, ai_min_score
-    )
-    ai_time = time.time() - ai_start
-    
-    # STEP 3: Filter by score
-    if use_ai:
-        final_contacts = [c for c in evaluated_contacts if c.get("AI_Score", 0) >= ai_min_score]
-        print(f"✅ {len(final_contacts)} contacts passed AI threshold ({ai_min_score})")
-        print(f"⏱️  AI evaluation time: {ai_time:.1f}s ({ai_time/60:.1f}min)")
+    # Cross-run state (--incremental only): unchanged staff pages are skipped; saved once at the end of the run
+    run_state = RunStateStore() if incremental else None
+    if incremental:
+        known = sum(1 for uni in universities if run_state.get(uni["url"]))
+        log.info(f"♻️  Incremental mode: {known}/{len(universities)} universities known from previous runs "
+                 f"(only their staff pages are re-checked)")
     else:
-        final_contacts = evaluated_contacts
+        log.info(f"🔍 Exploration: Aggressive (subdomains + departments)")
     
-    # STEP 4: Enrich with publications (Crossref API)
-    if final_contacts:
-        print(f"📚 Enriching {len(final_contacts)} contacts with publications...")
-        async with ClientSession() as session:
-            enrichment_tasks = [enrich_publications(session, contact) for contact in final_contacts]
-            final_contacts = await asyncio.gather(*enrichment_tasks)
-        
-        pub_count = sum(1 for c in final_contacts if c.get("Publications") and len(c["Publications"]) > 0)
-        print(f"✅ Found publications for {pub_count}/{len(final_contacts)} contacts")
+    # Results are appended per country as soon as each batch of universities is done
+    output_dir = "results"
+    try:
+        results_writer = ResultsWriter(output_dir, columnar_format)
+    except ImportError:
+        log.warning(f"⚠️  Columnar export ({columnar_format}) needs pyarrow: pip install pyarrow")
+        log.warning("    Continuing with CSV/JSON output only...")
+        columnar_format = None
+        results_writer = ResultsWriter(output_dir)
     
-    # STEP 5: Save by country
-    by_country = defaultdict(list)
-    for c in final_contacts:
-        by_country[c["Country"]].append(c)
+    # Optional SQLite history: leads upserted by email, one transaction per batch
+    lead_store = LeadStore(store_path) if store_path else None
     
-    output_dir = "results"
-    os.makedirs(output_dir, exist_ok=True)
+    # Optional sampling profiler over crawl, AI, enrichment and export
+    profiler = SamplingProfiler().start() if profile else None
     
-    total_saved = 0
-    for country, contacts in by_country.items():
-        # Normalize column name BEFORE creating DataFrame (scraper uses source_url, but we want Source_URL in output)
-        for contact in contacts:
-            if "source_url" in contact and "Source_URL" not in contact:
-                contact["Source_URL"] = contact["source_url"]
-        
-        # Keep original contacts for JSON (with Publications as list)
-        original_contacts = [c.copy() for c in contacts]
+    # Live status: a log line every STATUS_LOG_INTERVAL seconds, and a local status page with --status
+    status_board = StatusBoard(len(universities), status_port).start()
+    try:
+        # Page/time budget of the whole run, shared by the per-university crawl budgets
+        run_budget = RunBudget(len(universities))
         
-        df = pd.DataFrame(contacts)
+        university_times = {}  # Track time per university
+        total_scraping_time = 0
+        ai_time = 0
+        raw_count = 0
+        passed_count = 0
+        pub_count = 0
+        token_stats = {
+            "total_tokens": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "estimated_cost": 0.0
+        }
         
-        # Smart deduplication: Keep contact with highest AI_Score for each email
-        before_dedup = len(df)
-        if "AI_Score" in df.columns:
-            # Sort by AI_Score descending, then deduplicate (keeps first = highest score)
-            df = df.sort_values('AI_Score', ascending=False)
-        df = df.drop_duplicates(subset=["Email"], keep="first")
-        after_dedup = len(df)
+        # Create session with proper SSL handling and connector
+        connector = aiohttp.TCPConnector(ssl=False, limit=100)
+        timeout = aiohttp.ClientTimeout(total=30, connect=10)
         
-        # Report duplicates removed
-        if before_dedup > after_dedup:
-            print(f"   📧 Removed {before_dedup - after_dedup} duplicate emails (kept highest AI scores)")
+        from tqdm import tqdm
         
-        # Get deduplicated emails for JSON export
-        deduplicated_emails = set(df["Email"].tolist())
+        async with ClientSession(connector=connector, headers=HEADERS, timeout=timeout) as session, \
+                ClientSession() as enrichment_session:
+            with tqdm(total=len(universities), desc="🔍 Scanning universities") as pbar:
+                for i in range(0, len(universities), UNI_PARALLEL):
+                    batch = universities[i:i + UNI_PARALLEL]
+                    # Run deadline or page budget used up: the remaining universities are not started
+                    stop_reason = run_budget.exhausted()
+                    if stop_reason:
+                        skipped = len(universities) - i
+                        metrics.inc("universities_skipped_total", skipped, reason=stop_reason)
+                        log.warning(f"\n⏰ {stop_reason} reached: {skipped} universities not crawled")
+                        break
+                    # Track time for each university in batch
+                    batch_start = time.time()
+                    
+                    # STEP 1: Scrape contacts (V2 logic)
+                    # Pass AI parameters for link discovery and profile detection
+                    tasks = [_scrape_university(session, uni, pbar, use_ai, client, ai_model, use_ai_profile_detection,
+                                                run_state=run_state, incremental=incremental, run_budget=run_budget)
+                             for uni in batch]
+                    results = await asyncio.gather(*tasks)
+                    
+                    batch_elapsed = time.time() - batch_start
+                    total_scraping_time += batch_elapsed
+                    
+                    batch_contacts = []
+                    for uni, (contacts, elapsed) in zip(batch, results):
+                        uni_name = uni.get("name", "Unknown")
+                        university_times[uni_name] = {
+                            "time": elapsed,
+                            "contacts": len(contacts)
+                        }
+                        batch_contacts.extend(contacts)
+                    raw_count += len(batch_contacts)
+                    
+                    if not batch_contacts:
+                        if lead_store:
+                            lead_store.write(batch, [])
+                        continue
+                    
+                    # STEP 2: AI evaluation (V3 logic)
+                    ai_start = time.time()
+                    with metrics.span("ai_evaluation"):
+                        evaluated_contacts, batch_tokens = await ai_evaluate_contacts(
+                            batch_contacts, use_ai, client, ai_model, ai_batch_size, ai_min_score
+                        )
+                    ai_time += time.time() - ai_start
+                    metrics.inc("contacts_scored_total", len(batch_contacts))
+                    for key in token_stats:
+                        token_stats[key] += batch_tokens[key]
+                    
+                    # STEP 3: Filter by score
+                    if use_ai:
+                        final_contacts = [c for c in evaluated_contacts if c.AI_Score >= ai_min_score]
+                    else:
+                        final_contacts = evaluated_contacts
+                    passed_count += len(final_contacts)
+                    
+                    # STEP 4: Enrich with publications (Crossref API)
+                    if final_contacts:
+                        with metrics.span("enrichment_batch"):
+                            enrichment_tasks = [enrich_publications(enrichment_session, contact) for contact in final_contacts]
+                            final_contacts = await asyncio.gather(*enrichment_tasks)
+                        metrics.inc("contacts_enriched_total", len(final_contacts))
+                        pub_count += sum(1 for c in final_contacts if c.Publications)
+                    
+                    # STEP 5: Append to results/<country>.csv and .jsonl right away
+                    with metrics.span("export"):
+                        results_writer.write(final_contacts)
+                        if lead_store:
+                            lead_store.write(batch, final_contacts)
+                    metrics.inc("contacts_exported_total", len(final_contacts))
         
-        # Filter original contacts to match deduplicated set (keep Publications as list)
-        json_contacts = []
-        seen_emails = set()
-        # Sort by AI_Score to keep highest scoring duplicates (same logic as CSV)
-        sorted_originals = sorted(original_contacts, key=lambda x: x.get("AI_Score", 0), reverse=True)
-        for contact in sorted_originals:
-            email = contact.get("Email", "")
-            if email in deduplicated_emails and email not in seen_emails:
-                seen_emails.add(email)
-                # Clean up internal fields not needed in export
-                export_contact = {k: v for k, v in contact.items() if k not in ["page_text"]}
-                # Ensure Publications is a list (not string)
-                if "Publications" in export_contact and isinstance(export_contact["Publications"], str):
-                    export_contact["Publications"] = [p.strip() for p in export_contact["Publications"].split(",") if p.strip()]
-                json_contacts.append(export_contact)
+        if run_state is not None:
+            run_state.save()
         
-        # Format Publications as comma-separated string for CSV readability only
-        if "Publications" in df.columns:
-            df["Publications"] = df["Publications"].apply(lambda x: ", ".join(x) if isinstance(x, list) and x else "")
+        log.info(f"\n✅ Extracted {raw_count} raw contacts")
+        log.info(f"⏱️  Scraping time: {total_scraping_time:.1f}s ({total_scraping_time/60:.1f}min)")
         
-        columns = [
-            "Full_name", "Email", "Title", "Role", "Field_of_study",
-            "Country", "University", "University_Website_URL", "University_Field_of_Study",
-            "Source_URL", "AI_Field", "AI_Score", "AI_Reason", "Publications"
-        ]
+        # Display per-university timing
+        if university_times:
+            log.info(f"\n📊 Per-University Extraction Times:")
+            sorted_unis = sorted(university_times.items(), key=lambda x: x[1]["time"], reverse=True)
+            for uni_name, stats in sorted_unis[:10]:  # Show top 10 slowest
+                log.info(f"   {uni_name:40s}: {stats['time']:6.1f}s → {stats['contacts']} contacts")
+            if len(sorted_unis) > 10:
+                log.info(f"   ... and {len(sorted_unis) - 10} more universities")
         
-        # Ensure all expected columns exist (add empty columns if missing)
-        for col in columns:
-            if col not in df.columns:
-                df[col] = ""
+        if use_ai:
+            log.info(f"✅ {passed_count} contacts passed AI threshold ({ai_min_score})")
+            log.info(f"⏱️  AI evaluation time: {ai_time:.1f}s ({ai_time/60:.1f}min)")
+        if passed_count:
+            log.info(f"✅ Found publications for {pub_count}/{passed_count} contacts")
         
-        # Save CSV
-        csv_filename = os.path.join(output_dir, f"{country}.csv")
-        df.to_csv(csv_filename, sep=";", index=False, columns=columns)
+        # Merge the per-country JSON Lines files into the structured JSON exports
+        total_saved = 0
+        with metrics.span("export_finalize"):
+            finalized = results_writer.finalize()
+        for country, saved in finalized.items():
+            writer = results_writer.writers[country]
+            if writer.duplicates_removed:
+                log.info(f"   📧 Removed {writer.duplicates_removed} duplicate emails (kept highest AI scores)")
+            log.info(f"✅ {country}: {saved} contacts → {writer.csv_path}")
+            log.info(f"   📄 JSON: {writer.json_path}")
+            total_saved += saved
         
-        # Save JSON with structured data
-        json_filename = os.path.join(output_dir, f"{country}.json")
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                "country": country,
-                "extraction_date": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "total_contacts": len(json_contacts),
-                "contacts": json_contacts
-            }, f, indent=2, ensure_ascii=False)
+        if run_state is not None and run_state.diffs:
+            diff_filename = os.path.join(output_dir, "changes.json")
+            totals = run_state.write_diff(diff_filename)
+            log.info(f"🔄 Changes vs. previous run: +{totals['added']} added, -{totals['removed']} removed, "
+                     f"~{totals['changed']} changed → {diff_filename}")
         
-        print(f"✅ {country}: {len(df)} contacts → {csv_filename}")
-        print(f"   📄 JSON: {json_filename}")
-        total_saved += len(df)
+        if lead_store:
+            stored = lead_store.count()
+            log.info(f"🗄️  Lead store: {stored} contacts (+{stored - lead_store.contacts_at_start} new) → {lead_store.path}")
+            lead_store.close()
+    finally:
+        # Also when the run fails or is interrupted: stop the sampling threads and free the --status port
+        status_board.stop()
+        if profiler:
+            profiler.stop()
     
     # Calculate total pipeline time
     total_pipeline_time = total_scraping_time + ai_time
     
-    print(f"\n🎉 TOTAL: {total_saved} contacts across {len(by_country)} countries")
-    print(f"💾 Results saved to: {output_dir}/")
-    print(f"   📊 Format: CSV (semicolon-separated) + JSON (structured data)")
+    log.info(f"\n🎉 TOTAL: {total_saved} contacts across {len(results_writer.writers)} countries")
+    log.info(f"💾 Results saved to: {output_dir}/")
+    log.info(f"   📊 Format: CSV (semicolon-separated) + JSON (structured data) + JSONL (incremental)")
+    if columnar_format:
+        log.info(f"   🗂️  Columnar dataset ({columnar_format}): {results_writer.columnar.base_dir}/ (partitioned by Country/University)")
     
     # Final summary with timing and costs
-    print(f"\n" + "="*70)
-    print(f"📈 EXTRACTION SUMMARY")
-    print(f"="*70)
-    print(f"🎯 Universities processed:     {len(universities)}")
-    print(f"📧 Total contacts extracted:   {len(all_contacts)}")
-    print(f"✅ Contacts after filtering:   {total_saved}")
-    print(f"\n⏱️  TIMING BREAKDOWN:")
-    print(f"   Scraping time:              {total_scraping_time:.1f}s ({total_scraping_time/60:.1f}min)")
-    print(f"   AI evaluation time:         {ai_time:.1f}s ({ai_time/60:.1f}min)")
-    print(f"   Total pipeline time:        {total_pipeline_time:.1f}s ({total_pipeline_time/60:.1f}min)")
-    print(f"   Avg time per university:    {total_scraping_time/len(universities):.1f}s")
+    log.info(f"\n" + "="*70)
+    log.info(f"📈 EXTRACTION SUMMARY")
+    log.info(f"="*70)
+    log.info(f"🎯 Universities processed:     {len(universities)}")
+    log.info(f"📧 Total contacts extracted:   {raw_count}")
+    log.info(f"✅ Contacts after filtering:   {total_saved}")
+    if DEDUP_TOTALS.url_variants or DEDUP_TOTALS.near_duplicates:
+        log.info(f"♊ Duplicate pages skipped:    {DEDUP_TOTALS.url_variants} URL variants not fetched, "
+                 f"{DEDUP_TOTALS.near_duplicates} near-duplicates not recorded "
+                 f"({DEDUP_TOTALS.contacts_skipped} contacts)")
+    incomplete = metrics.METRICS.total("crawls_incomplete_total")
+    skipped = metrics.METRICS.total("universities_skipped_total")
+    if incomplete or skipped:
+        timeouts = incomplete - metrics.METRICS.total("crawls_incomplete_total", reason="error")
+        log.info(f"⏰ Incomplete crawls:         {timeouts:.0f} cancelled at a deadline, "
+                 f"{incomplete - timeouts:.0f} failed (contacts found until then kept), {skipped:.0f} not started")
+    narrowed = metrics.METRICS.total("crawl_budget_narrowed_total")
+    extended = metrics.METRICS.total("crawl_budget_extensions_total")
+    if narrowed or extended or run_budget.exhausted():
+        line = (f"✂️  Crawl budget:             {run_budget.pages:,} pages; {narrowed:.0f} crawls narrowed (low yield), "
+                f"{extended:.0f} budget extensions")
+        if run_budget.exhausted():
+            line += f"; {run_budget.exhausted()} used up"
+        log.info(line)
+    log.info(f"\n⏱️  TIMING BREAKDOWN:")
+    log.info(f"   Scraping time:              {total_scraping_time:.1f}s ({total_scraping_time/60:.1f}min)")
+    log.info(f"   AI evaluation time:         {ai_time:.1f}s ({ai_time/60:.1f}min)")
+    log.info(f"   Total pipeline time:        {total_pipeline_time:.1f}s ({total_pipeline_time/60:.1f}min)")
+    log.info(f"   Avg time per university:    {total_scraping_time/len(universities):.1f}s")
+    if DEBUG and FIELD_MEMO.hits + FIELD_MEMO.misses:
+        log.debug(f"   Field classification cache: {FIELD_MEMO.hit_rate:.0%} hits "
+                  f"({FIELD_MEMO.hits:,} hits / {FIELD_MEMO.misses:,} misses)")
     
     if use_ai and token_stats["total_tokens"] > 0:
-        print(f"\n💰 AI TOKEN USAGE & COST:")
-        print(f"   Input tokens:               {token_stats['input_tokens']:,}")
-        print(f"   Output tokens:              {token_stats['output_tokens']:,}")
-        print(f"   Total tokens:               {token_stats['total_tokens']:,}")
-        print(f"   Estimated cost:             ${token_stats['estimated_cost']:.4f} USD")
-        print(f"   Model used:                 {ai_model}")
-        print(f"   Cost per contact:           ${token_stats['estimated_cost']/max(1, total_saved):.4f}")
+        log.info(f"\n💰 AI TOKEN USAGE & COST:")
+        log.info(f"   Input tokens:               {token_stats['input_tokens']:,}")
+        log.info(f"   Output tokens:              {token_stats['output_tokens']:,}")
+        log.info(f"   Total tokens:               {token_stats['total_tokens']:,}")
+        log.info(f"   Estimated cost:             ${token_stats['estimated_cost']:.4f} USD")
+        log.info(f"   Model used:                 {ai_model}")
+        log.info(f"   Cost per contact:           ${token_stats['estimated_cost']/max(1, total_saved):.4f}")
+    
+    # Per-stage metrics: where the time actually went (spans nest, so stages overlap)
+    stages = metrics.METRICS.stage_totals()
+    if stages:
+        log.info(f"\n🔬 TIME BY STAGE (summed over spans):")
+        for stage, (count, seconds) in sorted(stages.items(), key=lambda x: x[1][1], reverse=True):
+            log.info(f"   {stage + ':':27s} {seconds:8.1f}s in {count:,} spans")
+    metrics.set_gauge("universities", len(universities))
+    metrics.set_gauge("contacts_raw", raw_count)
+    metrics.set_gauge("contacts_saved", total_saved)
+    metrics.set_gauge("ai_tokens", token_stats["total_tokens"])
+    json_path, prom_path = metrics.METRICS.export(output_dir)
+    log.info(f"📈 Metrics: {json_path} (with trace), {prom_path}")
+    if profiler:
+        folded_path, report_path = profiler.export(output_dir)
+        samples = profiler.stage_samples()
+        total = max(1, sum(samples.values()))
+        shares = ", ".join(f"{stage} {count / total:.0%}" for stage, count in
+                           sorted(samples.items(), key=lambda x: x[1], reverse=True))
+        log.info(f"🔥 Profile: {shares}")
+        log.info(f"   Top functions per stage: {report_path}; flamegraph: {folded_path} (speedscope.app or flamegraph.pl)")
+    if otlp_endpoint:
+        try:
+            sent = metrics.METRICS.export_otlp(otlp_endpoint)
+            log.info(f"📡 Sent {sent} spans to OpenTelemetry collector at {otlp_endpoint}")
+        except ImportError:
+            log.warning("⚠️  OpenTelemetry export needs: pip install opentelemetry-sdk opentelemetry-exporter-otlp-proto-http")
+        except Exception as e:
+            log.warning(f"⚠️  OpenTelemetry export failed: {e}")
     
-    print(f"="*70)
+    log.info(f"="*70)
 
@@ -0,0 +1,368 @@
+"""
+Record and replay of crawler HTTP traffic.
+
+    --record DIR   every response the crawler receives (URL, status, headers,
+                   body, or the network error) is saved to a corpus in DIR
+    --replay DIR   the crawler is served from that corpus in-process, without
+                   touching the network
+
+A corpus is a directory with index.jsonl (one response per line, in the order
+received) and bodies/<sha256>.gz (each distinct body stored once). A URL that
+was fetched several times (retries, conditional requests) is replayed in the
+same sequence, repeating its last response; URLs that were never recorded
+answer 404. benchmarks/bench_crawl.py measures the crawler on a corpus.
+
+Only the crawler sessions (StaffCrawler.crawl/refresh) go through here;
+publication enrichment and AI calls are neither recorded nor replayed.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+INDEX_FILE = "index.jsonl"
+BODIES_DIR = "bodies"
+
+# Response headers not worth storing
+_SKIPPED_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding", "content-length", "connection"}
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+_MODE = ""  # "", "record" or "replay"
+_CORPUS: Optional["Corpus"] = None
+
+
+@dataclass(slots=True)
+class ReplayStats:
+    """What replay sessions served from a corpus."""
+    requests: int = 0
+    misses: int = 0  # requests for URLs that were never recorded (answered 404)
+    bytes_served: int = 0
+
+
+class Corpus:
+    """Recorded responses on disk (see module docstring for the layout)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stats = ReplayStats()
+        self._index_file = None
+        self._bodies_written = set()
+        self._responses: Optional[Dict[str, List[dict]]] = None
+
+    # -- recording --
+
+    def record(self, url: str, status: int, headers: Dict[str, str], body: bytes = b"",
+               error: str = "", final_url: str = "", crawl: str = ""):
+        if self._index_file is None:
+            os.makedirs(os.path.join(self.path, BODIES_DIR), exist_ok=True)
+            self._index_file = open(os.path.join(self.path, INDEX_FILE), "a", encoding="utf-8")
+        digest = ""
+        if body:
+            digest = hashlib.sha256(body).hexdigest()
+            body_path = self._body_path(digest)
+            if digest not in self._bodies_written and not os.path.exists(body_path):
+                with open(body_path, "wb") as f:
+                    f.write(gzip.compress(body, compresslevel=6))
+            self._bodies_written.add(digest)
+        entry = {"url": url, "status": status, "headers": headers, "body": digest}
+        if final_url and final_url != url:
+            entry["final_url"] = final_url
+        if error:
+            entry["error"] = error
+        if crawl:
+            entry["crawl"] = crawl
+        self._index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._index_file.flush()  # a run killed halfway still leaves a usable corpus
+
+    def close(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    # -- reading --
+
+    def entries(self) -> List[dict]:
+        index_path = os.path.join(self.path, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return []
+        with open(index_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def responses(self) -> Dict[str, List[dict]]:
+        """Recorded responses per requested URL, in recording order (read once)."""
+        if self._responses is None:
+            self._responses = {}
+            for entry in self.entries():
+                self._responses.setdefault(entry["url"], []).append(entry)
+        return self._responses
+
+    def body(self, digest: str) -> bytes:
+        if not digest:
+            return b""
+        with open(self._body_path(digest), "rb") as f:
+            return gzip.decompress(f.read())
+
+    def html_pages(self):
+        """(url, decoded HTML) of every URL whose last recorded response is a 200 HTML page."""
+        for url, entries in self.responses().items():
+            entry = entries[-1]
+            headers = CIMultiDict(entry.get("headers", {}))
+            if entry["status"] == 200 and entry.get("body") and headers.get("Content-Type", "").startswith("text/html"):
+                yield url, self.body(entry["body"]).decode(_charset(headers) or "utf-8", errors="replace")
+
+    def start_urls(self) -> List[str]:
+        """Start URLs of the crawls recorded in this corpus, in recording order."""
+        return list(dict.fromkeys(e["crawl"] for e in self.entries() if e.get("crawl")))
+
+    def _body_path(self, digest: str) -> str:
+        return os.path.join(self.path, BODIES_DIR, f"{digest}.gz")
+
+
+def _request_url(url, params=None) -> str:
+    url = URL(str(url))
+    return str(url.update_query(params) if params else url)
+
+
+def _charset(headers) -> Optional[str]:
+    match = _CHARSET_RE.search(headers.get("Content-Type", ""))
+    return match.group(1) if match else None
+
+
+# -- recording --
+
+class _TeeStream:
+    """resp.content stand-in that keeps a copy of every chunk read."""
+
+    def __init__(self, stream, buffer: bytearray):
+        self._stream = stream
+        self._buffer = buffer
+
+    async def iter_chunked(self, n: int):
+        async for chunk in self._stream.iter_chunked(n):
+            self._buffer.extend(chunk)
+            yield chunk
+
+    async def read(self, n: int = -1) -> bytes:
+        data = await self._stream.read(n)
+        self._buffer.extend(data)
+        return data
+
+
+class _RecordingResponse:
+    """Proxy of an aiohttp response that copies the body as it is read."""
+
+    def __init__(self, resp: aiohttp.ClientResponse):
+        self._resp = resp
+        self.body = bytearray()
+        self.content = _TeeStream(resp.content, self.body)
+
+    def __getattr__(self, name):
+        return getattr(self._resp, name)
+
+    async def read(self) -> bytes:
+        data = await self._resp.read()
+        self.body[:] = data
+        return data
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        data = await self.read()
+        return data.decode(encoding or self._resp.get_encoding(), errors=errors)
+
+    async def json(self, **kwargs):
+        await self.read()
+        return await self._resp.json(**kwargs)
+
+
+class _RecordingRequest:
+    def __init__(self, session: "RecordingSession", url: str, kwargs: dict):
+        self._session = session
+        self._url = _request_url(url, kwargs.get("params"))
+        self._kwargs = kwargs
+        self._cm = None
+        self._resp: Optional[_RecordingResponse] = None
+
+    async def __aenter__(self) -> _RecordingResponse:
+        self._cm = self._session.session.get(self._url, **{k: v for k, v in self._kwargs.items() if k != "params"})
+        try:
+            self._resp = _RecordingResponse(await self._cm.__aenter__())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._session.corpus.record(self._url, 0, {}, error=type(e).__name__, crawl=self._session.crawl)
+            raise
+        return self._resp
+
+    async def __aexit__(self, exc_type, exc, tb):
+        resp = self._resp
+        headers = {k: v for k, v in resp.headers.items() if k.lower() not in _SKIPPED_HEADERS}
+        error = exc_type.__name__ if exc_type and issubclass(exc_type, (aiohttp.ClientError, asyncio.TimeoutError)) else ""
+        self._session.corpus.record(self._url, resp.status, headers, bytes(resp.body), error=error,
+                                    final_url=str(resp.url), crawl=self._session.crawl)
+        return await self._cm.__aexit__(exc_type, exc, tb)
+
+
+class RecordingSession:
+    """aiohttp.ClientSession wrapper that saves every GET response to a Corpus."""
+
+    def __init__(self, session: aiohttp.ClientSession, corpus: Corpus, crawl: str = ""):
+        self.session = session
+        self.corpus = corpus
+        self.crawl = crawl
+
+    def get(self, url, **kwargs) -> _RecordingRequest:
+        return _RecordingRequest(self, url, kwargs)
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+# -- replay --
+
+class _ReplayStream:
+    def __init__(self, body: bytes, error: Optional[type] = None):
+        self._body = body
+        self._pos = 0
+        self._error = error  # raised after the body, like the recorded read that failed midway
+
+    async def iter_chunked(self, n: int):
+        while self._pos < len(self._body):
+            chunk = self._body[self._pos:self._pos + n]
+            self._pos += len(chunk)
+            yield chunk
+        if self._error is not None:
+            raise self._error()
+
+    async def read(self, n: int = -1) -> bytes:
+        end = len(self._body) if n < 0 else self._pos + n
+        data = self._body[self._pos:end]
+        self._pos += len(data)
+        return data
+
+
+class ReplayResponse:
+    """The parts of aiohttp.ClientResponse the crawler uses, served from a recording."""
+
+    def __init__(self, entry: dict, body: bytes):
+        self.status = entry["status"]
+        self.headers = CIMultiDictProxy(CIMultiDict(entry.get("headers", {})))
+        self.url = URL(entry.get("final_url") or entry["url"])
+        self.charset = _charset(self.headers)
+        error = entry.get("error")
+        self.content = _ReplayStream(body, _ERRORS.get(error, aiohttp.ClientPayloadError) if error else None)
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or self.charset or "utf-8", errors=errors)
+
+    async def json(self, **kwargs):
+        return json.loads(await self.text())
+
+    def release(self):
+        pass
+
+
+class _ReplayRequest:
+    def __init__(self, session: "ReplaySession", url: str):
+        self._session = session
+        self._url = url
+
+    async def __aenter__(self) -> ReplayResponse:
+        await asyncio.sleep(0)  # yield like a real request would
+        return self._session.respond(self._url)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+_ERRORS = {
+    "TimeoutError": asyncio.TimeoutError,
+    "ServerTimeoutError": aiohttp.ServerTimeoutError,
+    "ClientPayloadError": aiohttp.ClientPayloadError,
+}
+
+
+class ReplaySession:
+    """In-process stand-in for aiohttp.ClientSession that answers from a Corpus."""
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+        self._responses = corpus.responses()
+        self._served: Dict[str, int] = {}  # URL -> responses already served by this session
+        self.closed = False
+
+    def get(self, url, params=None, **kwargs) -> _ReplayRequest:
+        return _ReplayRequest(self, _request_url(url, params))
+
+    def respond(self, url: str) -> ReplayResponse:
+        stats = self.corpus.stats
+        stats.requests += 1
+        recorded = self._responses.get(url)
+        if not recorded:
+            stats.misses += 1
+            return ReplayResponse({"url": url, "status": 404, "headers": {}}, b"")
+        served = self._served.get(url, 0)
+        self._served[url] = served + 1
+        entry = recorded[min(served, len(recorded) - 1)]
+        if entry.get("error") and not entry["status"]:
+            raise _ERRORS.get(entry["error"], aiohttp.ClientConnectionError)()
+        body = self.corpus.body(entry.get("body", ""))
+        stats.bytes_served += len(body)
+        return ReplayResponse(entry, body)
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+# -- crawler hook --
+
+def configure(record_dir: str = "", replay_dir: str = ""):
+    """Switch crawler sessions to recording or replay (both empty: live network)."""
+    global _MODE, _CORPUS
+    if _CORPUS is not None:
+        _CORPUS.close()
+    if record_dir and replay_dir:
+        raise ValueError("record and replay are mutually exclusive")
+    if replay_dir and not os.path.exists(os.path.join(replay_dir, INDEX_FILE)):
+        raise FileNotFoundError(f"No recorded corpus in {replay_dir}")
+    _MODE = "record" if record_dir else "replay" if replay_dir else ""
+    _CORPUS = Corpus(record_dir or replay_dir) if _MODE else None
+
+
+def active_corpus() -> Optional[Corpus]:
+    return _CORPUS
+
+
+def open_session(limit: int, crawl: str = ""):
+    """
+    HTTP session for one crawl: a live aiohttp session, wrapped for recording,
+    or a ReplaySession, depending on configure(). crawl labels the recording
+    with the crawl's start URL.
+    """
+    if _MODE == "replay":
+        return ReplaySession(_CORPUS)
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit, ssl=False))
+    if _MODE == "record":
+        return RecordingSession(session, _CORPUS, crawl)
+    return session
@@ -0,0 +1,179 @@
+"""
+Cross-run crawl state for incremental refreshes (--incremental).
+
+For every university the store remembers which URLs were crawled and, per staff
+page, the HTTP validators (ETag / Last-Modified), a content hash, the page text
+and the contacts extracted from it. An incremental run re-checks only those
+staff pages and reuses the stored contacts for pages that did not change.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+from academic_lead_extractor.contact import Contact
+from config import RUN_STATE_FILE
+from academic_lead_extractor.log import get_logger
+
+log = get_logger("state")
+
+# Scripts, styles and whitespace often change on every request (nonces, timestamps)
+_VOLATILE_HTML = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|\s+", re.IGNORECASE | re.DOTALL)
+
+# Contact fields compared when deciding whether a known contact changed
+DIFF_FIELDS = ("Full_name", "Title", "Role", "Field_of_study")
+
+
+class ContentHasher:
+    """
+    Incremental content_hash() for HTML that arrives in pieces (streamed pages).
+    
+    Gives the same digest as hashing the whole page as long as no piece boundary
+    falls inside a <script> or <style> block.
+    """
+
+    def __init__(self):
+        self._sha = hashlib.sha1()
+
+    def update(self, html: str):
+        self._sha.update(_VOLATILE_HTML.sub("", html).encode("utf-8", "replace"))
+
+    def hexdigest(self) -> str:
+        return self._sha.hexdigest()
+
+
+def content_hash(html: str) -> str:
+    """Hash of a page's HTML, ignoring scripts, styles and whitespace."""
+    hasher = ContentHasher()
+    hasher.update(html)
+    return hasher.hexdigest()
+
+
+def _contact_key(contact: dict) -> str:
+    email = (contact.get("Email") or "").lower()
+    return email if email else "name:" + (contact.get("Full_name") or "").lower()
+
+
+def diff_contacts(old: List[dict], new: List[dict]) -> Dict[str, list]:
+    """Compare two contact lists (keyed by email, or name when there is no email)."""
+    old_by_key = {_contact_key(c): c for c in old}
+    new_by_key = {_contact_key(c): c for c in new}
+
+    added = [new_by_key[k] for k in new_by_key if k not in old_by_key]
+    removed = [old_by_key[k] for k in old_by_key if k not in new_by_key]
+    changed = []
+    for key in new_by_key.keys() & old_by_key.keys():
+        before, after = old_by_key[key], new_by_key[key]
+        fields = {f: {"old": before.get(f, ""), "new": after.get(f, "")}
+                  for f in DIFF_FIELDS if before.get(f, "") != after.get(f, "")}
+        if fields:
+            changed.append({"Email": after.get("Email", ""), "Full_name": after.get("Full_name", ""), "changes": fields})
+
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+class RunStateStore:
+    """Gzipped JSON file holding the per-university crawl state of the last run."""
+
+    def __init__(self, path: str = RUN_STATE_FILE):
+        self.path = path
+        self.universities: Dict[str, dict] = {}
+        self.diffs: Dict[str, dict] = {}  # university name -> contact diff of this run
+        if os.path.exists(path):
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    self.universities = json.load(f).get("universities", {})
+            except (OSError, ValueError) as e:
+                log.warning(f"⚠️  Could not read run state {path} ({e}) - starting fresh")
+
+    def get(self, uni_url: str) -> Optional[dict]:
+        """State recorded for a university on a previous run (None if never crawled)."""
+        return self.universities.get(uni_url)
+
+    @staticmethod
+    def restore_contacts(page: dict) -> List[Contact]:
+        """Rebuild the contacts stored for an unchanged staff page."""
+        contacts = []
+        for data in page.get("contacts", []):
+            contact = Contact.from_dict(data)
+            contact.page_text = page.get("page_text", "")
+            contacts.append(contact)
+        return contacts
+
+    def record(self, uni: dict, crawler, incomplete: str = "") -> dict:
+        """
+        Store what a crawler found for a university and return the contact diff vs. the previous run.
+        
+        `incomplete` is why the crawl ended early (deadline, error): staff pages of the
+        previous run it did not get to are kept, so they don't count as removed. A crawl
+        that found no staff pages at all (e.g. unreachable homepage) keeps the previous
+        state and is marked incomplete.
+        """
+        url = uni.get("url", "")
+        previous = self.universities.get(url)
+
+        staff_pages = {}
+        for page_url, page in crawler.page_records.items():
+            contacts = page["contacts"]
+            staff_pages[page_url] = {
+                "etag": page["etag"],
+                "last_modified": page["last_modified"],
+                "content_hash": page["content_hash"],
+                "page_text": contacts[0].page_text if contacts else "",
+                "contacts": [c.to_json_dict() for c in contacts],
+            }
+        if not staff_pages and previous is not None and previous.get("staff_pages"):
+            # More likely a failed crawl than a site without staff: keep what the last run found
+            incomplete = incomplete or "no staff pages found"
+            staff_pages = dict(previous["staff_pages"])
+        elif incomplete and previous is not None:
+            for page_url, page in previous.get("staff_pages", {}).items():
+                if page_url not in crawler.visited:
+                    staff_pages.setdefault(page_url, page)
+
+        state = {
+            "name": uni.get("name", ""),
+            "country": uni.get("country", ""),
+            "last_run": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "crawled_urls": sorted(crawler.visited),
+            "staff_pages": staff_pages,
+        }
+        if incomplete:
+            state["incomplete"] = incomplete
+
+        diff = None
+        if previous is not None:
+            old_contacts = [c for p in previous.get("staff_pages", {}).values() for c in p.get("contacts", [])]
+            new_contacts = [c for p in staff_pages.values() for c in p["contacts"]]
+            diff = diff_contacts(old_contacts, new_contacts)
+            self.diffs[state["name"] or url] = diff
+
+        self.universities[url] = state
+        return diff
+
+    def save(self):
+        """Write the state atomically (a crash mid-write keeps the previous file)."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"universities": self.universities}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def write_diff(self, path: str) -> Dict[str, int]:
+        """Write this run's added/removed/changed contacts to a JSON file; returns the totals."""
+        totals = {
+            "added": sum(len(d["added"]) for d in self.diffs.values()),
+            "removed": sum(len(d["removed"]) for d in self.diffs.values()),
+            "changed": sum(len(d["changed"]) for d in self.diffs.values()),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "extraction_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "totals": totals,
+                "universities": self.diffs
+            }, f, indent=2, ensure_ascii=False)
+        return totals
@@ -14,32 +14,80 @@ Author: Patched for Miki (2025)
 """
 
 import asyncio
+import codecs
+import html as html_lib
 import aiohttp
 import re
+import time
 from urllib.parse import urljoin, urlparse
 from selectolax.parser import HTMLParser
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, NamedTuple
 from config import (
     STAFF_PAGE_KEYWORDS,
+    DEPARTMENT_URL_PATTERNS,
     EXCLUDE_URL_PATTERNS,
-    EMAIL_OBFUSCATION_PATTERNS,
     EXCLUDE_EMAIL_PATTERNS,
-    MAX_PAGES_PER_DOMAIN,
-    MAX_CRAWL_DEPTH,
     USER_AGENTS,
     DEBUG,
-    EMAIL_REGEX,
     STAFF_CARD_SELECTORS,
     TITLE_HINT_CLASSES,
     FIELD_KEYWORDS,
     MAX_RETRIES,
-    RETRY_DELAY
+    RETRY_DELAY,
+    FIELD_CACHE_SIZE,
+    MAX_PAGE_BYTES,
+    STREAM_CHUNK_BYTES,
+    STREAMING_EXTRACTION_CHARS,
+    USE_ROBOTS_TXT,
+    USE_SITEMAPS
 )
+from academic_lead_extractor.contact import Contact
+from academic_lead_extractor.memo import LRUMemo, text_key
+from academic_lead_extractor.structured_data import StructuredPerson, extract_structured_people
+from academic_lead_extractor.pagination import detect_pagination
+from academic_lead_extractor.page_dedup import DEDUP_TOTALS, PageDeduper, fingerprint
+from academic_lead_extractor.seeding import RobotsCache, discover_seeds
+from academic_lead_extractor.crawl_budget import CrawlBudget, RunBudget, crawl_timeout
+from academic_lead_extractor.concurrency import HOST_LIMITERS, parse_retry_after
+from academic_lead_extractor.replay import open_session
+from academic_lead_extractor import metrics
+from academic_lead_extractor.patterns import (
+    SPAM_PHRASE_RE,
+    EDGE_DOTS_RE,
+    EMAIL_RE,
+    OBFUSCATED_EMAIL_IN_NODE_RES,
+    OBFUSCATED_EMAIL_IN_LINK_RES,
+    OBFUSCATED_EMAIL_IN_PAGE_RES,
+    ACADEMIC_TITLE_RE,
+    NAME_LIKE_RE,
+    LOCAL_NAME_RE,
+    DIGIT_RE,
+    FALLBACK_BLOCK_HINT_RE,
+    FALLBACK_NAME_RE,
+    FALLBACK_TITLE_RE,
+    PAGE_NOISE_RE,
+    WHITESPACE_RE,
+    PROFILE_ID_URL_RE,
+    PROFILE_URL_RE,
+    PROFILE_TITLE_RE,
+    DIRECTORY_ROW_RES,
+    ANCHOR_HREF_RE,
+    deobfuscate,
+)
+from academic_lead_extractor.run_state import ContentHasher, RunStateStore, content_hash
+from academic_lead_extractor.log import get_logger
+from academic_lead_extractor.ai_evaluator import record_usage
+
+ai_log = get_logger("ai")  # AI link discovery, page and field classification
+classify_log = get_logger("classify")  # keyword page classification (sampled, see LOG_SAMPLING)
+fetch_log = get_logger("fetch")  # HTTP requests, retries and failures
+crawl_log = get_logger("crawl")  # frontier, seeding and per-university summaries
+extract_log = get_logger("extract")  # contact extraction
 
 # ----------------------------------------
 # GLOBAL SESSION LIMITS
 # ----------------------------------------
-CONNECTIONS = 5  # max concurrent HTTP requests (reduced to avoid server rejections)
+CONNECTIONS = 32  # connection pool per crawl; requests per host are limited adaptively (concurrency.py)
 TIMEOUT = aiohttp.ClientTimeout(total=15)
 
 # ----------------------------------------
@@ -156,12 +204,13 @@ Return ONLY valid JSON."""
         
         for attempt in range(max_retries):
             try:
-                response = client.chat.completions.create(
-                    model=ai_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    response_format={"type": "json_object"}
-                )
+                with metrics.span("ai_call", purpose="staff_page_filter"):
+                    response = client.chat.completions.create(
+                        model=ai_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.2,
+                        response_format={"type": "json_object"}
+                    )
                 break
             except Exception as api_error:
                 error_msg = str(api_error)
@@ -170,13 +219,14 @@ Return ONLY valid JSON."""
                 if attempt < max_retries - 1 and is_retryable:
                     wait_time = retry_delay * (attempt + 1)
                     if DEBUG:
-                        print(f"   ⚠️  AI filter error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                        ai_log.debug(f"   ⚠️  AI filter error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 else:
-                    if DEBUG:
-                        print(f"   ⚠️  AI filter failed: {error_msg}")
+                    ai_log.warning(f"   ⚠️  AI filter failed: {error_msg}")
                     return True  # Fallback: allow if AI fails
         
+        record_usage(response, ai_model)
+        
         # Parse response
         result = json.loads(response.choices[0].message.content)
         is_relevant = result.get("relevant", False)
@@ -185,14 +235,13 @@ Return ONLY valid JSON."""
         
         if DEBUG:
             status = "✅" if is_relevant else "❌"
-            print(f"      {status} AI Filter: {title[:40]}... → {is_relevant} (conf: {confidence:.2f})")
-            print(f"         Reason: {reason[:80]}")
+            ai_log.debug(f"      {status} AI Filter: {title[:40]}... → {is_relevant} (conf: {confidence:.2f})")
+            ai_log.debug(f"         Reason: {reason[:80]}")
         
         return is_relevant and confidence >= 0.5
         
     except Exception as e:
-        if DEBUG:
-            print(f"   ⚠️  AI filter exception: {e}")
+        ai_log.warning(f"   ⚠️  AI filter exception: {e}")
         return True  # Fallback: allow if error
 
 
@@ -259,12 +308,13 @@ Return ONLY valid JSON."""
         
         for attempt in range(max_retries):
             try:
-                response = client.chat.completions.create(
-                    model=ai_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.1,  # Lower temperature for more consistent detection
-                    response_format={"type": "json_object"}
-                )
+                with metrics.span("ai_call", purpose="profile_detection"):
+                    response = client.chat.completions.create(
+                        model=ai_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.1,  # Lower temperature for more consistent detection
+                        response_format={"type": "json_object"}
+                    )
                 break
             except Exception as api_error:
                 error_msg = str(api_error)
@@ -273,13 +323,14 @@ Return ONLY valid JSON."""
                 if attempt < max_retries - 1 and is_retryable:
                     wait_time = retry_delay * (attempt + 1)
                     if DEBUG:
-                        print(f"   ⚠️  AI profile detection error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                        ai_log.debug(f"   ⚠️  AI profile detection error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 else:
-                    if DEBUG:
-                        print(f"   ⚠️  AI profile detection failed: {error_msg}")
+                    ai_log.warning(f"   ⚠️  AI profile detection failed: {error_msg}")
                     return False  # Fallback: don't assume it's a profile
         
+        record_usage(response, ai_model)
+        
         # Parse response
         result = json.loads(response.choices[0].message.content)
         is_profile = result.get("is_profile", False)
@@ -289,16 +340,15 @@ Return ONLY valid JSON."""
         
         if DEBUG:
             status = "👤" if is_profile else "📋"
-            print(f"      {status} AI Profile Detection: {title[:40]}... → {is_profile} (conf: {confidence:.2f})")
+            ai_log.debug(f"      {status} AI Profile Detection: {title[:40]}... → {is_profile} (conf: {confidence:.2f})")
             if person_name:
-                print(f"         Person: {person_name}")
-            print(f"         Reason: {reason[:80]}")
+                ai_log.debug(f"         Person: {person_name}")
+            ai_log.debug(f"         Reason: {reason[:80]}")
         
         return is_profile and confidence >= 0.6  # Require 60% confidence for profile detection
         
     except Exception as e:
-        if DEBUG:
-            print(f"   ⚠️  AI profile detection exception: {e}")
+        ai_log.warning(f"   ⚠️  AI profile detection exception: {e}")
         return False  # Fallback: don't assume it's a profile
 
 
@@ -426,12 +476,13 @@ Return 5-25 most promising URLs. Prioritize subdomains and institute pages over
         
         for attempt in range(max_retries):
             try:
-                response = client.chat.completions.create(
-                    model=ai_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.2,
-                    response_format={"type": "json_object"}
-                )
+                with metrics.span("ai_call", purpose="link_discovery"):
+                    response = client.chat.completions.create(
+                        model=ai_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.2,
+                        response_format={"type": "json_object"}
+                    )
                 break
             except Exception as api_error:
                 error_msg = str(api_error)
@@ -440,13 +491,14 @@ Return 5-25 most promising URLs. Prioritize subdomains and institute pages over
                 if attempt < max_retries - 1 and is_retryable:
                     wait_time = retry_delay * (attempt + 1)
                     if DEBUG:
-                        print(f"   ⚠️  AI link discovery error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                        ai_log.debug(f"   ⚠️  AI link discovery error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
                     time.sleep(wait_time)
                 else:
-                    if DEBUG:
-                        print(f"   ⚠️  AI link discovery failed: {error_msg}")
+                    ai_log.warning(f"   ⚠️  AI link discovery failed: {error_msg}")
                     return []  # Fallback to keyword-based
         
+        record_usage(response, ai_model)
+        
         # Parse response
         result = json.loads(response.choices[0].message.content)
         staff_pages = result.get("staff_pages", [])
@@ -459,17 +511,16 @@ Return 5-25 most promising URLs. Prioritize subdomains and institute pages over
             if url:
                 ai_urls.append(url)
                 if DEBUG:
-                    print(f"      🤖 AI found: {url}")
-                    print(f"         Reason: {reason}")
+                    ai_log.debug(f"      🤖 AI found: {url}")
+                    ai_log.debug(f"         Reason: {reason}")
         
         if DEBUG and ai_urls:
-            print(f"   🤖 AI discovered {len(ai_urls)} staff page link(s)")
+            ai_log.debug(f"   🤖 AI discovered {len(ai_urls)} staff page link(s)")
         
         return ai_urls
         
     except Exception as e:
-        if DEBUG:
-            print(f"   ⚠️  AI link discovery exception: {e}")
+        ai_log.warning(f"   ⚠️  AI link discovery exception: {e}")
         return []  # Fallback to keyword-based
 
 
@@ -491,61 +542,40 @@ def looks_like_staff_page(text: str, url: str) -> bool:
     for k in STAFF_PAGE_KEYWORDS:
         if k.lower() in url_l:
             if DEBUG:
-                print(f"   ✅ STAFF KEYWORD MATCH in URL: '{k}' in {url}")
+                classify_log.debug(f"   ✅ STAFF KEYWORD MATCH in URL: '{k}' in {url}")
             return True
         if k.lower() in text_l:
             if DEBUG:
-                print(f"   ✅ STAFF KEYWORD MATCH in TITLE: '{k}' in '{text[:80]}'")
+                classify_log.debug(f"   ✅ STAFF KEYWORD MATCH in TITLE: '{k}' in '{text[:80]}'")
             return True
     
     # Generic detection of individual profile pages
     # These patterns work across different languages and university systems
-    import re
     
     # Pattern 1: URL with ID/number + name
     # Examples: /421/john-smith, /staff/123/maria-garcia, /profile/456/mueller
     # Works for: English, German, Spanish, Serbian, etc.
-    if re.search(r'/\d+/[\w-]+(?:-[\w-]+)*/?$', url_l, re.IGNORECASE):
+    if PROFILE_ID_URL_RE.search(url_l):
         if DEBUG:
-            print(f"   ✅ INDIVIDUAL PROFILE PAGE detected (number + name pattern): {url}")
+            classify_log.debug(f"   ✅ INDIVIDUAL PROFILE PAGE detected (number + name pattern): {url}")
         return True
     
     # Pattern 2: Profile/staff/people with single name
     # Examples: /profile/john-smith, /staff/maria-garcia, /people/hans-mueller, ~/username
-    profile_url_keywords = [
-        r'/profile/[\w-]+/?$', r'/staff/[\w-]+/?$', r'/people/[\w-]+/?$',
-        r'/faculty/[\w-]+/?$', r'/researcher/[\w-]+/?$', r'/professor/[\w-]+/?$',
-        r'/~[\w-]+/?$',  # Unix-style home directories
-        r'/mitarbeiter/[\w-]+/?$', r'/personen/[\w-]+/?$',  # German
-        r'/personnel/[\w-]+/?$', r'/chercheur/[\w-]+/?$',  # French
-        r'/personale/[\w-]+/?$', r'/ricercatore/[\w-]+/?$',  # Italian
-        r'/investigador/[\w-]+/?$', r'/profesor/[\w-]+/?$',  # Spanish
-    ]
-    for pattern in profile_url_keywords:
-        if re.search(pattern, url_l, re.IGNORECASE):
-            if DEBUG:
-                print(f"   ✅ INDIVIDUAL PROFILE PAGE detected (profile URL pattern): {url}")
-            return True
+    if PROFILE_URL_RE.search(url_l):
+        if DEBUG:
+            classify_log.debug(f"   ✅ INDIVIDUAL PROFILE PAGE detected (profile URL pattern): {url}")
+        return True
     
     # Pattern 3: Title starting with capitalized name followed by separator
     # Examples: "John Smith | MIT", "Dr. Maria Garcia - UNAM", "Prof. Hans Mueller, TUM"
-    # Character ranges cover: Latin (English, German, French, Spanish, Italian), 
-    # Cyrillic (Russian, Serbian, Bulgarian), Greek, and accented characters
-    # Uppercase: A-Z, À-Ž, А-Я, Α-Ω (Latin, Latin Extended, Cyrillic, Greek)
-    # Lowercase: a-z, à-ž, а-я, α-ω (Latin, Latin Extended, Cyrillic, Greek)
-    title_name_patterns = [
-        # With academic title prefix
-        r'^(?:Prof\.?|Dr\.?|Professor|Doctor|Assoc\.?|Assistant)?\s*[A-ZÀ-ŽА-ЯΑ-Ω][a-zà-žа-яα-ω]+(?:\s+[A-ZÀ-ŽА-ЯΑ-Ω][a-zà-žа-яα-ω]+){1,3}\s*[|\-–—,]',
-        # Without academic title
-        r'^[A-ZÀ-ŽА-ЯΑ-Ω][a-zà-žа-яα-ω]+(?:\s+[A-ZÀ-ŽА-ЯΑ-Ω][a-zà-žа-яα-ω]+){1,3}\s*[|\-–—]',
-    ]
-    for pattern in title_name_patterns:
-        if re.search(pattern, text, re.UNICODE):
-            # Additional validation: title shouldn't be too long (profiles are usually short)
-            if len(text) < 200:  # Profile titles are typically under 200 chars
-                if DEBUG:
-                    print(f"   ✅ INDIVIDUAL PROFILE PAGE detected (name in title): '{text[:80]}'")
-                return True
+    # Character ranges cover Latin, Latin Extended, Cyrillic and Greek names
+    if PROFILE_TITLE_RE.search(text):
+        # Additional validation: title shouldn't be too long (profiles are usually short)
+        if len(text) < 200:  # Profile titles are typically under 200 chars
+            if DEBUG:
+                classify_log.debug(f"   ✅ INDIVIDUAL PROFILE PAGE detected (name in title): '{text[:80]}'")
+            return True
     
     return False
 
@@ -558,21 +588,6 @@ def looks_like_department_page(text: str, url: str) -> bool:
     text_l = text.lower()
     url_l = url.lower()
     
-    # URL patterns for departments/institutes (multilingual)
-    dept_url_patterns = [
-        # English
-        '/institut', '/institute', '/faculty', '/department', '/school',
-        '/group', '/lab', '/laboratory', '/center', '/centre',
-        # German
-        '/fachgebiet', '/lehrstuhl', '/arbeitsgruppe', '/fachbereich', '/abteilung',
-        # French
-        '/laboratoire', '/équipe', '/département',
-        # Italian  
-        '/dipartimento', '/laboratorio',
-        # Spanish
-        '/departamento', '/grupo',
-    ]
-    
     # Title keywords (look for "Institute for X", "Department of Y", etc.)
     dept_title_keywords = [
         # English
@@ -589,13 +604,13 @@ def looks_like_department_page(text: str, url: str) -> bool:
         'instituto', 'departamento', 'grupo de investigación',
     ]
     
-    # Check URL - strong signal
-    for pattern in dept_url_patterns:
+    # Check URL - strong signal (DEPARTMENT_URL_PATTERNS, multilingual)
+    for pattern in DEPARTMENT_URL_PATTERNS:
         if pattern in url_l:
             # Exclude if it's already a staff page within department
             if not any(staff_kw in url_l for staff_kw in ['/staff', '/people', '/team', '/mitarbeiter', '/personnel']):
                 if DEBUG:
-                    print(f"   🏛️ DEPARTMENT PAGE detected (URL pattern): {url}")
+                    classify_log.debug(f"   🏛️ DEPARTMENT PAGE detected (URL pattern): {url}")
                 return True
     
     # Check title - moderate signal
@@ -604,7 +619,7 @@ def looks_like_department_page(text: str, url: str) -> bool:
             # Additional validation: should be a homepage-like title
             if len(text) < 150:  # Department titles are usually concise
                 if DEBUG:
-                    print(f"   🏛️ DEPARTMENT PAGE detected (title keyword): '{text[:80]}'")
+                    classify_log.debug(f"   🏛️ DEPARTMENT PAGE detected (title keyword): '{text[:80]}'")
                 return True
     
     return False
@@ -614,54 +629,155 @@ def looks_like_department_page(text: str, url: str) -> bool:
 # ASYNC FETCH WITH RETRY + UA ROTATION
 # ----------------------------------------
 
-async def fetch(session: aiohttp.ClientSession, url: str) -> str:
-    """Fetch a page with retry + rotating User-Agent and exponential backoff."""
+class FetchResult(NamedTuple):
+    """Outcome of fetch_page(): HTML body plus the validators needed for conditional requests."""
+    html: str
+    status: int
+    etag: str = ""
+    last_modified: str = ""
+    truncated: bool = False  # body cut off at MAX_PAGE_BYTES
+    streamed: bool = False  # body handed to on_text instead of being kept (html is "")
+
+
+async def _read_body(resp, url: str, sink=None) -> tuple:
+    """
+    Read a response in chunks, decoding incrementally, up to MAX_PAGE_BYTES.
+    
+    Every decoded piece is passed to sink.feed() (if given) as it arrives; once feed
+    returns True the sink has taken over the page and the body is no longer kept here.
+    Returns (html, truncated, streamed).
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts = []
+    streamed = False
+    truncated = False
+    received = 0
+
+    def emit(text: str):
+        nonlocal parts, streamed
+        if not text:
+            return
+        if sink is not None and sink.feed(text) and not streamed:
+            streamed = True
+            parts = []
+        if not streamed:
+            parts.append(text)
+
+    async for chunk in resp.content.iter_chunked(STREAM_CHUNK_BYTES):
+        if received + len(chunk) > MAX_PAGE_BYTES:
+            chunk = chunk[:MAX_PAGE_BYTES - received]
+            truncated = True
+        received += len(chunk)
+        emit(decoder.decode(chunk))
+        if truncated:
+            break
+    emit(decoder.decode(b"", final=True))
+
+    if truncated and DEBUG:
+        fetch_log.debug(f"   ✂️  Page truncated at {MAX_PAGE_BYTES:,} bytes: {url[:80]}")
+    return "".join(parts), truncated, streamed
+
+
+async def fetch_page(session: aiohttp.ClientSession, url: str, etag: str = "", last_modified: str = "",
+                     sink=None) -> FetchResult:
+    """
+    Fetch a page with retry + rotating User-Agent and exponential backoff.
+    
+    Requests to a host wait for a slot of its HostLimiter (concurrency.py), which
+    adapts to the host's response times, errors, 429s and Retry-After headers.
+    
+    If etag/last_modified from a previous run are given, the request is conditional
+    and an unchanged page comes back as status 304 with an empty body.
+    
+    The body is streamed with a hard cap of MAX_PAGE_BYTES. A sink (see
+    StreamingDirectoryExtractor) receives the decoded text while it downloads and
+    is reset before a retry, so it never sees a page twice.
+    """
+    with metrics.tags(host=urlparse(url).netloc), metrics.span("fetch"):
+        result = await _fetch_with_retries(session, url, etag, last_modified, sink)
+    return result
+
+
+async def _fetch_with_retries(session, url: str, etag: str, last_modified: str, sink) -> FetchResult:
     headers = {"User-Agent": USER_AGENTS[hash(url) % len(USER_AGENTS)]}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    status = 0
+    limiter = HOST_LIMITERS.get(urlparse(url).netloc)  # adaptive requests in flight for this host
 
     for attempt in range(MAX_RETRIES):
+        if attempt > 0:
+            metrics.inc("fetch_retries_total")
+        if sink is not None and attempt > 0:
+            sink.reset()  # a failed attempt may have fed part of the body
+        started = await limiter.acquire()
+        latency = None  # seconds to the response headers
+        signal = ""  # "error" / "throttled": the host should get fewer parallel requests
+        retry_after = 0.0  # seconds the server asked us to wait (429/503 Retry-After)
         try:
             async with session.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True) as resp:
+                latency = time.monotonic() - started
+                status = resp.status
+                metrics.inc("http_responses_total", status=status)
+                if resp.status == 304:
+                    # Not modified since the previous run
+                    return FetchResult("", 304, resp.headers.get("ETag", etag), resp.headers.get("Last-Modified", last_modified))
                 if resp.status == 200 and resp.headers.get("content-type", "").startswith("text/html"):
-                    html = await resp.text()
-                    # Small delay after successful fetch to be polite to the server
-                    await asyncio.sleep(0.3)
+                    html, truncated, streamed = await _read_body(resp, url, sink)
                     if DEBUG and attempt > 0:
-                        print(f"   ✅ Fetch succeeded on attempt {attempt + 1}/{MAX_RETRIES} for {url[:80]}")
-                    return html
-                elif resp.status >= 500:
-                    # Server error - worth retrying
+                        fetch_log.debug(f"   ✅ Fetch succeeded on attempt {attempt + 1}/{MAX_RETRIES} for {url[:80]}")
+                    return FetchResult(html, 200, resp.headers.get("ETag", ""), resp.headers.get("Last-Modified", ""),
+                                       truncated, streamed)
+                elif resp.status == 429 or resp.status >= 500:
+                    # Rate limited or server error - worth retrying, after the server's Retry-After if it sent one
+                    signal = "throttled"
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
                     if DEBUG:
-                        print(f"   ⚠️  Server error {resp.status} (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]}")
-                    if attempt < MAX_RETRIES - 1:
-                        delay = RETRY_DELAY * (2 ** attempt)  # exponential backoff: 1s, 2s, 4s
-                        await asyncio.sleep(delay)
+                        fetch_log.debug(f"   ⚠️  Server answered {resp.status} (attempt {attempt + 1}/{MAX_RETRIES}"
+                                        f"{f', Retry-After {retry_after:g}s' if retry_after else ''}): {url[:80]}")
                 elif resp.status >= 400:
                     # Client error (404, 403, etc.) - no point retrying
                     if DEBUG:
-                        print(f"   ⚠️  Client error {resp.status}, not retrying: {url[:80]}")
-                    return ""
+                        fetch_log.debug(f"   ⚠️  Client error {resp.status}, not retrying: {url[:80]}")
+                    return FetchResult("", resp.status)
+                else:
+                    # Not an HTML page (PDF, image, ...) - nothing to crawl
+                    return FetchResult("", resp.status)
         except asyncio.TimeoutError:
+            signal = "error"
+            metrics.inc("fetch_failures_total", error="timeout")
             if DEBUG:
-                print(f"   ⏱️  Timeout (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]}")
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_DELAY * (2 ** attempt)  # exponential backoff: 1s, 2s, 4s
-                await asyncio.sleep(delay)
+                fetch_log.debug(f"   ⏱️  Timeout (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]}")
         except aiohttp.ClientError as e:
+            signal = "error"
+            metrics.inc("fetch_failures_total", error=type(e).__name__)
             if DEBUG:
-                print(f"   ⚠️  Network error (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]} - {type(e).__name__}")
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_DELAY * (2 ** attempt)  # exponential backoff: 1s, 2s, 4s
-                await asyncio.sleep(delay)
+                fetch_log.debug(f"   ⚠️  Network error (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]} - {type(e).__name__}")
         except Exception as e:
+            signal = "error"  # e.g. while reading the body: not a fast success, whatever the latency
+            metrics.inc("fetch_failures_total", error=type(e).__name__)
             if DEBUG:
-                print(f"   ⚠️  Unexpected error (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]} - {e}")
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_DELAY * (2 ** attempt)  # exponential backoff: 1s, 2s, 4s
-                await asyncio.sleep(delay)
+                fetch_log.debug(f"   ⚠️  Unexpected error (attempt {attempt + 1}/{MAX_RETRIES}): {url[:80]} - {e}")
+        finally:
+            limiter.release(started, latency, signal, retry_after)
+        
+        if attempt < MAX_RETRIES - 1:
+            # Exponential backoff (1s, 2s, 4s), or longer if the server asked for it
+            await asyncio.sleep(max(RETRY_DELAY * (2 ** attempt), retry_after))
 
     if DEBUG:
-        print(f"   ❌ Failed after {MAX_RETRIES} attempts: {url[:80]}")
-    return ""  # failed after all retries
+        fetch_log.debug(f"   ❌ Failed after {MAX_RETRIES} attempts: {url[:80]}")
+    return FetchResult("", status)  # failed after all retries
+
+
+async def fetch(session: aiohttp.ClientSession, url: str) -> str:
+    """Fetch a page and return its HTML ("" on failure)."""
+    return (await fetch_page(session, url)).html
 
 
 # ----------------------------------------
@@ -673,13 +789,10 @@ def clean_email(raw: str) -> str:
     email = raw.strip()
     
     # Remove common spam-protection phrases
-    email = re.sub(r'does-not-exist\.?', '', email, flags=re.IGNORECASE)
-    email = re.sub(r'no-spam\.?', '', email, flags=re.IGNORECASE)
-    email = re.sub(r'remove-this\.?', '', email, flags=re.IGNORECASE)
+    email = SPAM_PHRASE_RE.sub('', email)
 
-    # Apply standard obfuscation pattern replacements
-    for pattern, repl in EMAIL_OBFUSCATION_PATTERNS.items():
-        email = re.sub(pattern, repl, email, flags=re.IGNORECASE)
+    # Apply standard obfuscation pattern replacements (all EMAIL_OBFUSCATION_PATTERNS in one pass)
+    email = deobfuscate(email)
 
     # Special handling for KIT format: "firstname lastname @ domain tld"
     # Convert to "firstname.lastname@domain.tld"
@@ -707,7 +820,7 @@ def clean_email(raw: str) -> str:
     
     # Clean up any remaining issues
     email = email.replace("..", ".")
-    email = re.sub(r'^\.+|\.+$', '', email)  # Remove leading/trailing dots
+    email = EDGE_DOTS_RE.sub('', email)  # Remove leading/trailing dots
     
     return email if "@" in email and "." in email.split("@")[-1] else ""
 
@@ -731,71 +844,203 @@ def is_academic_email(email: str) -> bool:
 # MAIN CRAWLER
 # ----------------------------------------
 
+# Crawlers of the universities being processed, by university name (read by the live status board)
+ACTIVE_CRAWLERS: Dict[str, "StaffCrawler"] = {}
+
+
 class StaffCrawler:
-    def __init__(self, start_url: str, use_ai: bool = False, client=None, ai_model: str = "gpt-4o-mini", use_ai_profile_detection: bool = False):
+    def __init__(self, start_url: str, use_ai: bool = False, client=None, ai_model: str = "gpt-4o-mini", use_ai_profile_detection: bool = False,
+                 run_budget: Optional[RunBudget] = None):
         self.start_url = start_url
         self.domain = urlparse(start_url).netloc
         self.visited: Set[str] = set()
         self.queued: Set[str] = set()  # Track URLs queued for crawling
         self.found_pages: List[str] = []
-        self.contacts: List[Dict] = []
+        self.contacts: List[Contact] = []
         self.use_ai = use_ai
         self.client = client
         self.ai_model = ai_model
         self.use_ai_profile_detection = use_ai_profile_detection  # Control AI profile detection
         self.ai_filtered_count = 0  # Track how many pages were filtered out by AI
         self.ai_discovered_urls: Set[str] = set()  # Track AI-discovered URLs
+        # Per staff page: HTTP validators, content hash and extracted contacts (for --incremental)
+        self.page_records: Dict[str, dict] = {}
+        self.pages_unchanged = 0  # Incremental refresh: pages reused from the previous run
+        self.pages_changed = 0  # Incremental refresh: pages re-extracted
+        self.dedup = PageDeduper()  # URL variants and near-duplicate staff pages
+        self.robots = RobotsCache() if USE_ROBOTS_TXT else None  # robots.txt rules per host
+        self.seed_urls: List[str] = []  # staff/department URLs from the sitemaps, best first
+        self.budget = CrawlBudget(run_budget)  # pages and depth, adapted to the crawl's yield
 
     async def crawl(self):
         """Main entry: start async crawl with queue."""
-        connector = aiohttp.TCPConnector(limit=CONNECTIONS, ssl=False)
-        async with aiohttp.ClientSession(connector=connector) as session:
+        async with open_session(CONNECTIONS, crawl=self.start_url) as session:
+            await self._seed_frontier(session)
             await self._crawl_recursive(self.start_url, session, depth=0)
+            # Seeds not reached from the homepage (e.g. the homepage failed to load)
+            remaining = [self._crawl_recursive(u, session, 1) for u in self.seed_urls if u not in self.visited]
+            if remaining:
+                await asyncio.gather(*remaining, return_exceptions=True)
+        
+        DEDUP_TOTALS.add(self.dedup.stats)
+        if self.dedup.stats.url_variants or self.dedup.stats.near_duplicates:
+            crawl_log.info(f"   ♊ Duplicates skipped: {self.dedup.stats.url_variants} URL variants not fetched, "
+                           f"{self.dedup.stats.near_duplicates} near-duplicate staff pages "
+                           f"({self.dedup.stats.contacts_skipped} duplicate contacts dropped)")
+        if self.robots is not None and (self.robots.disallowed or self.robots.seeds_disallowed):
+            crawl_log.info(f"   🚫 robots.txt: {self.robots.disallowed} URLs not fetched, "
+                           f"{self.robots.seeds_disallowed} sitemap URLs not seeded")
+        budget_summary = self.budget.summary()
+        if budget_summary:
+            crawl_log.info(f"   ✂️  Crawl budget: {budget_summary}")
         
         # Print summary if AI was used
-        if DEBUG and self.use_ai:
+        if self.use_ai:
             ai_found_count = len(self.ai_discovered_urls)
             keyword_found_count = len(self.found_pages) - ai_found_count
-            print(f"   📊 Discovery summary:")
-            print(f"      🤖 AI discovered: {ai_found_count} staff pages")
-            print(f"      📋 Keywords found: {keyword_found_count} additional pages")
-            print(f"      ❌ AI filtered: {self.ai_filtered_count} non-ICP pages")
-            print(f"      ✅ Total processed: {len(self.found_pages)} staff pages")
+            crawl_log.info(f"   📊 Discovery summary for {self.start_url}:\n"
+                           f"      🤖 AI discovered: {ai_found_count} staff pages\n"
+                           f"      📋 Keywords found: {keyword_found_count} additional pages\n"
+                           f"      ❌ AI filtered: {self.ai_filtered_count} non-ICP pages\n"
+                           f"      ✅ Total processed: {len(self.found_pages)} staff pages")
         
         return self.contacts
 
-    async def _crawl_recursive(self, url: str, session, depth: int):
-        """Depth-limited recursive crawler."""
-        if depth > MAX_CRAWL_DEPTH:
+    async def _seed_frontier(self, session):
+        """Queue staff/department URLs listed in the site's sitemaps (USE_SITEMAPS)."""
+        if not USE_SITEMAPS:
             return
-        if len(self.visited) > MAX_PAGES_PER_DOMAIN:
+        policy = await self.robots.policy_for(session, self.start_url) if self.robots is not None else None
+
+        def accept(url: str) -> bool:
+            return (is_same_domain(self.start_url, url) and allowed_url(url) and url != self.start_url
+                    and (policy is None or policy.allows(url, seed=True)))
+
+        seeds = await discover_seeds(session, self.start_url, policy.sitemaps if policy else [], accept)
+        for url in seeds.urls:
+            if url not in self.queued:
+                self.queued.add(url)
+                self.seed_urls.append(url)
+        if seeds.scanned:
+            crawl_log.info(f"   🗺️  Sitemaps: {seeds.scanned} URLs in {seeds.sitemaps} file(s), "
+                           f"{seeds.staff} staff / {seeds.departments} department candidates, {len(self.seed_urls)} seeded")
+
+    async def refresh(self, previous: dict):
+        """
+        Incremental mode: re-check only the staff pages found on the previous run.
+        
+        Pages are fetched with conditional requests; unchanged pages (304 or same
+        content hash) reuse the stored contacts, changed pages are re-extracted.
+        """
+        pages = list(previous.get("staff_pages", {}).items())
+        async with open_session(CONNECTIONS, crawl=self.start_url) as session:
+            BATCH_SIZE = 5  # Same batching as the full crawl
+            for i in range(0, len(pages), BATCH_SIZE):
+                batch = pages[i:i + BATCH_SIZE]
+                await asyncio.gather(*(self._refresh_page(session, url, page) for url, page in batch),
+                                     return_exceptions=True)
+        
+        crawl_log.info(f"   ♻️  Incremental refresh: {self.pages_unchanged} unchanged, "
+                       f"{self.pages_changed} changed, {len(pages) - self.pages_unchanged - self.pages_changed} gone/failed")
+        
+        return self.contacts
+
+    async def _refresh_page(self, session, url: str, page: dict):
+        self.visited.add(url)
+        stream = StreamingDirectoryExtractor(url)
+        result = await fetch_page(session, url, page.get("etag", ""), page.get("last_modified", ""), sink=stream)
+        if result.streamed:
+            stream.finish()
+            page_hash = stream.content_hash
+        else:
+            page_hash = content_hash(result.html) if result.html else ""
+        
+        if result.status == 304 or (page_hash and page_hash == page.get("content_hash")):
+            self.pages_unchanged += 1
+            self.found_pages.append(url)
+            self._record_page(url, result.etag or page.get("etag", ""),
+                              result.last_modified or page.get("last_modified", ""),
+                              page.get("content_hash", ""), RunStateStore.restore_contacts(page))
+        elif page_hash:
+            self.pages_changed += 1
+            self.found_pages.append(url)
+            self._record_page(url, result.etag, result.last_modified, page_hash,
+                              stream.contacts if result.streamed else extract_contacts_from_html(result.html, url))
+        elif result.status not in (404, 410):
+            # Transient failure: keep what we knew from the previous run
+            self.found_pages.append(url)
+            self._record_page(url, page.get("etag", ""), page.get("last_modified", ""),
+                              page.get("content_hash", ""), RunStateStore.restore_contacts(page))
+        elif DEBUG:
+            crawl_log.debug(f"   🗑️  Staff page gone ({result.status}): {url}")
+
+    def _record_page(self, url: str, etag: str, last_modified: str, page_hash: str, contacts: List[Contact]):
+        self.page_records[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": page_hash,
+            "contacts": contacts,
+        }
+        self.contacts.extend(contacts)
+        self.budget.record(contacts)
+        metrics.inc("contacts_extracted_total", len(contacts))
+
+    def pending(self) -> int:
+        """URLs queued but not crawled yet (callable from other threads)."""
+        visited = self.visited
+        return sum(1 for url in list(self.queued) if url not in visited)
+
+    async def _crawl_recursive(self, url: str, session, depth: int):
+        """Depth-limited recursive crawler (limits from the crawl budget)."""
+        if not self.budget.follow(depth):
             return
+        if depth > 1 and self.budget.low_yield() and not (looks_like_staff_page("", url) or looks_like_department_page("", url)):
+            return  # Crawl has stopped yielding: only links that look like staff/department pages
         if url in self.visited:
             return
+        if not self.dedup.claim_url(url):
+            return  # variant of a URL already crawled (fragment, tracking parameters, slashes, ...)
         self.visited.add(url)
 
-        html = await fetch(session, url)
+        if self.robots is not None:
+            policy = await self.robots.policy_for(session, url)
+            if not policy.allows(url):
+                if DEBUG:
+                    crawl_log.debug(f"   🚫 Disallowed by robots.txt: {url[:80]}")
+                return
+            await policy.wait_turn()
+        if not self.budget.allow():
+            return
+
+        stream = StreamingDirectoryExtractor(url)
+        result = await fetch_page(session, url, sink=stream)
+        html = result.html
+        if result.streamed:
+            # Very large directory: rows were extracted while downloading; the first
+            # part of the page stands in for the whole for title and AI previews
+            stream.finish()
+            html = stream.head
         if not html:
             if DEBUG and depth == 0:
-                print(f"   ⚠️ Failed to fetch: {url}")
+                crawl_log.debug(f"   ⚠️ Failed to fetch: {url}")
             return
 
         tree = HTMLParser(html)
         title = (tree.css_first("title").text(strip=True) if tree.css_first("title") else "")
         
         if DEBUG and depth == 0:
-            print(f"   📄 [D{depth}] Checking: {url[:80]}... (title: {title[:40]}...)")
+            crawl_log.debug(f"   📄 [D{depth}] Checking: {url[:80]}... (title: {title[:40]}...)")
 
         # SPECIAL: At homepage level (depth=0), use AI to discover staff pages first
         if depth == 0 and self.use_ai and self.client:
             if DEBUG:
-                print(f"   🤖 Using AI to discover staff page links...")
+                crawl_log.debug(f"   🤖 Using AI to discover staff page links...")
             
             ai_discovered_urls = await ai_find_staff_page_links(html, url, self.client, self.ai_model)
             
             if ai_discovered_urls:
                 if DEBUG:
-                    print(f"   ✅ AI found {len(ai_discovered_urls)} staff page link(s)")
+                    crawl_log.debug(f"   ✅ AI found {len(ai_discovered_urls)} staff page link(s)")
                 
                 # Queue AI-discovered pages for crawling and track them
                 for ai_url in ai_discovered_urls:
@@ -804,10 +1049,11 @@ class StaffCrawler:
                         self.ai_discovered_urls.add(ai_url)
             else:
                 if DEBUG:
-                    print(f"   ⚠️  AI found no staff pages, will use keyword discovery fallback")
+                    crawl_log.debug(f"   ⚠️  AI found no staff pages, will use keyword discovery fallback")
 
         # Detect potential staff pages, department pages, OR subdomain homepages
-        is_staff_page = looks_like_staff_page(title, url)
+        # (a streamed page already passed the staff page check)
+        is_staff_page = result.streamed or looks_like_staff_page(title, url)
         is_department_page = looks_like_department_page(title, url)
         
         # If not detected by regex but AI profile detection is enabled, check with AI
@@ -816,7 +1062,7 @@ class StaffCrawler:
             page_text_preview = _collect_page_text(tree)[:1500]
             is_staff_page = await ai_detect_profile_page(url, title, page_text_preview, self.client, self.ai_model)
             if is_staff_page and DEBUG:
-                print(f"   🤖 AI detected individual profile page (regex missed it)")
+                crawl_log.debug(f"   🤖 AI detected individual profile page (regex missed it)")
         
         # Check if this is a subdomain homepage (e.g., iam.kit.edu, itep.kit.edu)
         # Only consider it a subdomain homepage if:
@@ -840,9 +1086,9 @@ class StaffCrawler:
         )
         
         if DEBUG and (is_subdomain_homepage or is_department_page or "mitarbeitende" in url.lower()):
-            print(f"   🔍 Checking URL: {url}")
-            print(f"      Title: {title[:60]}")
-            print(f"      is_staff_page: {is_staff_page}, is_department_page: {is_department_page}, is_subdomain_homepage: {is_subdomain_homepage}")
+            crawl_log.debug(f"   🔍 Checking URL: {url}")
+            crawl_log.debug(f"      Title: {title[:60]}")
+            crawl_log.debug(f"      is_staff_page: {is_staff_page}, is_department_page: {is_department_page}, is_subdomain_homepage: {is_subdomain_homepage}")
         
         # Process if it's a staff page
         if is_staff_page:
@@ -857,52 +1103,96 @@ class StaffCrawler:
             ]
             is_strong_staff_page = any(kw in url_lower for kw in strong_staff_keywords)
             
+            # Extract with the tree and page text parsed here; the near-duplicate fingerprint
+            # reuses both (SimHash of the text, emails of the extracted contacts)
+            page_text = _collect_page_text(tree)
+            if result.streamed:
+                extracted, page_hash = stream.contacts, stream.content_hash
+            else:
+                extracted = extract_contacts_from_html(html, url, tree=tree, page_text=page_text)
+                page_hash = content_hash(html)
+            
+            # Skip near-duplicates of a staff page already seen (print views, language variants)
+            # before spending an AI call on them or recording their contacts
+            page_fp = fingerprint(page_text, (c.Email for c in extracted))
+            original = self.dedup.find_duplicate(page_fp)
+            if original:
+                self.dedup.skip(original)
+                if DEBUG:
+                    crawl_log.debug(f"   ♊ Near-duplicate of {original[:80]}, skipped: {url[:80]}")
+                return
+            self.dedup.add(url, page_fp)
+            
             if self.use_ai and self.client and not is_strong_staff_page:
                 # Get page text preview for AI
-                page_text_preview = _collect_page_text(tree)[:2000]
+                page_text_preview = page_text[:2000]
                 is_icp_relevant = await ai_filter_staff_page(url, title, page_text_preview, self.client, self.ai_model)
                 
                 if not is_icp_relevant:
                     if DEBUG:
-                        print(f"   ❌ AI filtered out: {url} (not ICP-relevant)")
+                        crawl_log.debug(f"   ❌ AI filtered out: {url} (not ICP-relevant)")
                     self.ai_filtered_count += 1
                     return  # Skip this page - not ICP-relevant
             elif is_strong_staff_page and DEBUG:
-                print(f"   🎯 Strong staff keyword detected - bypassing AI filter")
+                crawl_log.debug(f"   🎯 Strong staff keyword detected - bypassing AI filter")
             
             if DEBUG:
-                print(f"   ✅ STAFF PAGE FOUND: {url}")
+                crawl_log.debug(f"   ✅ STAFF PAGE FOUND: {url}")
             self.found_pages.append(url)
-            extracted = extract_contacts_from_html(html, url)
-            self.contacts.extend(extracted)
+            self._record_page(url, result.etag, result.last_modified, page_hash, extracted)
+            self.dedup.record_contacts(url, len(extracted))
             if DEBUG:
-                print(f"      → Extracted {len(extracted)} contacts")
-        elif is_department_page and depth < MAX_CRAWL_DEPTH:
+                crawl_log.debug(f"      → Extracted {len(extracted)} contacts")
+        elif is_department_page and depth < self.budget.max_depth:
             # Department/institute homepage - continue exploring for staff pages
             if DEBUG:
-                print(f"   🏛️  DEPARTMENT PAGE - will explore for staff links: {url}")
+                crawl_log.debug(f"   🏛️  DEPARTMENT PAGE - will explore for staff links: {url}")
             # Don't extract contacts here - wait for actual staff pages within department
-        elif is_subdomain_homepage and depth < MAX_CRAWL_DEPTH:
+        elif is_subdomain_homepage and depth < self.budget.max_depth:
             # Subdomain homepage - continue exploring but don't extract contacts yet
             if DEBUG:
-                print(f"   🏠 Subdomain homepage - will explore for staff pages: {url}")
+                crawl_log.debug(f"   🏠 Subdomain homepage - will explore for staff pages: {url}")
 
         # Find further links and crawl them
         tasks = []
         
-        # At depth 0, first crawl AI-discovered URLs
+        # At depth 0, first crawl sitemap seeds (see _seed_frontier)
+        if depth == 0:
+            seeds = [u for u in self.seed_urls if u not in self.visited]
+            for seed_url in seeds:
+                tasks.append(self._crawl_recursive(seed_url, session, depth + 1))
+            
+            if DEBUG and seeds:
+                crawl_log.debug(f"   🗺️  Queuing {len(seeds)} sitemap URLs for crawling")
+        
+        # ... and AI-discovered URLs
         if depth == 0 and self.use_ai:
-            ai_queued = [u for u in self.queued if u not in self.visited]
+            ai_queued = [u for u in self.queued if u not in self.visited and u in self.ai_discovered_urls]
             for ai_url in ai_queued:
                 if ai_url not in self.visited:
                     tasks.append(self._crawl_recursive(ai_url, session, depth + 1))
             
             if DEBUG and ai_queued:
-                print(f"   🤖 Queuing {len(ai_queued)} AI-discovered URLs for crawling")
+                crawl_log.debug(f"   🤖 Queuing {len(ai_queued)} AI-discovered URLs for crawling")
         
+        hrefs = stream.links if result.streamed else [link.attrs.get("href", "") for link in tree.css("a")]
+
+        # Paginated directory: enumerate every page of the listing up front and fetch them
+        # together at this depth (concurrency is bounded by the session's connection limit)
+        pagination_tasks = []
+        if is_staff_page:
+            for page_url in detect_pagination(url, hrefs):
+                if page_url in self.visited or page_url in self.queued or self.dedup.is_claimed_variant(page_url):
+                    continue
+                if not is_same_domain(self.start_url, page_url) or not allowed_url(page_url):
+                    continue
+                self.queued.add(page_url)
+                pagination_tasks.append(self._crawl_recursive(page_url, session, depth))
+            if DEBUG and pagination_tasks:
+                crawl_log.debug(f"   📑 Paginated directory: fetching {len(pagination_tasks)} more pages of {url[:80]}")
+
         # Also crawl keyword-discovered links (fallback/supplement)
-        for link in tree.css("a"):
-            href = link.attrs.get("href", "")
+        for href in hrefs:
             if not href:
                 continue
 
@@ -914,6 +1204,8 @@ class StaffCrawler:
                 continue
             if full_url in self.visited or full_url in self.queued:
                 continue
+            if self.dedup.is_claimed_variant(full_url):
+                continue
 
             # Mark as queued to avoid duplicate tasks
             self.queued.add(full_url)
@@ -921,24 +1213,31 @@ class StaffCrawler:
         
         if DEBUG and depth == 0:
             ai_count = len(self.ai_discovered_urls) if self.use_ai else 0
-            keyword_count = len(tasks) - ai_count
-            if self.use_ai and ai_count > 0:
-                print(f"   📋 Total URLs to crawl: {len(tasks)} (AI: {ai_count}, Keywords: {keyword_count})")
+            keyword_count = len(tasks) - ai_count - len(seeds)
+            if seeds:
+                crawl_log.debug(f"   📋 Total URLs to crawl: {len(tasks)} (Sitemap: {len(seeds)}, AI: {ai_count}, Keywords: {keyword_count})")
+            elif self.use_ai and ai_count > 0:
+                crawl_log.debug(f"   📋 Total URLs to crawl: {len(tasks)} (AI: {ai_count}, Keywords: {keyword_count})")
             else:
-                print(f"   📋 Found {len(tasks)} child URLs to crawl from homepage")
+                crawl_log.debug(f"   📋 Found {len(tasks)} child URLs to crawl from homepage")
         
-        # Execute tasks in batches to avoid overwhelming the server
-        # Even though CONNECTIONS limits concurrent HTTP requests, having too many
-        # queued tasks can cause timeouts and memory issues
+        if pagination_tasks:
+            await asyncio.gather(*pagination_tasks, return_exceptions=True)
+
+        # Execute tasks in batches: the load on the server is paced per host by
+        # HOST_LIMITERS (fetch_page), batching keeps the number of queued tasks down
         if tasks:
-            BATCH_SIZE = 5  # Reduced from 10 to 5 - smaller batches are gentler on servers
-            for i in range(0, len(tasks), BATCH_SIZE):
-                batch = tasks[i:i + BATCH_SIZE]
-                await asyncio.gather(*batch, return_exceptions=True)
-                # Longer delay between batches to be polite to the server
-                # This gives the server time to recover between bursts
-                if i + BATCH_SIZE < len(tasks):
-                    await asyncio.sleep(2.0)  # Increased from 0.5s to 2s
+            BATCH_SIZE = 5
+            i = 0
+            try:
+                for i in range(0, len(tasks), BATCH_SIZE):
+                    batch = tasks[i:i + BATCH_SIZE]
+                    await asyncio.gather(*batch, return_exceptions=True)
+            except asyncio.CancelledError:
+                # Deadline reached (see process_university): drop the batches not started yet
+                for task in tasks[i + BATCH_SIZE:]:
+                    task.close()
+                raise
 
             # ----------------------------------------
 # CONTACT EXTRACTION (HTML → structured contacts)
@@ -955,65 +1254,130 @@ def _join_clean(parts):
     return " ".join(p for p in (parts or []) if p).strip()
 
 
+PAGE_TEXT_MAX_CHARS = 15000  # page context kept for AI evaluation (increased from 12000)
+
+
+def _bounded_text(node, limit: int) -> tuple:
+    """
+    Same text as _text(node), but stop reading once more than ``limit`` characters were read.
+    Returns (text, complete).
+    """
+    parts = []
+    size = 0
+    # Depth-first walk of the subtree (Node.traverse() would continue past the node's siblings)
+    node_id = node.mem_id
+    current = node.child
+    while current is not None:
+        if current.tag == "-text":
+            piece = (current.text_content or "").strip()
+            parts.append(piece)
+            size += len(piece) + 1
+            if size > limit:
+                return " ".join(parts), False
+        if current.child is not None:
+            current = current.child
+            continue
+        while current.next is None:
+            current = current.parent
+            if current is None or current.mem_id == node_id:
+                return " ".join(parts), True
+        current = current.next
+    return " ".join(parts), True
+
+
+def _clean_page_text(text: str) -> str:
+    """Remove navigation/footer boilerplate and normalize whitespace."""
+    return WHITESPACE_RE.sub(" ", PAGE_NOISE_RE.sub("", text)).strip()
+
+
+def _within(node, node_ids: Set[int]) -> bool:
+    """True if the node or one of its ancestors is in node_ids."""
+    while node is not None:
+        if node.mem_id in node_ids:
+            return True
+        node = node.parent
+    return False
+
+
 def _collect_page_text(tree: HTMLParser) -> str:
     """
     Collect page text for AI evaluation, including hidden content (tabs, accordions, etc.).
-    The selectolax .text() method extracts ALL text from HTML regardless of CSS visibility,
+    The selectolax text extraction reads ALL text from HTML regardless of CSS visibility,
     so this captures content even if it's hidden via display:none, visibility:hidden, etc.
+
+    Each region's text is read once: regions nested in an already collected region
+    are skipped and an enclosing region (e.g. body) replaces the ones inside it.
+    Regions are cleaned as they are read and reading stops once
+    PAGE_TEXT_MAX_CHARS are collected, so the cost is bounded for huge pages.
     """
-    big_chunks = []
-    
-    # Priority 1: Main content areas
-    for sel in ["main", "article", ".content", "#content", ".main-content"]:
-        n = tree.css_first(sel)
-        if n:
-            t = _text(n)
-            if t and len(t) > 300:
-                big_chunks.append(t)
-    
-    # Priority 2: Tab content (often hidden initially but contains important info)
-    # Common tab/accordion selectors across different frameworks
-    tab_selectors = [
-        ".tab-content", ".tabs", "[role='tabpanel']", ".tab-pane",  # Bootstrap, generic tabs
-        ".accordion", ".collapse", "[data-toggle='collapse']",  # Accordions
-        ".panel-body", ".panel-content",  # Panel layouts
-        "[hidden]", ".hidden-content", ".toggle-content",  # Hidden sections
-    ]
-    for sel in tab_selectors:
-        for node in tree.css(sel):
-            t = _text(node)
-            if t and len(t) > 200:  # Lower threshold for hidden content
-                big_chunks.append(t)
-    
-    # Priority 3: Container and body (if we didn't get enough content)
-    if len(" ".join(big_chunks)) < 1000:
-        for sel in [".container", "body"]:
+    regions = []  # (node, cleaned text, raw length) in collection order
+    collected_ids: Set[int] = set()
+    size = 0  # length of the joined cleaned texts
+    raw_size = 0  # length of the joined raw region texts, for the "enough content" check
+
+    def add_region(node, min_len: int) -> bool:
+        """Read one region if long enough; returns True once the budget is used up."""
+        nonlocal size, raw_size
+        if _within(node, collected_ids):
+            return False
+        # A region enclosing earlier ones (e.g. body) replaces them
+        inner = [r for r in regions if _within(r[0], {node.mem_id})]
+        used = size - sum(len(r[1]) + 1 for r in inner)
+        need = PAGE_TEXT_MAX_CHARS - max(used, 0)
+        limit = max(need + 500, 1000)
+        while True:
+            raw, complete = _bounded_text(node, limit)
+            if len(raw) <= min_len:
+                return False
+            cleaned = _clean_page_text(raw)
+            if complete or len(cleaned) >= need:
+                break
+            limit *= 2  # mostly whitespace/boilerplate so far: read further
+        for r in inner:
+            regions.remove(r)
+            collected_ids.discard(r[0].mem_id)
+        regions.append((node, cleaned, len(raw)))
+        collected_ids.add(node.mem_id)
+        texts = [r[1] for r in regions if r[1]]
+        size = sum(map(len, texts)) + len(texts) - 1 if texts else 0
+        raw_size = sum(r[2] for r in regions) + len(regions) - 1
+        return size >= PAGE_TEXT_MAX_CHARS
+
+    def collect() -> None:
+        # Priority 1: Main content areas
+        for sel in ["main", "article", ".content", "#content", ".main-content"]:
             n = tree.css_first(sel)
-            if n:
-                t = _text(n)
-                if t and len(t) > 500:
-                    big_chunks.append(t)
-    
+            if n and add_region(n, 300):
+                return
+
+        # Priority 2: Tab content (often hidden initially but contains important info)
+        # Common tab/accordion selectors across different frameworks
+        tab_selectors = [
+            ".tab-content", ".tabs", "[role='tabpanel']", ".tab-pane",  # Bootstrap, generic tabs
+            ".accordion", ".collapse", "[data-toggle='collapse']",  # Accordions
+            ".panel-body", ".panel-content",  # Panel layouts
+            "[hidden]", ".hidden-content", ".toggle-content",  # Hidden sections
+        ]
+        for sel in tab_selectors:
+            for node in tree.css(sel):
+                if add_region(node, 200):  # Lower threshold for hidden content
+                    return
+
+        # Priority 3: Container and body (if we didn't get enough content)
+        if raw_size < 1000:
+            for sel in [".container", "body"]:
+                n = tree.css_first(sel)
+                if n and add_region(n, 500):
+                    return
+
+    collect()
+
     # Fallback: Get everything from root
-    if not big_chunks:
-        big_chunks.append(_text(tree.root)[:10000])
-    
-    # Remove navigation and footer noise
-    full_text = " ".join(big_chunks)
-    
-    # Filter out common navigation/footer patterns
-    noise_patterns = [
-        r'Cookie\s+(?:Policy|Notice|Settings)',
-        r'Privacy\s+Policy',
-        r'Terms\s+(?:of\s+)?(?:Service|Use)',
-        r'Copyright\s+©',
-        r'All\s+rights\s+reserved',
-    ]
-    for pattern in noise_patterns:
-        full_text = re.sub(pattern, '', full_text, flags=re.IGNORECASE)
-    
-    # Normalize whitespace and limit length
-    return re.sub(r"\s+", " ", full_text).strip()[:15000]  # Increased from 12000 to 15000
+    if not collected_ids:
+        raw, _ = _bounded_text(tree.root, 10000)
+        return _clean_page_text(raw[:10000])[:PAGE_TEXT_MAX_CHARS]
+
+    return " ".join(r[1] for r in regions if r[1])[:PAGE_TEXT_MAX_CHARS]
 
 
 def _extract_emails_from_tree(tree: HTMLParser) -> List[str]:
@@ -1036,13 +1400,8 @@ def _extract_emails_from_tree(tree: HTMLParser) -> List[str]:
         if any(symbol in link_text for symbol in ['∂', '[at]', '(at)', ' at ']):
             # Extract just the email portion using regex patterns
             # Pattern: word(s) + obfuscation + word(s)
-            email_patterns = [
-                r'([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)\s*∂\s*([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)',
-                r'([a-zA-Z.]+)\s*\[at\]\s*([a-zA-Z.]+)',
-                r'([a-zA-Z.]+)\s*\(at\)\s*([a-zA-Z.]+)',
-            ]
-            for pattern in email_patterns:
-                matches = re.findall(pattern, link_text, flags=re.IGNORECASE)
+            for pattern in OBFUSCATED_EMAIL_IN_LINK_RES:
+                matches = pattern.findall(link_text)
                 for match in matches:
                     obfuscated = f"{match[0]} @ {match[1]}"
                     cleaned = clean_email(obfuscated)
@@ -1055,13 +1414,8 @@ def _extract_emails_from_tree(tree: HTMLParser) -> List[str]:
         # Check if contains obfuscation symbols - extract just the email portion
         if any(symbol in td_text for symbol in ['∂', '[at]', '(at)', ' at ']):
             # Use regex to extract just the email portion
-            email_patterns = [
-                r'([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)\s*∂\s*(?:does-not-exist\.)?\s*([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)',
-                r'([a-zA-Z.]+)\s*\[at\]\s*([a-zA-Z.]+)',
-                r'([a-zA-Z.]+)\s*\(at\)\s*([a-zA-Z.]+)',
-            ]
-            for pattern in email_patterns:
-                matches = re.findall(pattern, td_text, flags=re.IGNORECASE)
+            for pattern in OBFUSCATED_EMAIL_IN_NODE_RES:
+                matches = pattern.findall(td_text)
                 for match in matches:
                     obfuscated = f"{match[0]} @ {match[1]}"
                     cleaned = clean_email(obfuscated)
@@ -1070,7 +1424,7 @@ def _extract_emails_from_tree(tree: HTMLParser) -> List[str]:
 
     # 4) Standard email regex patterns
     body_text = _text(tree.root)
-    candidates = re.findall(EMAIL_REGEX, body_text, flags=re.I)
+    candidates = EMAIL_RE.findall(body_text)
     for cand in candidates:
         cleaned = clean_email(cand)
         if cleaned:
@@ -1078,14 +1432,8 @@ def _extract_emails_from_tree(tree: HTMLParser) -> List[str]:
     
     # 5) Look for obfuscated patterns in full page text
     # Pattern: word(s) + obfuscation symbol + word(s)
-    obfuscated_patterns = [
-        r'([a-zA-Z]+(?:\s+[a-zA-Z]+)?)\s*∂\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)?)',  # firstname lastname ∂ domain tld
-        r'([a-zA-Z.]+)\s*\[at\]\s*([a-zA-Z.]+)',  # name [at] domain
-        r'([a-zA-Z.]+)\s*\(at\)\s*([a-zA-Z.]+)',  # name (at) domain
-    ]
-    
-    for pattern in obfuscated_patterns:
-        matches = re.findall(pattern, body_text, flags=re.IGNORECASE)
+    for pattern in OBFUSCATED_EMAIL_IN_PAGE_RES:
+        matches = pattern.findall(body_text)
         for match in matches:
             # Reconstruct email-like string and clean it
             obfuscated = f"{match[0]} @ {match[1]}"
@@ -1096,18 +1444,115 @@ def _extract_emails_from_tree(tree: HTMLParser) -> List[str]:
     return list(found)
 
 
-def _looks_like_person_block(n: HTMLParser) -> bool:
+# Class/id/role/aria-label substrings that mark a div as a person container
+PERSON_BLOCK_SIGNALS = ("person", "people", "staff", "mitarbeiter", "team", "faculty", "researcher", "professor")
+
+_SIMPLE_SELECTOR_RE = re.compile(r"^(?:\.([\w-]+)|\[([\w-]+)(?:([*^$]?=)['\"]?([^'\"\]]*)['\"]?)?\])$")
+
+
+def _looks_like_person_block(n: HTMLParser, attrs: dict = None) -> bool:
     """
     Heuristic to identify a "person card" container.
     """
-    classes = (n.attributes.get("class") or "").lower()
-    role = (n.attributes.get("role") or "").lower()
-    aria = (n.attributes.get("aria-label") or "").lower()
-    idv = (n.attributes.get("id") or "").lower()
+    if attrs is None:
+        attrs = n.attributes
+    blob = " ".join([
+        (attrs.get("class") or ""), (attrs.get("role") or ""),
+        (attrs.get("aria-label") or ""), (attrs.get("id") or "")
+    ]).lower()
+    return any(s in blob for s in PERSON_BLOCK_SIGNALS)
+
+
+def _compile_card_selectors(selectors: List[str]):
+    """
+    Split STAFF_CARD_SELECTORS into lookups usable during a single tree walk.
+
+    Returns ``(class_index, attr_matchers, fallback)``: ``.class`` selectors map
+    class name -> selector index, ``[attr]`` / ``[attr*='value']`` selectors become
+    ``(index, attr, predicate)`` and anything else is kept for ``css_matches``.
+    """
+    class_index: Dict[str, int] = {}
+    attr_matchers = []
+    fallback = []
+    checks = {
+        None: lambda v, value: True,
+        "=": lambda v, value: v == value,
+        "*=": lambda v, value: value in v,
+        "^=": lambda v, value: v.startswith(value),
+        "$=": lambda v, value: v.endswith(value),
+    }
+    for idx, selector in enumerate(selectors):
+        m = _SIMPLE_SELECTOR_RE.match(selector.strip())
+        if not m:
+            fallback.append((idx, selector))
+            continue
+        cls, attr, op, value = m.groups()
+        if cls:
+            class_index.setdefault(cls, idx)
+        else:
+            attr_matchers.append((idx, attr, value, checks[op]))
+    return class_index, attr_matchers, fallback
+
+
+_CARD_CLASSES, _CARD_ATTR_MATCHERS, _CARD_FALLBACK_SELECTORS = _compile_card_selectors(STAFF_CARD_SELECTORS)
+
+
+def _card_selector_index(node, attrs: dict):
+    """Index of the first STAFF_CARD_SELECTORS entry matching the node (None if none)."""
+    idx = None
+    classes = attrs.get("class")
+    if classes:
+        for cls in classes.split():
+            i = _CARD_CLASSES.get(cls)
+            if i is not None and (idx is None or i < idx):
+                idx = i
+    for i, attr, value, check in _CARD_ATTR_MATCHERS:
+        if (idx is None or i < idx) and attr in attrs and check(attrs[attr] or "", value):
+            idx = i
+    for i, selector in _CARD_FALLBACK_SELECTORS:
+        if (idx is None or i < idx) and node.css_matches(selector):
+            idx = i
+    return idx
+
+
+def _find_person_nodes(tree: HTMLParser) -> list:
+    """
+    Candidate person containers, found in a single walk over the element tree.
+
+    Each element is classified once: staff card selector match, person-like div,
+    or table row with an email indicator and a name. Candidates keep the order
+    the separate passes used to produce (selector by selector, then divs, then
+    rows; document order within each) and every node appears only once.
+    """
+    by_selector = [[] for _ in STAFF_CARD_SELECTORS]
+    person_divs = []
+    person_rows = []
+
+    for node in tree.root.traverse():
+        attrs = node.attributes
+        if attrs:
+            idx = _card_selector_index(node, attrs)
+            if idx is not None:
+                by_selector[idx].append(node)
+                continue
+            tag = node.tag
+            if tag == "div":
+                if _looks_like_person_block(node, attrs):
+                    person_divs.append(node)
+                continue
+        else:
+            tag = node.tag
+        if tag == "tr":
+            person_rows.append(node)
+
+    # Table rows need their text: keep those with an email indicator and a name-like string
+    rows = []
+    for tr in person_rows:
+        tr_text = _text(tr)
+        if any(symbol in tr_text for symbol in ['∂', '@', '[at]', '(at)']) and NAME_LIKE_RE.search(tr_text):
+            rows.append(tr)
 
-    signals = ["person", "people", "staff", "mitarbeiter", "team", "faculty", "researcher", "professor"]
-    blob = " ".join([classes, role, aria, idv])
-    return any(s in blob for s in signals)
+    return [n for bucket in by_selector for n in bucket] + person_divs + rows
 
 
 def _guess_name_from_node(n: HTMLParser) -> str:
@@ -1195,30 +1640,13 @@ def _extract_academic_title(name: str) -> tuple:
     if not name:
         return ("", name)
     
-    # Academic title patterns (order matters - check longer patterns first)
-    # Allow titles to be followed by space, comma, or end of string
-    title_patterns = [
-        r'^(Prof\.\s*Dr\.-Ing\.|Professor\s*Dr\.-Ing\.)(?:\s+|,\s*|$)',
-        r'^(Prof\.\s*Dr\.|Professor\s*Dr\.)(?:\s+|,\s*|$)',
-        r'^(Dr\.-Ing\.|Dr\.\s*Ing\.)(?:\s+|,\s*|$)',
-        r'^(Dr\.\s*rer\.\s*nat\.|Dr\.\s*rer\.nat\.)(?:\s+|,\s*|$)',
-        r'^(Dr\.\s*phil\.)(?:\s+|,\s*|$)',
-        r'^(M\.Sc\.|M\.S\.|MSc)(?:\s+|,\s*|$)',
-        r'^(B\.Sc\.|B\.S\.|BSc)(?:\s+|,\s*|$)',
-        r'^(Dipl\.-Ing\.|Diplom-Ingenieur)(?:\s+|,\s*|$)',
-        r'^(Prof\.)(?:\s+|,\s*|$)',
-        r'^(Dr\.)(?:\s+|,\s*|$)',
-        r'^(Professor)(?:\s+|,\s*|$)',
-        r'^(PhD)(?:\s+|,\s*|$)',
-    ]
-    
-    for pattern in title_patterns:
-        match = re.search(pattern, name, re.IGNORECASE)
-        if match:
-            title = match.group(1).strip()
-            # Remove the title and the separator (space or comma)
-            clean_name = re.sub(pattern, '', name, flags=re.IGNORECASE).strip()
-            return (title, clean_name)
+    # Academic title prefixes (longer forms first), followed by space, comma, or end of string
+    match = ACADEMIC_TITLE_RE.match(name)
+    if match:
+        title = match.group("title").strip()
+        # Remove the title and the separator (space or comma)
+        clean_name = name[match.end():].strip()
+        return (title, clean_name)
     
     return ("", name)
 
@@ -1244,9 +1672,18 @@ def _split_title_and_role(title_role_str: str) -> tuple:
     return (title, role)
 
 
+# Field classification results, shared by _guess_field_from_text and _detect_university_field.
+# Card texts, shared blocks and page texts repeat across the pages of one site.
+FIELD_MEMO = LRUMemo(FIELD_CACHE_SIZE)
+
+
 def _guess_field_from_text(txt: str) -> str:
-    """Detect field of study from text content using keyword matching."""
+    """Detect field of study from text content using keyword matching (memoized)."""
     txt_l = txt.lower()
+    return FIELD_MEMO.get_or_compute(("text", text_key(txt_l)), lambda: _score_field_from_text(txt_l))
+
+
+def _score_field_from_text(txt_l: str) -> str:
     field_scores = {}
     
     # Count keyword matches for each field
@@ -1271,7 +1708,15 @@ def _detect_university_field(url: str, page_title: str, page_text: str) -> str:
     
     Returns a comma-separated string of detected fields (up to 2 primary fields).
     """
-    combined_text = f"{url} {page_title} {page_text[:3000]}".lower()
+    url_lower = url.lower()
+    title_lower = page_title.lower()
+    text_lower = page_text[:3000].lower()
+    key = ("university", text_key(url_lower, title_lower, text_lower))
+    return FIELD_MEMO.get_or_compute(key, lambda: _score_university_field(url_lower, title_lower, text_lower))
+
+
+def _score_university_field(url_lower: str, title_lower: str, text_lower: str) -> str:
+    combined_text = f"{url_lower} {title_lower} {text_lower}"
     field_scores = {}
     
     # Score each field based on keyword frequency
@@ -1283,8 +1728,6 @@ def _detect_university_field(url: str, page_title: str, page_text: str) -> str:
             score += count
         
         # Bonus points for field keywords in URL or title (strong signals)
-        url_lower = url.lower()
-        title_lower = page_title.lower()
         for kw in kws[:5]:  # Check top 5 keywords per field
             if kw in url_lower:
                 score += 10
@@ -1311,45 +1754,89 @@ def _detect_university_field(url: str, page_title: str, page_text: str) -> str:
     return ""
 
 
-def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
-    tree = HTMLParser(html)
-    page_text = _collect_page_text(tree)
-    page_title = (tree.css_first("title").text(strip=True) if tree.css_first("title") else "")
-    
-    # Detect university/department field of study from page content
-    university_field = _detect_university_field(page_url, page_title, page_text)
+def _index_emails_in_blocks(texts: List[str], emails: List[str]) -> Dict[str, List[int]]:
+    """
+    Map each email to the indexes of the texts that contain it, in one pass.
 
-    contacts: List[Dict] = []
+    Instead of testing every email against every text, each '@' in a text is
+    looked up against the emails' local parts (grouped by domain and length),
+    so the cost grows with the amount of text, not with emails x texts.
+    Matching is the same case-sensitive substring test as ``email in text``.
+    """
+    # domain part -> {local part length -> {local part: email}}
+    by_domain: Dict[str, Dict[int, Dict[str, str]]] = {}
+    for em in emails:
+        local, sep, domain = em.partition("@")
+        if sep:
+            by_domain.setdefault(domain, {}).setdefault(len(local), {})[local] = em
+
+    index: Dict[str, List[int]] = {}
+    for idx, t in enumerate(texts):
+        found = set()
+        pos = t.find("@")
+        while pos != -1:
+            for domain, locals_by_len in by_domain.items():
+                if not t.startswith(domain, pos + 1):
+                    continue
+                for length, locals_ in locals_by_len.items():
+                    if length <= pos:
+                        em = locals_.get(t[pos - length:pos])
+                        if em is not None:
+                            found.add(em)
+            pos = t.find("@", pos + 1)
+        for em in found:
+            index.setdefault(em, []).append(idx)
+    return index
+
+
+def _contact_from_structured(person: StructuredPerson, page_url: str, university_field: str,
+                             context_text: str):
+    """Contact for a schema.org/hCard person (None for admin addresses or records without contact details)."""
+    email = clean_email(person.email) if person.email else ""
+    if email and not is_academic_email(email):
+        return None
+    if not email and not (person.name and (person.job_title or person.affiliation)):
+        return None  # e.g. a CMS author/publisher node ("Webredaktion"): not a staff member
+
+    # jobTitle may carry the academic title ("Prof. Dr., Head of ..."), the name too
+    academic_title, role = _split_title_and_role(person.job_title) if person.job_title else ("", "")
+    name_title, name = _extract_academic_title(person.name) if person.name else ("", "")
+    title = person.honorific_prefix or academic_title or name_title
+    if person.affiliation and person.affiliation not in role:
+        role = f"{role}, {person.affiliation}" if role else person.affiliation
+
+    classify_text = person.text or " ".join(p for p in (person.job_title, person.affiliation) if p)
+    return Contact(
+        Full_name=name,
+        Email=email,
+        Title=title,
+        Role=role,
+        Field_of_study=_guess_field_from_text(classify_text) if classify_text else "",
+        University_Field_of_Study=university_field,
+        Source_URL=page_url,
+        page_text=context_text,  # Always use full page context for AI
+    )
+
+
+def _contacts_from_structured_data(tree: HTMLParser, page_url: str, university_field: str,
+                                   context_text: str, per_node_emails: Set[str]) -> tuple:
+    """Contacts from JSON-LD/microdata/hCard people, plus the mem_ids of the nodes they cover."""
+    contacts: List[Contact] = []
+    structured_people, covered_nodes = extract_structured_people(tree)
+    for person in structured_people:
+        contact = _contact_from_structured(person, page_url, university_field, context_text)
+        if contact is None or (contact.Email and contact.Email in per_node_emails):
+            continue
+        if contact.Email:
+            per_node_emails.add(contact.Email)
+        contacts.append(contact)
+    return contacts, covered_nodes
 
-    # 1) Try structured "person cards" (common in KIT/DE sites)
-    candidate_nodes = []
-    for sel in STAFF_CARD_SELECTORS:
-        candidate_nodes.extend(tree.css(sel))
-    # Also add generic divs that look like person blocks (class/role heuristics)
-    for div in tree.css("div"):
-        if _looks_like_person_block(div):
-            candidate_nodes.append(div)
-    
-    # Also check table rows (KIT and many German universities use tables)
-    for tr in tree.css("tr"):
-        tr_text = _text(tr)
-        # Check if row contains obfuscated email or looks like a person entry
-        has_email_indicator = any(symbol in tr_text for symbol in ['∂', '@', '[at]', '(at)'])
-        has_name_like = re.search(r'\b[A-ZÄÖÜ][a-zäöüß]+(?:\s+[A-ZÄÖÜ][a-zäöüß]+)+\b', tr_text)
-        if has_email_indicator and has_name_like:
-            candidate_nodes.append(tr)
-
-    # Deduplicate nodes by id/ref
-    seen_ids = set()
-    person_nodes = []
-    for n in candidate_nodes:
-        key = id(n)
-        if key not in seen_ids:
-            seen_ids.add(key)
-            person_nodes.append(n)
-
-    # 2) Extract from person nodes
-    per_node_emails = set()
+
+def _contacts_from_person_nodes(person_nodes: list, page_url: str, university_field: str,
+                                 context_text: str, per_node_emails: Set[str]) -> List[Contact]:
+    """Contacts from person cards / table rows; emails already taken are skipped and recorded."""
+    contacts: List[Contact] = []
     for node in person_nodes:
         name = _guess_name_from_node(node)
         title = _guess_title_from_node(node)
@@ -1383,11 +1870,11 @@ def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
                             # Remove the email from parent text to avoid matching it
                             parent_text = parent_text.replace(cleaned, "").replace(href, "")
                             # Look for a name pattern (2-4 capitalized words)
-                            name_match = re.search(r"([A-ZÄÖÜ][a-zäöüß\-']+(?:[\s,]+[A-ZÄÖÜ][a-zäöüß\-']+){1,3})", parent_text)
+                            name_match = LOCAL_NAME_RE.search(parent_text)
                             if name_match:
                                 potential_name = name_match.group(1).strip(", ")
                                 # Verify it looks like a person name (not too long, no numbers)
-                                if len(potential_name.split()) <= 5 and not re.search(r'\d', potential_name):
+                                if len(potential_name.split()) <= 5 and not DIGIT_RE.search(potential_name):
                                     local_name = potential_name
                     
                     emails_with_context.append((cleaned, local_name))
@@ -1397,13 +1884,8 @@ def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
         
         # Check for obfuscated email patterns first - extract just email portion
         if any(symbol in node_text for symbol in ['∂', '[at]', '(at)', ' at ']):
-            email_patterns = [
-                r'([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)\s*∂\s*(?:does-not-exist\.)?\s*([a-zA-ZäöüÄÖÜß]+(?:\s+[a-zA-ZäöüÄÖÜß]+)?)',
-                r'([a-zA-Z.]+)\s*\[at\]\s*([a-zA-Z.]+)',
-                r'([a-zA-Z.]+)\s*\(at\)\s*([a-zA-Z.]+)',
-            ]
-            for pattern in email_patterns:
-                matches = re.findall(pattern, node_text, flags=re.IGNORECASE)
+            for pattern in OBFUSCATED_EMAIL_IN_NODE_RES:
+                matches = pattern.findall(node_text)
                 for match in matches:
                     obfuscated = f"{match[0]} @ {match[1]}"
                     cleaned = clean_email(obfuscated)
@@ -1412,7 +1894,7 @@ def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
                             emails_with_context.append((cleaned, ""))
         
         # Also check for standard email patterns
-        for m in re.findall(EMAIL_REGEX, node_text, flags=re.I):
+        for m in EMAIL_RE.findall(node_text):
             cleaned = clean_email(m)
             if cleaned and is_academic_email(cleaned):  # Filter admin emails
                 # Check if we already have this email from mailto links
@@ -1430,16 +1912,15 @@ def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
                 academic_title = name_title
                 name = clean_name
             
-            contacts.append({
-                "Full_name": name or "",
-                "Email": "",
-                "Title": academic_title,
-                "Role": role,
-                "Field_of_study": _guess_field_from_text(node_text) or "",
-                "University_Field_of_Study": university_field,
-                "page_text": page_text[:10000],  # Always use full page context for AI
-                "source_url": page_url,
-            })
+            contacts.append(Contact(
+                Full_name=name or "",
+                Title=academic_title,
+                Role=role,
+                Field_of_study=_guess_field_from_text(node_text) or "",
+                University_Field_of_Study=university_field,
+                Source_URL=page_url,
+                page_text=context_text,  # Always use full page context for AI
+            ))
         else:
             for em, local_name in emails_with_context:
                 if em in per_node_emails:
@@ -1470,76 +1951,91 @@ def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
                     academic_title = name_title
                     final_name = clean_name
 
-                contacts.append({
-                    "Full_name": final_name or "",
-                    "Email": em,
-                    "Title": academic_title,
-                    "Role": role,
-                    "Field_of_study": _guess_field_from_text(node_text) or "",
-                    "University_Field_of_Study": university_field,
-                    "page_text": page_text[:10000],  # Always use full page context for AI
-                    "source_url": page_url,
-                })
-
-    # 3) If no person-cards detected, fall back to page-level email/name mining
-    if not contacts:
-        page_emails = _extract_emails_from_tree(tree)
-        # Filter out generic admin emails
-        page_emails = [em for em in page_emails if is_academic_email(em)]
-        # Try to match nearby name/title snippets around emails (simple heuristic)
-        if page_emails:
-            # Pull short paragraphs/rows likely to contain profiles
-            blocks = tree.css("p, li, tr, .row, .teaser, .card, .media, .grid, .list, .vcard")
-            for em in page_emails:
-                best_block = None
-                best_score = -1
-                for b in blocks[:400]:
-                    t = _text(b)
-                    if not t or em not in t:
-                        continue
+                contacts.append(Contact(
+                    Full_name=final_name or "",
+                    Email=em,
+                    Title=academic_title,
+                    Role=role,
+                    Field_of_study=_guess_field_from_text(node_text) or "",
+                    University_Field_of_Study=university_field,
+                    Source_URL=page_url,
+                    page_text=context_text,  # Always use full page context for AI
+                ))
+    return contacts
+
+
+def _contacts_from_page_emails(tree: HTMLParser, page_url: str, university_field: str,
+                               context_text: str, max_blocks: Optional[int] = 400,
+                               known_emails: Set[str] = frozenset()) -> List[Contact]:
+    """Page-level fallback: pair each academic email with the best nearby text block (except `known_emails`)."""
+    contacts: List[Contact] = []
+    page_emails = _extract_emails_from_tree(tree)
+    # Filter out generic admin emails and those already read from structured data
+    page_emails = [em for em in page_emails if is_academic_email(em) and em.lower() not in known_emails]
+    # Try to match nearby name/title snippets around emails (simple heuristic)
+    if page_emails:
+        # Pull short paragraphs/rows likely to contain profiles; text and score each block once
+        blocks = tree.css("p, li, tr, .row, .teaser, .card, .media, .grid, .list, .vcard")[:max_blocks]
+        block_texts = [_text(b) for b in blocks]
+        blocks_by_email = _index_emails_in_blocks(block_texts, page_emails)
+        block_scores = {}
+        block_fields = {}
+        for em in page_emails:
+            best_idx = None
+            best_score = -1
+            for idx in blocks_by_email.get(em, ()):
+                score = block_scores.get(idx)
+                if score is None:
+                    t = block_texts[idx]
                     score = 0
-                    if re.search(r"\bprof|research|lectur|wissenschaft|ingenieur|engineer|group|chair", t, re.I):
+                    if FALLBACK_BLOCK_HINT_RE.search(t):
                         score += 2
                     if len(t) < 600:
                         score += 1
-                    if score > best_score:
-                        best_block, best_score = b, score
-
-                if best_block is not None:
-                    t = _text(best_block)
-                    # crude name extraction: look for TitleCase multiword near email
-                    name_m = re.search(r"([A-ZÄÖÜ][a-zäöüß]+(?:[-\s][A-ZÄÖÜ][a-zäöüß]+){1,3})", t)
-                    name = name_m.group(1) if name_m else ""
-                    # crude title extraction
-                    title_m = re.search(r"(Professor|Prof\.|Dr\.|Lecturer|Research(?:er| Associate| Fellow)|Wissenschaft(?:ler|liche)|Ingenieur|Engineer|Head|Leader)[^.,\n]{0,120}", t, re.I)
-                    title_str = title_m.group(0) if title_m else ""
-                    
-                    # Split title and role
-                    academic_title, role = _split_title_and_role(title_str) if title_str else ("", "")
-                    # Extract academic title from name if present
-                    name_title, clean_name = _extract_academic_title(name) if name else ("", name)
-                    if name_title and not academic_title:
-                        academic_title = name_title
-                        name = clean_name
-                    
-                    contacts.append({
-                        "Full_name": name,
-                        "Email": em,
-                        "Title": academic_title,
-                        "Role": role,
-                        "Field_of_study": _guess_field_from_text(t),
-                        "University_Field_of_Study": university_field,
-                        "page_text": page_text[:10000],  # Always use full page context for AI
-                        "source_url": page_url,
-                    })
-
-    # 4) Final cleanup: de-dup by Email+Name, normalize blanks
+                    block_scores[idx] = score
+                if score > best_score:
+                    best_idx, best_score = idx, score
+
+            if best_idx is not None:
+                t = block_texts[best_idx]
+                # crude name extraction: look for TitleCase multiword near email
+                name_m = FALLBACK_NAME_RE.search(t)
+                name = name_m.group(1) if name_m else ""
+                # crude title extraction
+                title_m = FALLBACK_TITLE_RE.search(t)
+                title_str = title_m.group(0) if title_m else ""
+                
+                # Split title and role
+                academic_title, role = _split_title_and_role(title_str) if title_str else ("", "")
+                # Extract academic title from name if present
+                name_title, clean_name = _extract_academic_title(name) if name else ("", name)
+                if name_title and not academic_title:
+                    academic_title = name_title
+                    name = clean_name
+                if best_idx not in block_fields:
+                    block_fields[best_idx] = _guess_field_from_text(t)
+                
+                contacts.append(Contact(
+                    Full_name=name,
+                    Email=em,
+                    Title=academic_title,
+                    Role=role,
+                    Field_of_study=block_fields[best_idx],
+                    University_Field_of_Study=university_field,
+                    Source_URL=page_url,
+                    page_text=context_text,  # Always use full page context for AI
+                ))
+    return contacts
+
+
+def _dedup_contacts(contacts: List[Contact]) -> List[Contact]:
+    """De-dup by Email+Name, filling missing names from firstname.lastname addresses."""
     dedup = {}
     for c in contacts:
         # FALLBACK: If name is still missing after HTML extraction, try to extract from email
         # This only happens when the page doesn't contain the name in any detectable format
-        if not c.get("Full_name") and c.get("Email"):
-            email = c["Email"]
+        if not c.Full_name and c.Email:
+            email = c.Email
             if "@" in email:
                 local_part = email.split("@")[0]
                 # Check for firstname.lastname or f.lastname pattern
@@ -1549,47 +2045,232 @@ def extract_contacts_from_html(html: str, page_url: str) -> List[Dict]:
                     if len(parts) == 2:
                         first = parts[0].capitalize()
                         last = parts[1].capitalize()
-                        c["Full_name"] = f"{first} {last}"
+                        c.Full_name = f"{first} {last}"
                     # Handle f.lastname (initial + lastname)
                     elif len(parts) == 2 and len(parts[0]) == 1:
                         initial = parts[0].upper()
                         last = parts[1].capitalize()
-                        c["Full_name"] = f"{initial}. {last}"
+                        c.Full_name = f"{initial}. {last}"
         
-        key = (c.get("Email", "").lower(), (c.get("Full_name", "") or "").lower())
+        key = (c.Email.lower(), c.Full_name.lower())
         if key in dedup:
             # prefer record that has a non-empty title / role / field / longer page_text
             old = dedup[key]
-            if len(_join_clean([c.get("Title", ""), c.get("Role", ""), c.get("Field_of_study", "")])) > \
-               len(_join_clean([old.get("Title", ""), old.get("Role", ""), old.get("Field_of_study", "")])):
+            if len(_join_clean([c.Title, c.Role, c.Field_of_study])) > \
+               len(_join_clean([old.Title, old.Role, old.Field_of_study])):
                 dedup[key] = c
-            elif len(c.get("page_text", "")) > len(old.get("page_text", "")):
+            elif len(c.page_text) > len(old.page_text):
                 dedup[key] = c
         else:
             dedup[key] = c
 
-    # Ensure keys exist
-    normalized = []
-    for c in dedup.values():
-        normalized.append({
-            "Full_name": c.get("Full_name", "") or "",
-            "Email": c.get("Email", "") or "",
-            "Title": c.get("Title", "") or "",  # Academic title (Prof., Dr., etc.)
-            "Role": c.get("Role", "") or "",  # Position/function (Head of..., Researcher in..., etc.)
-            "Field_of_study": c.get("Field_of_study", "") or "",  # Individual's field (keyword-based)
-            "University_Field_of_Study": c.get("University_Field_of_Study", "") or "",  # Department/institute field
-            "page_text": c.get("page_text", "") or "",
-            "source_url": c.get("source_url", page_url),
-        })
+    return list(dedup.values())
+
+
+def extract_contacts_from_html(html: str, page_url: str, tree: Optional[HTMLParser] = None,
+                               page_text: Optional[str] = None) -> List[Contact]:
+    """Contacts on a page; pass the parsed `tree` and its _collect_page_text() if the caller has them."""
+    with metrics.span("extract"):
+        return _extract_contacts(html, page_url, tree, page_text)
+
+
+def _extract_contacts(html: str, page_url: str, tree: Optional[HTMLParser] = None,
+                      page_text: Optional[str] = None) -> List[Contact]:
+    if tree is None:
+        with metrics.span("parse"):
+            tree = HTMLParser(html)
+    if page_text is None:
+        page_text = _collect_page_text(tree)
+    page_title = (tree.css_first("title").text(strip=True) if tree.css_first("title") else "")
+    
+    # Detect university/department field of study from page content
+    university_field = _detect_university_field(page_url, page_title, page_text)
+    # Page context for AI, shared by every contact from this page
+    context_text = page_text[:10000]
+
+    per_node_emails = set()
+
+    # 1) Structured data (JSON-LD / microdata Person, hCard): fields are stated, not guessed
+    contacts, covered_nodes = _contacts_from_structured_data(tree, page_url, university_field, context_text,
+                                                             per_node_emails)
+
+    # 2) Try structured "person cards" (common in KIT/DE sites), table rows and person-like divs;
+    # nodes already read as structured data are skipped
+    person_nodes = [n for n in _find_person_nodes(tree) if n.mem_id not in covered_nodes]
+
+    # 3) Extract from person nodes
+    node_contacts = _contacts_from_person_nodes(person_nodes, page_url, university_field, context_text, per_node_emails)
+    contacts.extend(node_contacts)
 
-    return normalized
+    # 4) If no person-cards detected, fall back to page-level email/name mining; structured data
+    # alone (e.g. one JSON-LD secretariat entry above a mailto list) does not cover the page
+    if not node_contacts:
+        contacts.extend(_contacts_from_page_emails(tree, page_url, university_field, context_text,
+                                                   known_emails={em.lower() for em in per_node_emails}))
+
+    # 5) Final cleanup: de-dup by Email+Name
+    return _dedup_contacts(contacts)
+
+
+# ----------------------------------------
+# STREAMING EXTRACTION (very large list-style directories)
+# ----------------------------------------
+
+STREAM_MIN_ROWS = 20  # rows needed in the first part of a page to extract it row by row
+STREAM_ROWS_PER_FRAGMENT = 200  # complete rows parsed together
+STREAM_MAX_PENDING_CHARS = 256 * 1024  # text kept while waiting for the end of a row
+
+
+class StreamingDirectoryExtractor:
+    """
+    Row-by-row extraction of a very large staff directory while it downloads.
+    
+    Used as the sink of fetch_page(). Text is buffered until STREAMING_EXTRACTION_CHARS
+    have arrived; if that first part is a staff page laid out as table rows or list
+    items, the extractor takes the page over. From then on complete rows are parsed
+    in small fragments as soon as they arrive and everything else is only scanned
+    for links and hashed, so the page is never held or parsed as a whole. Smaller
+    pages, card layouts and pages with JSON-LD are left to extract_contacts_from_html().
+    """
+
+    def __init__(self, page_url: str):
+        self.page_url = page_url
+        self.reset()
+
+    def reset(self):
+        """Forget everything fed so far (the fetch is retried from the start)."""
+        self.active = False
+        self.declined = False
+        self.head = ""  # page text up to the point streaming started (title, AI previews)
+        self.title = ""
+        self.row_tag = ""
+        self.rows = 0
+        self.contacts: List[Contact] = []
+        self.content_hash = ""
+        self._links: Dict[str, None] = {}
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._buffer = ""
+        self._hasher = ContentHasher()
+        self._per_node_emails: Set[str] = set()
+        self._cards_seen = False
+        self._university_field = ""
+        self._context_text = ""
+
+    @property
+    def links(self) -> List[str]:
+        """href values of all links on the page, in order of first appearance."""
+        return list(self._links)
+
+    def feed(self, text: str) -> bool:
+        """Take the next piece of the page; returns True once the extractor owns the page."""
+        if self.active:
+            self._buffer += text
+            self._drain()
+            return True
+        if self.declined:
+            return False
+
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if self._pending_chars < STREAMING_EXTRACTION_CHARS:
+            return False
+        head = "".join(self._pending)
+        self._pending = []
+        if not self._start(head):
+            self.declined = True
+            return False
+        self._buffer = head
+        self._drain()
+        return True
+
+    def finish(self) -> List[Contact]:
+        """Process the rest of the page after the download ended; returns its contacts."""
+        self._pending = []
+        if self.active:
+            self._drain(final=True)
+            self.contacts = _dedup_contacts(self.contacts)
+            self.content_hash = self._hasher.hexdigest()
+            if DEBUG:
+                extract_log.debug(f"      📥 Streamed {self.rows} {self.row_tag} rows from {self.page_url[:80]}")
+        return self.contacts
+
+    def _start(self, head: str) -> bool:
+        tree = HTMLParser(head)
+        counts = {tag: len(tree.css(tag)) for tag in DIRECTORY_ROW_RES}
+        row_tag = max(counts, key=counts.get)
+        if counts[row_tag] < STREAM_MIN_ROWS or tree.css_first(f"{row_tag} {row_tag}") is not None:
+            return False  # not row-based, or nested rows the row pattern cannot split
+        if tree.css_first("script[type='application/ld+json']") is not None:
+            return False  # JSON-LD people need the whole page
+        if any(node.tag != row_tag for node in _find_person_nodes(tree)):
+            return False  # people are in cards, not in the rows
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else ""
+        if not looks_like_staff_page(title, self.page_url):
+            return False
+
+        page_text = _collect_page_text(tree)
+        self._university_field = _detect_university_field(self.page_url, title, page_text)
+        self._context_text = page_text[:10000]
+        self.head = head
+        self.title = title
+        self.row_tag = row_tag
+        self.active = True
+        if DEBUG:
+            extract_log.debug(f"   📥 Large directory page, extracting {row_tag} rows while downloading: {self.page_url[:80]}")
+        return True
+
+    def _drain(self, final: bool = False):
+        """Extract the complete rows in the buffer and pass the text before their end on."""
+        rows = []
+        end = 0
+        for m in DIRECTORY_ROW_RES[self.row_tag].finditer(self._buffer):
+            rows.append(m.group(0))
+            end = m.end()
+        if final:
+            end = len(self._buffer)
+        elif len(self._buffer) - end > STREAM_MAX_PENDING_CHARS:
+            # No row end in sight (long footer, inline data): let go of the text up to the last tag
+            end = max(end, self._buffer.rfind("<"))
+        if end > 0:
+            self._consume(self._buffer[:end])
+            self._buffer = self._buffer[end:]
+        if rows:
+            self._extract_rows(rows)
+
+    def _consume(self, text: str):
+        self._hasher.update(text)
+        for m in ANCHOR_HREF_RE.finditer(text):
+            href = next(g for g in m.groups() if g is not None)
+            self._links.setdefault(html_lib.unescape(href), None)
+
+    def _extract_rows(self, rows: List[str]):
+        self.rows += len(rows)
+        wrapper = "table" if self.row_tag == "tr" else "ul"
+        for i in range(0, len(rows), STREAM_ROWS_PER_FRAGMENT):
+            fragment = HTMLParser(f"<{wrapper}>{''.join(rows[i:i + STREAM_ROWS_PER_FRAGMENT])}</{wrapper}>")
+            found, covered = _contacts_from_structured_data(fragment, self.page_url, self._university_field,
+                                                            self._context_text, self._per_node_emails)
+            nodes = [n for n in _find_person_nodes(fragment) if n.mem_id not in covered]
+            found.extend(_contacts_from_person_nodes(nodes, self.page_url, self._university_field,
+                                                     self._context_text, self._per_node_emails))
+            if found:
+                self._cards_seen = True
+            elif not self._cards_seen:
+                # Same rule as a whole page: mine emails from rows only while no person rows were found
+                found = _contacts_from_page_emails(fragment, self.page_url, self._university_field,
+                                                   self._context_text, max_blocks=None)
+            self.contacts.extend(found)
 
 
 # ----------------------------------------
 # UNIVERSITY PROCESSING WRAPPER
 # ----------------------------------------
 
-async def process_university(session, uni: dict, pbar=None, use_ai=False, client=None, ai_model="gpt-4o-mini", use_ai_profile_detection=False) -> List[Dict]:
+async def process_university(session, uni: dict, pbar=None, use_ai=False, client=None, ai_model="gpt-4o-mini", use_ai_profile_detection=False,
+                             run_state: RunStateStore = None, incremental: bool = False,
+                             run_budget: Optional[RunBudget] = None) -> List[Contact]:
     """
     Process a single university: crawl staff pages and extract contacts.
     
@@ -1601,9 +2282,14 @@ async def process_university(session, uni: dict, pbar=None, use_ai=False, client
         client: OpenAI client (for AI-powered link discovery)
         ai_model: AI model name
         use_ai_profile_detection: whether to use AI for individual profile page detection (slower)
+        run_state: optional cross-run state store; updated with this crawl's staff pages
+        incremental: re-check only the staff pages known from run_state instead of a full crawl
+        run_budget: optional page/time budget of the whole run, shared by all crawlers
     
     Returns:
-        List of contact dictionaries with university metadata
+        List of Contact records with university metadata; when the crawl hits its
+        deadline (UNIVERSITY_TIMEOUT or the run deadline) or fails, the contacts
+        extracted until then
     """
     university_name = uni.get("name", "Unknown")
     country = uni.get("country", "Unknown")
@@ -1614,24 +2300,48 @@ async def process_university(session, uni: dict, pbar=None, use_ai=False, client
             pbar.update(1)
         return []
     
+    # Create crawler with AI parameters and run it under the university's deadline
+    crawler = StaffCrawler(url, use_ai=use_ai, client=client, ai_model=ai_model, use_ai_profile_detection=use_ai_profile_detection,
+                           run_budget=run_budget)
+    ACTIVE_CRAWLERS[university_name] = crawler
+    timeout, timeout_reason = crawl_timeout(run_budget)
+    incomplete = ""  # why the crawl ended early; the contacts found until then are kept
     try:
-        # Create crawler with AI parameters and run
-        crawler = StaffCrawler(url, use_ai=use_ai, client=client, ai_model=ai_model, use_ai_profile_detection=use_ai_profile_detection)
-        contacts = await crawler.crawl()
-        
-        # Add university metadata to each contact
-        for contact in contacts:
-            contact["University"] = university_name
-            contact["Country"] = country
-            contact["University_Website_URL"] = url
-        
-        if DEBUG and contacts:
-            print(f"   ✅ {university_name}: {len(contacts)} contacts from {len(crawler.found_pages)} staff pages")
-        
+        previous = run_state.get(url) if run_state is not None else None
+        if incremental and previous and previous.get("staff_pages"):
+            await asyncio.wait_for(crawler.refresh(previous), timeout)
+        else:
+            await asyncio.wait_for(crawler.crawl(), timeout)
+    except asyncio.TimeoutError:
+        incomplete = timeout_reason
+        metrics.inc("crawls_incomplete_total", reason=timeout_reason)
+        crawl_log.warning(f"   ⏰ {university_name}: {timeout_reason} reached after {timeout:.1f}s, crawl cancelled "
+                          f"({len(crawler.contacts)} contacts from {len(crawler.found_pages)} staff pages kept)")
     except Exception as e:
-        if DEBUG:
-            print(f"   ⚠️ {university_name}: Error during crawl: {e}")
-        contacts = []
+        incomplete = f"error: {e}"
+        metrics.inc("crawls_incomplete_total", reason="error")
+        crawl_log.warning(f"   ⚠️ {university_name}: Error during crawl: {e}"
+                          + (f" ({len(crawler.contacts)} contacts kept)" if crawler.contacts else ""))
+    finally:
+        ACTIVE_CRAWLERS.pop(university_name, None)
+        if run_budget is not None:
+            run_budget.university_done()
+    contacts = crawler.contacts
+    
+    # Add university metadata to each contact
+    for contact in contacts:
+        contact.University = university_name
+        contact.Country = country
+        contact.University_Website_URL = url
+    
+    if contacts and not incomplete:
+        crawl_log.info(f"   ✅ {university_name}: {len(contacts)} contacts from {len(crawler.found_pages)} staff pages")
+    
+    if run_state is not None:
+        diff = run_state.record(uni, crawler, incomplete=incomplete)
+        if diff is not None:
+            crawl_log.info(f"   🔄 {university_name}: +{len(diff['added'])} / -{len(diff['removed'])} / "
+                           f"~{len(diff['changed'])} contacts vs. previous run")
     
     if pbar:
         pbar.update(1)
@@ -0,0 +1,225 @@
+"""
+Seed discovery from robots.txt and sitemaps.
+
+Before link-following starts, the crawler reads the site's robots.txt (disallow
+rules, crawl-delay, Sitemap: lines) and streams its sitemaps, including sitemap
+indexes and gzipped files. Sitemap URLs that look like staff directories or
+department homepages are injected straight into the crawl frontier, so deep
+staff pages are reached in one fetch instead of several levels of recursion.
+"""
+
+import asyncio
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+
+from config import (
+    HEADERS,
+    TIMEOUT,
+    DEBUG,
+    STAFF_PAGE_KEYWORDS,
+    DEPARTMENT_URL_PATTERNS,
+    MAX_SITEMAP_FILES,
+    MAX_SITEMAP_URLS,
+    MAX_SITEMAP_SEEDS,
+    MAX_CRAWL_DELAY,
+    STREAM_CHUNK_BYTES,
+)
+from academic_lead_extractor import metrics
+from academic_lead_extractor.log import get_logger
+
+log = get_logger("seeding")
+
+# Sitemaps can be large: no total limit, only per-read and connect timeouts
+SITEMAP_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=TIMEOUT, sock_read=TIMEOUT)
+ROBOTS_TIMEOUT = aiohttp.ClientTimeout(total=TIMEOUT)
+
+# robots.txt group the rules are read from. Pages are fetched with rotating browser
+# user agents (USER_AGENTS), not as HEADERS' bot name, so the rules for any
+# robot ("User-agent: *") are the ones that describe this crawler
+ROBOTS_AGENT = "*"
+
+# Staff keywords that are URL path fragments ("/people/", "/mitarbeiter/", ...)
+_STAFF_URL_KEYWORDS = [k.lower() for k in STAFF_PAGE_KEYWORDS if k.startswith("/")]
+
+
+class RobotsPolicy:
+    """robots.txt rules of one host, plus the pacing its crawl-delay asks for."""
+
+    def __init__(self, host_url: str, text: str = ""):
+        self.host_url = host_url
+        self._parser = RobotFileParser()
+        self._parser.parse(text.splitlines())
+        delay = self._parser.crawl_delay(ROBOTS_AGENT)
+        self.crawl_delay = min(float(delay), MAX_CRAWL_DELAY) if delay else 0.0
+        self.sitemaps: List[str] = list(self._parser.site_maps() or [])
+        self.disallowed = 0  # crawl URLs not fetched because of a Disallow rule
+        self.seeds_disallowed = 0  # sitemap URLs not seeded because of a Disallow rule
+        self._next_fetch = 0.0
+        self._lock = asyncio.Lock()
+
+    def allows(self, url: str, seed: bool = False) -> bool:
+        """Whether robots.txt allows url; a refusal is counted as a crawl URL or (seed=True) a sitemap seed."""
+        if self._parser.can_fetch(ROBOTS_AGENT, url):
+            return True
+        if seed:
+            self.seeds_disallowed += 1
+        else:
+            self.disallowed += 1
+        return False
+
+    async def wait_turn(self):
+        """Space requests to this host by the crawl-delay (no-op without one)."""
+        if not self.crawl_delay:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_fetch > now:
+                await asyncio.sleep(self._next_fetch - now)
+                now = self._next_fetch
+            self._next_fetch = now + self.crawl_delay
+
+
+class RobotsCache:
+    """RobotsPolicy per host, fetched once on first use."""
+
+    def __init__(self):
+        self._policies: Dict[str, RobotsPolicy] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def policy_for(self, session: aiohttp.ClientSession, url: str) -> RobotsPolicy:
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+        policy = self._policies.get(host)
+        if policy is not None:
+            return policy
+        task = self._pending.get(host)
+        if task is None:
+            task = self._pending[host] = asyncio.ensure_future(fetch_robots(session, host))
+        policy = await task
+        self._policies[host] = policy
+        self._pending.pop(host, None)
+        return policy
+
+    @property
+    def disallowed(self) -> int:
+        return sum(p.disallowed for p in self._policies.values())
+
+    @property
+    def seeds_disallowed(self) -> int:
+        return sum(p.seeds_disallowed for p in self._policies.values())
+
+
+async def fetch_robots(session: aiohttp.ClientSession, host_url: str) -> RobotsPolicy:
+    """Fetch and parse host_url/robots.txt; a missing or unreadable file allows everything."""
+    text = ""
+    try:
+        with metrics.span("robots", host=urlparse(host_url).netloc):
+            async with session.get(urljoin(host_url, "/robots.txt"), headers=HEADERS, timeout=ROBOTS_TIMEOUT) as resp:
+                if resp.status == 200:
+                    text = await resp.text(errors="replace")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        if DEBUG:
+            log.debug(f"   ⚠️  robots.txt not readable for {host_url}: {type(e).__name__}")
+    return RobotsPolicy(host_url, text)
+
+
+async def iter_sitemap(session: aiohttp.ClientSession, url: str) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Stream the <loc> entries of a sitemap as ("url" | "sitemap", location).
+
+    The file is parsed while it downloads (gzip is detected by its magic bytes)
+    and processed elements are dropped, so memory does not grow with its size.
+    """
+    try:
+        async with session.get(url, headers=HEADERS, timeout=SITEMAP_TIMEOUT) as resp:
+            if resp.status != 200:
+                return
+            parser = ET.XMLPullParser(events=("start", "end"))
+            decompressor = None
+            root = None
+            first = True
+            async for chunk in resp.content.iter_chunked(STREAM_CHUNK_BYTES):
+                if first:
+                    first = False
+                    if chunk[:2] == b"\x1f\x8b":
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                parser.feed(decompressor.decompress(chunk) if decompressor else chunk)
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        if root is None:
+                            root = elem
+                        continue
+                    if elem.tag.rsplit("}", 1)[-1] == "loc" and elem.text:
+                        kind = "sitemap" if root.tag.rsplit("}", 1)[-1] == "sitemapindex" else "url"
+                        yield kind, elem.text.strip()
+                if root is not None:
+                    root.clear()  # entries already reported
+    except (aiohttp.ClientError, asyncio.TimeoutError, ET.ParseError, zlib.error) as e:
+        if DEBUG:
+            log.debug(f"   ⚠️  Sitemap not readable: {url[:80]} ({type(e).__name__})")
+
+
+def classify_seed(url: str) -> Optional[str]:
+    """'staff' or 'department' when the URL path looks like one, else None."""
+    path = urlparse(url).path.lower()
+    if any(k in path + "/" for k in _STAFF_URL_KEYWORDS):
+        return "staff"
+    if any(p in path for p in DEPARTMENT_URL_PATTERNS):
+        return "department"
+    return None
+
+
+class SitemapSeeds(NamedTuple):
+    urls: List[str]  # staff pages first, then departments; shallow paths first
+    staff: int
+    departments: int
+    sitemaps: int  # sitemap files read
+    scanned: int  # sitemap entries looked at
+
+
+async def discover_seeds(session: aiohttp.ClientSession, start_url: str, sitemaps: List[str],
+                         accept: Callable[[str], bool]) -> SitemapSeeds:
+    """
+    Staff and department URLs from the site's sitemaps (robots.txt Sitemap: lines,
+    else /sitemap.xml). accept() filters candidates (domain, excluded patterns,
+    robots rules); at most MAX_SITEMAP_SEEDS URLs are returned.
+    """
+    queue = deque(sitemaps or [urljoin(start_url, "/sitemap.xml")])
+    read = set()
+    found = {"staff": [], "department": []}
+    scanned = 0
+
+    while queue and len(read) < MAX_SITEMAP_FILES and scanned < MAX_SITEMAP_URLS:
+        sitemap_url = queue.popleft()
+        if sitemap_url in read:
+            continue
+        read.add(sitemap_url)
+        async with aclosing(iter_sitemap(session, sitemap_url)) as entries:
+            async for kind, loc in entries:
+                if kind == "sitemap":
+                    # Child sitemaps named after people/staff are read first
+                    if any(k.strip("/") in loc.lower() for k in _STAFF_URL_KEYWORDS):
+                        queue.appendleft(loc)
+                    else:
+                        queue.append(loc)
+                    continue
+                scanned += 1
+                kind = classify_seed(loc)
+                if kind and accept(loc):
+                    found[kind].append(loc)
+                if scanned >= MAX_SITEMAP_URLS:
+                    break
+
+    def depth(u: str) -> int:
+        return urlparse(u).path.rstrip("/").count("/")
+
+    urls = sorted(found["staff"], key=depth) + sorted(found["department"], key=depth)
+    return SitemapSeeds(urls[:MAX_SITEMAP_SEEDS], len(found["staff"]), len(found["department"]), len(read), scanned)
@@ -0,0 +1,197 @@
+"""
+Structured-data fast path: schema.org Person (JSON-LD and microdata) and hCard.
+
+Sites that mark up their staff this way state name, job title, email and
+affiliation explicitly, so these are read directly instead of being guessed
+by the heuristic card extraction. The scraper skips the nodes reported as
+covered here.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+
+from selectolax.parser import HTMLParser
+
+
+@dataclass(slots=True)
+class StructuredPerson:
+    """One person as stated by the page's structured markup."""
+    name: str = ""
+    job_title: str = ""
+    email: str = ""  # raw value (may still carry mailto: or obfuscation)
+    affiliation: str = ""
+    honorific_prefix: str = ""
+    source: str = ""  # "json-ld", "microdata" or "hcard"
+    text: str = ""  # text used for field classification
+
+
+def _first(value) -> str:
+    """First non-empty string of a JSON-LD value (string, list, or object with a name)."""
+    if isinstance(value, list):
+        for item in value:
+            text = _first(item)
+            if text:
+                return text
+        return ""
+    if isinstance(value, dict):
+        return _first(value.get("name") or value.get("legalName") or "")
+    if isinstance(value, (str, int, float)):
+        return str(value).strip()
+    return ""
+
+
+def _strip_mailto(value: str) -> str:
+    value = value.strip()
+    if value.lower().startswith("mailto:"):
+        value = value[7:]
+    return value.split("?", 1)[0].strip()
+
+
+def _is_person(item: dict) -> bool:
+    types = item.get("@type", "")
+    if isinstance(types, str):
+        types = [types]
+    return any(isinstance(t, str) and t.rsplit("/", 1)[-1] == "Person" for t in types)
+
+
+def _walk_json_ld(data, people: List[StructuredPerson]):
+    """Collect Person objects anywhere in a JSON-LD document (@graph, lists, nested members)."""
+    if isinstance(data, list):
+        for item in data:
+            _walk_json_ld(item, people)
+        return
+    if not isinstance(data, dict):
+        return
+
+    if _is_person(data):
+        name = _first(data.get("name"))
+        if not name:
+            name = " ".join(p for p in (_first(data.get("givenName")), _first(data.get("familyName"))) if p)
+        person = StructuredPerson(
+            name=name,
+            job_title=_first(data.get("jobTitle")),
+            email=_strip_mailto(_first(data.get("email"))),
+            affiliation=_first(data.get("affiliation")) or _first(data.get("worksFor")) or _first(data.get("memberOf")),
+            honorific_prefix=_first(data.get("honorificPrefix")),
+            source="json-ld",
+        )
+        person.text = " ".join(p for p in (person.job_title, person.affiliation, _first(data.get("description"))) if p)
+        people.append(person)
+
+    for key, value in data.items():
+        if isinstance(value, (dict, list)) and not key.startswith("@context"):
+            _walk_json_ld(value, people)
+
+
+def _own_props(scope) -> List:
+    """itemprop nodes that belong to this itemscope (not to an item nested inside it)."""
+    props = []
+    scope_id = scope.mem_id
+    for prop in scope.css("[itemprop]"):
+        parent = prop.parent
+        nested = False
+        while parent is not None and parent.mem_id != scope_id:
+            if "itemscope" in parent.attributes:
+                nested = True
+                break
+            parent = parent.parent
+        if not nested:
+            props.append(prop)
+    return props
+
+
+def _prop_value(node) -> str:
+    attrs = node.attributes
+    if attrs.get("content"):
+        return attrs["content"].strip()
+    if node.tag in ("a", "link") and attrs.get("href"):
+        return attrs["href"].strip()
+    return node.text(separator=" ", strip=True)
+
+
+def _microdata_person(scope) -> StructuredPerson:
+    person = StructuredPerson(source="microdata")
+    given = family = ""
+    for prop in _own_props(scope):
+        names = (prop.attributes.get("itemprop") or "").split()
+        if "itemscope" in prop.attributes:
+            # Property whose value is an item (e.g. affiliation -> Organization)
+            if not person.affiliation and any(n in ("affiliation", "worksFor", "memberOf") for n in names):
+                org_name = prop.css_first("[itemprop~='name']")
+                person.affiliation = _prop_value(org_name) if org_name else prop.text(separator=" ", strip=True)
+            continue
+        value = _prop_value(prop)
+        for name in names:
+            if name == "name" and not person.name:
+                person.name = value
+            elif name == "givenName":
+                given = given or value
+            elif name == "familyName":
+                family = family or value
+            elif name == "jobTitle" and not person.job_title:
+                person.job_title = value
+            elif name == "email" and not person.email:
+                person.email = _strip_mailto(value)
+            elif name in ("affiliation", "worksFor", "memberOf") and not person.affiliation:
+                person.affiliation = value
+            elif name == "honorificPrefix" and not person.honorific_prefix:
+                person.honorific_prefix = value
+    if not person.name:
+        person.name = " ".join(p for p in (given, family) if p)
+    person.text = scope.text(separator=" ", strip=True)
+    return person
+
+
+def _hcard_value(card, selector: str) -> str:
+    node = card.css_first(selector)
+    return _prop_value(node) if node else ""
+
+
+def _hcard_person(card) -> StructuredPerson:
+    name = _hcard_value(card, ".fn")
+    if not name:
+        name = " ".join(p for p in (_hcard_value(card, ".given-name"), _hcard_value(card, ".family-name")) if p)
+    return StructuredPerson(
+        name=name,
+        job_title=_hcard_value(card, ".title") or _hcard_value(card, ".role"),
+        email=_strip_mailto(_hcard_value(card, ".email")),
+        affiliation=_hcard_value(card, ".org"),
+        honorific_prefix=_hcard_value(card, ".honorific-prefix"),
+        source="hcard",
+        text=card.text(separator=" ", strip=True),
+    )
+
+
+def extract_structured_people(tree: HTMLParser) -> Tuple[List[StructuredPerson], Set[int]]:
+    """
+    People declared via JSON-LD, microdata (itemtype containing 'Person') or hCard.
+
+    Returns ``(people, covered)`` where ``covered`` holds the ``mem_id`` of every
+    microdata/hCard node that was read, so heuristic extraction can skip them.
+    """
+    people: List[StructuredPerson] = []
+    covered: Set[int] = set()
+
+    for script in tree.css("script[type='application/ld+json']"):
+        try:
+            data = json.loads(script.text(deep=True) or "")
+        except ValueError:
+            continue
+        _walk_json_ld(data, people)
+
+    for scope in tree.css("[itemscope][itemtype*='Person']"):
+        person = _microdata_person(scope)
+        if person.name or person.email:
+            covered.add(scope.mem_id)
+            people.append(person)
+
+    for card in tree.css(".vcard"):
+        if card.mem_id in covered:  # hCard classes on a microdata Person
+            continue
+        person = _hcard_person(card)
+        if person.name or person.email:
+            covered.add(card.mem_id)
+            people.append(person)
+
+    return people, covered
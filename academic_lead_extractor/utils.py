@@ -2,6 +2,7 @@
 Utility functions for text processing and validation.
 """
 
+import csv
 import re
 from typing import List
 
@@ -307,3 +308,11 @@ def clean_name(name: str) -> str:
     
     return name
 
+
+def count_csv_rows(path: str, column: str = "Website") -> int:
+    """Rows of a CSV file with a non-empty `column` (0 if the column is missing), without pandas."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        if column not in (reader.fieldnames or []):
+            return 0
+        return sum(1 for row in reader if row.get(column))
@@ -0,0 +1,117 @@
+"""
+Crawler and extractor throughput on a recorded corpus, without the network.
+
+Record a corpus once (AI off, so runs are comparable):
+    python main.py --no-ai --urls https://www.kit.edu https://www.eth.ch --record corpus/sample
+
+Then, from the repository root:
+    python benchmarks/bench_crawl.py corpus/sample
+    python benchmarks/bench_crawl.py corpus/sample --only extract --repeat 3
+
+"crawl" replays StaffCrawler.crawl() for every recorded start URL (retry and
+crawl-delay sleeps are switched off unless --keep-delays is given, so the
+numbers measure the crawler, not its sleeps). "extract" runs extract_contacts_from_html on
+every recorded HTML page. Peak RSS is the process maximum so far.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+config.DEBUG = False
+config.LOG_LEVEL = "WARNING"
+
+from academic_lead_extractor import replay, scraper, seeding
+from academic_lead_extractor.scraper import StaffCrawler, extract_contacts_from_html
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+def report(label: str, pages: int, contacts: int, wall: float, cpu: float):
+    wall = max(wall, 1e-9)
+    print(f"{label[:40]:40s} {pages:7d} {contacts:9d} {wall:8.2f} {pages / wall:8.1f} "
+          f"{contacts / wall:10.1f} {cpu / max(pages, 1) * 1000:9.2f}")
+
+
+def header():
+    print(f"{'':40s} {'pages':>7s} {'contacts':>9s} {'wall s':>8s} {'pages/s':>8s} "
+          f"{'contacts/s':>10s} {'CPU ms/pg':>9s}")
+
+
+def bench_crawl(corpus: replay.Corpus, urls):
+    print("crawl (StaffCrawler.crawl, replayed)")
+    header()
+    totals = [0, 0, 0.0, 0.0]
+    for url in urls:
+        requests_before = corpus.stats.requests
+        wall, cpu = time.perf_counter(), time.process_time()
+        contacts = asyncio.run(StaffCrawler(url, use_ai=False).crawl())
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        pages = corpus.stats.requests - requests_before
+        report(url, pages, len(contacts), wall, cpu)
+        for i, value in enumerate((pages, len(contacts), wall, cpu)):
+            totals[i] += value
+    report("total", *totals)
+    if corpus.stats.misses:
+        print(f"   {corpus.stats.misses} requests were not in the corpus (answered 404): "
+              f"the crawler now visits pages the recording did not")
+
+
+def bench_extract(corpus: replay.Corpus, repeat: int):
+    pages = list(corpus.html_pages())
+    print(f"extract (extract_contacts_from_html, {len(pages)} recorded pages, best of {repeat})")
+    header()
+    best = None
+    for _ in range(repeat):
+        contacts = 0
+        wall, cpu = time.perf_counter(), time.process_time()
+        for url, html in pages:
+            contacts += len(extract_contacts_from_html(html, url))
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if best is None or wall < best[2]:
+            best = (len(pages), contacts, wall, cpu)
+    report("all pages", *best)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark crawling and extraction on a recorded corpus")
+    parser.add_argument("corpus", help="corpus directory written with main.py --record")
+    parser.add_argument("--urls", nargs="+", help="start URLs to replay (default: all recorded crawls)")
+    parser.add_argument("--only", choices=["crawl", "extract"], help="run one benchmark only")
+    parser.add_argument("--repeat", type=int, default=1, help="extraction runs, best is reported (default: 1)")
+    parser.add_argument("--keep-delays", action="store_true", help="keep retry and crawl-delay sleeps")
+    args = parser.parse_args()
+
+    replay.configure(replay_dir=args.corpus)
+    corpus = replay.active_corpus()
+    if not args.keep_delays:
+        scraper.RETRY_DELAY = 0
+        seeding.MAX_CRAWL_DELAY = 0
+
+    if args.only != "extract":
+        urls = args.urls or corpus.start_urls()
+        if not urls:
+            sys.exit("No start URLs recorded in the corpus; pass --urls")
+        bench_crawl(corpus, urls)
+    if args.only != "crawl":
+        bench_extract(corpus, args.repeat)
+    print(f"peak RSS: {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
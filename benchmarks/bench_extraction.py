@@ -0,0 +1,56 @@
+"""
+Per-page cost of extract_contacts_from_html on the synthetic corpus.
+
+Every layout lists --size people; a layout that yields fewer contacts is
+reported as MISSING and fails the run (exit code 1).
+
+Usage (from the repository root):
+    python benchmarks/bench_extraction.py
+    python benchmarks/bench_extraction.py --size 2000 --repeat 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+config.DEBUG = False
+
+from academic_lead_extractor.scraper import extract_contacts_from_html
+from benchmarks.corpus import build_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark contact extraction per page layout")
+    parser.add_argument("--size", type=int, default=300, help="people per page (default: 300)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page, best time is reported (default: 5)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size)
+    print(f"{'layout':20s} {'KB':>7s} {'contacts':>9s} {'best ms':>9s} {'mean ms':>9s}")
+    total = 0.0
+    missing = []
+    for name, html in corpus.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            contacts = extract_contacts_from_html(html, f"https://example.edu/{name}")
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        total += best
+        with_email = len({c.Email for c in contacts if c.Email})
+        if with_email < args.size:
+            missing.append(f"{name}: {with_email}/{args.size} emails")
+        print(f"{name:20s} {len(html) / 1024:7.0f} {len(contacts):9d} {best * 1000:9.1f} "
+              f"{sum(timings) / len(timings) * 1000:9.1f}{'  MISSING' if with_email < args.size else ''}")
+    print(f"{'total':20s} {'':7s} {'':9s} {total * 1000:9.1f}")
+    if missing:
+        print("FAILED: " + "; ".join(missing))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Import-time budget for the CLI entry points (python -X importtime).
+
+Each target is imported in a fresh interpreter several times; the best
+cumulative import time is compared with its budget, and the heaviest
+modules it pulled in are listed. Independently of machine speed, the run
+also fails when a target imports a dependency that must stay lazy (pandas,
+openai, tqdm are loaded at the point of use).
+
+Usage (from the repository root):
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --budget main=150
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# target module -> (budget in ms, modules it must not import)
+TARGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "main": (250, ("pandas", "openai", "tqdm", "aiohttp")),  # CLI start, --help, launcher menus
+    "academic_lead_extractor.processor": (800, ("pandas", "openai", "tqdm")),  # the pipeline
+}
+REPEAT = 5
+TOP = 8
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_times(target: str) -> List[Tuple[str, int, int]]:
+    """(module, cumulative µs, nesting depth) for `target` and every module imported under it, target last."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {target}"],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"import {target} failed:\n{result.stderr[-2000:]}")
+    modules = []
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            modules.append((match.group(4), int(match.group(2)), len(match.group(3)) // 2))
+    # Children are listed before their parent; modules imported at interpreter startup come first
+    end = next(i for i, (name, _, depth) in enumerate(modules) if name == target and depth == 0)
+    start = end
+    while start > 0 and modules[start - 1][2] > 0:
+        start -= 1
+    return modules[start:end + 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget check (python -X importtime)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help=f"imports per target, best counts (default: {REPEAT})")
+    parser.add_argument("--budget", action="append", default=[], metavar="TARGET=MS",
+                        help="override a budget, e.g. main=150")
+    args = parser.parse_args()
+
+    budgets = {target: budget for target, (budget, _) in TARGETS.items()}
+    for override in args.budget:
+        target, _, ms = override.partition("=")
+        budgets[target] = float(ms)
+
+    failures = []
+    for target, (_, lazy) in TARGETS.items():
+        runs = [import_times(target) for _ in range(args.repeat)]
+        best = min(runs, key=lambda modules: modules[-1][1])
+        total_ms = best[-1][1] / 1000
+        over = total_ms > budgets[target]
+        print(f"{target}: {total_ms:.0f} ms (budget {budgets[target]:.0f} ms){'  OVER BUDGET' if over else ''}")
+        if over:
+            failures.append(f"{target} takes {total_ms:.0f} ms to import")
+
+        children = sorted((m for m in best if m[2] == 1), key=lambda m: m[1], reverse=True)
+        for name, us, _ in children[:TOP]:
+            print(f"   {us / 1000:8.1f} ms  {name}")
+
+        imported = {name.split(".")[0] for name, _, _ in best}
+        eager = [name for name in lazy if name in imported]
+        if eager:
+            print(f"   imports {', '.join(eager)} at startup (should be imported where used)")
+            failures.append(f"{target} imports {', '.join(eager)}")
+
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Micro-benchmark for the compiled pattern registry (academic_lead_extractor/patterns.py).
+
+Times the per-contact regex work of the scraper (email cleaning, academic title
+splitting) and the per-page noise cleanup against the previous implementations,
+which looped over pattern strings through the ``re`` module cache.
+
+Usage (from the repository root):
+    python benchmarks/bench_regex.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+config.DEBUG = False
+
+from config import EMAIL_OBFUSCATION_PATTERNS
+from academic_lead_extractor.scraper import clean_email, _extract_academic_title, _collect_page_text
+from selectolax.parser import HTMLParser
+from benchmarks.corpus import build_corpus
+
+# ---------------------------
+# Previous implementations (reference only)
+# ---------------------------
+
+LEGACY_TITLE_PATTERNS = [
+    r'^(Prof\.\s*Dr\.-Ing\.|Professor\s*Dr\.-Ing\.)(?:\s+|,\s*|$)',
+    r'^(Prof\.\s*Dr\.|Professor\s*Dr\.)(?:\s+|,\s*|$)',
+    r'^(Dr\.-Ing\.|Dr\.\s*Ing\.)(?:\s+|,\s*|$)',
+    r'^(Dr\.\s*rer\.\s*nat\.|Dr\.\s*rer\.nat\.)(?:\s+|,\s*|$)',
+    r'^(Dr\.\s*phil\.)(?:\s+|,\s*|$)',
+    r'^(M\.Sc\.|M\.S\.|MSc)(?:\s+|,\s*|$)',
+    r'^(B\.Sc\.|B\.S\.|BSc)(?:\s+|,\s*|$)',
+    r'^(Dipl\.-Ing\.|Diplom-Ingenieur)(?:\s+|,\s*|$)',
+    r'^(Prof\.)(?:\s+|,\s*|$)',
+    r'^(Dr\.)(?:\s+|,\s*|$)',
+    r'^(Professor)(?:\s+|,\s*|$)',
+    r'^(PhD)(?:\s+|,\s*|$)',
+]
+
+LEGACY_NOISE_PATTERNS = [
+    r'Cookie\s+(?:Policy|Notice|Settings)',
+    r'Privacy\s+Policy',
+    r'Terms\s+(?:of\s+)?(?:Service|Use)',
+    r'Copyright\s+©',
+    r'All\s+rights\s+reserved',
+]
+
+
+def legacy_extract_academic_title(name):
+    for pattern in LEGACY_TITLE_PATTERNS:
+        match = re.search(pattern, name, re.IGNORECASE)
+        if match:
+            return (match.group(1).strip(), re.sub(pattern, '', name, flags=re.IGNORECASE).strip())
+    return ("", name)
+
+
+def legacy_clean_email(raw):
+    email = raw.strip()
+    email = re.sub(r'does-not-exist\.?', '', email, flags=re.IGNORECASE)
+    email = re.sub(r'no-spam\.?', '', email, flags=re.IGNORECASE)
+    email = re.sub(r'remove-this\.?', '', email, flags=re.IGNORECASE)
+    for pattern, repl in EMAIL_OBFUSCATION_PATTERNS.items():
+        email = re.sub(pattern, repl, email, flags=re.IGNORECASE)
+    if "@" in email and email.count(" ") >= 2:
+        local, domain = (part.strip() for part in email.split("@", 1))
+        local = local.replace(" ", ".") if local.count(" ") == 1 else local.replace(" ", "")
+        domain = domain.replace(" ", ".") if domain.count(" ") == 1 else domain.replace(" ", "")
+        email = f"{local}@{domain}"
+    else:
+        email = email.replace(" ", "")
+    email = email.replace("..", ".")
+    email = re.sub(r'^\.+|\.+$', '', email)
+    return email if "@" in email and "." in email.split("@")[-1] else ""
+
+
+def legacy_page_noise(text):
+    for pattern in LEGACY_NOISE_PATTERNS:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+# ---------------------------
+# Inputs
+# ---------------------------
+
+NAMES = ["Prof. Dr.-Ing. Anna Müller", "Dr. rer. nat. Ben Weber", "Felix Schmidt", "M.Sc. Clara Koch",
+         "Professor, Head of Lab", "Dipl.-Ing. Hans Wolf", "PhD Eva Braun", "Jonas Richter"]
+EMAILS = ["anna.mueller@kit.edu", "ben weber ∂ kit edu", "clara.koch [at] tu-berlin [dot] de",
+          "felix(at)uni-x(dot)de", "hans.wolf@does-not-exist.uni.de", "eva dot braun at eth dot ch"]
+
+
+def _per_call_us(func, inputs, number):
+    seconds = timeit.timeit(lambda: [func(x) for x in inputs], number=number)
+    return seconds / (number * len(inputs)) * 1e6
+
+
+def main():
+    number = 2000
+    rows = [
+        ("academic title", legacy_extract_academic_title, _extract_academic_title, NAMES),
+        ("clean email", legacy_clean_email, clean_email, EMAILS),
+    ]
+    print(f"{'per contact':22s} {'before µs':>10s} {'after µs':>10s} {'speedup':>8s}")
+    per_contact_before = per_contact_after = 0.0
+    for label, before, after, inputs in rows:
+        b, a = _per_call_us(before, inputs, number), _per_call_us(after, inputs, number)
+        per_contact_before += b
+        per_contact_after += a
+        print(f"{label:22s} {b:10.2f} {a:10.2f} {b / a:7.1f}x")
+    print(f"{'total':22s} {per_contact_before:10.2f} {per_contact_after:10.2f} "
+          f"{per_contact_before / per_contact_after:7.1f}x")
+
+    # Per page: boilerplate removal over the collected page text
+    tree = HTMLParser(build_corpus(300)["table"])
+    raw_text = " ".join([tree.root.text(separator=" ", strip=True)] * 3)[:45000]
+    from academic_lead_extractor.patterns import PAGE_NOISE_RE, WHITESPACE_RE
+    b = _per_call_us(legacy_page_noise, [raw_text], 200)
+    a = _per_call_us(lambda t: WHITESPACE_RE.sub(" ", PAGE_NOISE_RE.sub("", t)).strip(), [raw_text], 200)
+    print(f"\n{'page noise (45 KB)':22s} {b:10.1f} {a:10.1f} {b / a:7.1f}x")
+    tb = _per_call_us(_collect_page_text, [tree], 50)
+    print(f"{'_collect_page_text':22s} {'':10s} {tb:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Synthetic staff-page corpus for the extraction benchmarks.
+
+Pages are generated deterministically and mimic the layouts the scraper meets
+on real university sites: KIT-style tables with obfuscated emails, person
+cards, flat lists (page-level fallback), nested team containers and schema.org
+markup. ``size`` is the number of people per page; extraction should find every
+one of them (bench_extraction.py checks it).
+"""
+
+import json
+import random
+
+FIRST = ["Anna", "Ben", "Clara", "David", "Eva", "Felix", "Greta", "Hans", "Ina", "Jonas", "Katrin", "Lukas",
+         "Marie", "Nils", "Olga", "Paul", "Rita", "Sven", "Tina", "Uwe"]
+LAST = ["Müller", "Schmidt", "Weber", "Fischer", "Wagner", "Becker", "Hoffmann", "Schulz", "Koch", "Richter",
+        "Klein", "Wolf", "Neumann", "Schwarz", "Braun", "Zimmermann"]
+ROLES = ["Professor of Power Electronics", "Research Associate, Smart Grids", "Postdoc, Energy Storage",
+         "Lecturer in Control Systems", "Head of Embedded Systems Lab", "Wissenschaftlicher Mitarbeiter"]
+
+FILLER = "<p>Our institute works on renewable energy, electric drives and hardware-in-the-loop testing.</p>" * 3
+NAV = "<nav><ul>" + "".join(f"<li><a href='/section-{i}'>Section {i}</a></li>" for i in range(40)) + "</ul></nav>"
+FOOTER = "<footer>Privacy Policy · Cookie Settings · Copyright © University · All rights reserved</footer>"
+
+
+def _people(size, seed):
+    rng = random.Random(seed)
+    people = []
+    for i in range(size):
+        first, last = rng.choice(FIRST), rng.choice(LAST) + f"{i:04d}".translate(str.maketrans("0123456789", "abcdefghij"))
+        people.append((first, last, rng.choice(ROLES)))
+    return people
+
+
+def _page(title, body):
+    return (f"<html><head><title>{title}</title></head><body>{NAV}<main><h1>{title}</h1>{FILLER}"
+            f"{body}</main>{FOOTER}</body></html>")
+
+
+def table_page(size):
+    rows = "".join(
+        f"<tr class='staff-row'><td>Prof. Dr.-Ing. {f} {l}</td><td>{r}</td>"
+        f"<td>{f.lower()} {l.lower()} ∂ kit edu</td><td>+49 721 608-{i:05d}</td></tr>"
+        for i, (f, l, r) in enumerate(_people(size, 1))
+    )
+    return _page("Mitarbeiter - Elektrotechnisches Institut", f"<table><tbody>{rows}</tbody></table>")
+
+
+def cards_page(size):
+    cards = "".join(
+        f"<div class='person-card'><div class='inner'><h3>Dr. {f} {l}</h3><span class='position'>{r}</span>"
+        f"<a href='mailto:{f.lower()}.{l.lower()}@uni.edu'>Email</a><p>battery management, energy storage</p></div></div>"
+        for f, l, r in _people(size, 2)
+    )
+    return _page("Our Team", f"<div class='content'>{cards}</div>")
+
+
+def nested_team_page(size):
+    groups = []
+    people = _people(size, 3)
+    for g in range(0, len(people), 10):
+        members = "".join(
+            f"<div class='member'><span class='name'>{f} {l}</span><span class='title'>{r}</span>"
+            f"<a href='mailto:{f.lower()}.{l.lower()}@tu.de'>{f.lower()}.{l.lower()}@tu.de</a></div>"
+            for f, l, r in people[g:g + 10]
+        )
+        groups.append(f"<section><h2>Group {g // 10}</h2><div class='team-list' id='team-{g}'>{members}</div></section>")
+    return _page("People", "".join(groups))
+
+
+def flat_list_page(size):
+    items = "".join(
+        f"<li>{f} {l}, {r}, {f.lower()}.{l.lower()}@tu.de</li>" for f, l, r in _people(size, 4)
+    )
+    return _page("Staff", f"<ul>{items}</ul><p>General enquiries: info@tu.de</p>")
+
+
+def author_ld_list_page(size):
+    # CMS pages carry a JSON-LD author/publisher Person without email or job title (Yoast
+    # and the like); the mailto list next to it must still be mined by the page-level fallback
+    items = "".join(
+        f"<li>{f} {l}, {r} <a href='mailto:{f.lower()}.{l.lower()}@uni-due.de'>{f.lower()}.{l.lower()}@uni-due.de</a></li>"
+        for f, l, r in _people(size, 6)
+    )
+    ld = {"@context": "https://schema.org", "@graph": [
+        {"@type": "WebPage", "name": "Mitarbeiter", "author": {"@id": "#author"}},
+        {"@type": "Person", "@id": "#author", "name": "Webredaktion"},
+    ]}
+    script = f"<script type='application/ld+json'>{json.dumps(ld)}</script>"
+    return _page("Mitarbeiter", f"{script}<ul>{items}</ul>")
+
+
+def ld_secretariat_list_page(size):
+    # One JSON-LD Person with an email (the secretariat) above plain "Name, mailto" paragraphs:
+    # the structured contact must not stop the page-level fallback from mining the staff
+    paragraphs = "".join(
+        f"<p>{f} {l}, <a href='mailto:{f.lower()}.{l.lower()}@kit.edu'>{f.lower()}.{l.lower()}@kit.edu</a></p>"
+        for f, l, _ in _people(size, 7)
+    )
+    ld = {"@context": "https://schema.org", "@type": "Person", "name": "Sekretariat",
+          "jobTitle": "Sekretariat", "email": "sekretariat@kit.edu"}
+    script = f"<script type='application/ld+json'>{json.dumps(ld)}</script>"
+    return _page("Mitarbeiter", f"{script}{paragraphs}")
+
+
+def schema_org_page(size):
+    people = _people(size, 5)
+    ld = [{"@type": "Person", "name": f"{f} {l}", "jobTitle": r, "email": f"mailto:{f.lower()}.{l.lower()}@eth.ch"}
+          for f, l, r in people[: size // 2]]
+    micro = "".join(
+        f"<div itemscope itemtype='https://schema.org/Person'><span itemprop='name'>{f} {l}</span>"
+        f"<span itemprop='jobTitle'>{r}</span><a itemprop='email' href='mailto:{f.lower()}.{l.lower()}@eth.ch'>mail</a></div>"
+        for f, l, r in people[size // 2:]
+    )
+    script = f"<script type='application/ld+json'>{json.dumps({'@graph': ld})}</script>"
+    return _page("People", script + micro)
+
+
+LAYOUTS = {
+    "table": table_page,
+    "cards": cards_page,
+    "nested_team": nested_team_page,
+    "flat_list": flat_list_page,
+    "schema_org": schema_org_page,
+    "author_ld_list": author_ld_list_page,
+    "ld_secretariat_list": ld_secretariat_list_page,
+}
+
+
+def build_corpus(size: int = 300):
+    """{layout name: html} for every layout, each with ``size`` people."""
+    return {name: build(size) for name, build in LAYOUTS.items()}
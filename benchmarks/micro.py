@@ -0,0 +1,223 @@
+"""
+Micro-benchmarks for the hot extraction, cleaning and scoring functions, with
+stored baselines and a regression check.
+
+Each benchmark times one call of a function on fixed inputs (fixture pages
+from benchmarks/corpus.py: KIT-style tables, card grids, flat lists, nested
+teams, schema.org markup and a huge directory). The best of several runs is
+compared with the baseline; the run fails (exit code 1) when a benchmark got
+slower than the baseline by more than the threshold.
+
+Baselines are machine-specific: save one on the machine you compare on.
+
+Usage (from the repository root):
+    python benchmarks/micro.py --save                  # record benchmarks/baseline.json
+    python benchmarks/micro.py                         # compare against it
+    python benchmarks/micro.py -k extract --threshold 0.10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+config.DEBUG = False
+config.LOG_LEVEL = "WARNING"
+
+from selectolax.parser import HTMLParser
+
+from academic_lead_extractor.ai_evaluator import ai_evaluate_contacts
+from academic_lead_extractor.scraper import (
+    FIELD_MEMO,
+    StreamingDirectoryExtractor,
+    _collect_page_text,
+    _detect_university_field,
+    _extract_academic_title,
+    _guess_field_from_text,
+    clean_email,
+    extract_contacts_from_html,
+)
+from benchmarks.corpus import LAYOUTS, table_page
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.20  # allowed slowdown against the baseline (20%)
+PAGE_SIZE = 50  # people on a typical fixture page
+HUGE_SIZE = 8000  # people on the huge directory (over STREAMING_EXTRACTION_CHARS, so it is streamed)
+REPEAT = 5
+SLOW_CALL = 0.5  # seconds; calls slower than this are only repeated 3 times
+
+RAW_EMAILS = [
+    "anna.mueller@kit.edu", "mailto:b.weber@tu-berlin.de?subject=Hi", "clara ∂ kit edu",
+    "david [at] eth [dot] ch", "eva(at)uni-stuttgart(dot)de", "  Felix.Fischer@RWTH-Aachen.DE. ",
+    "greta.wagner at tum dot de", "info@", "hans.becker@uni.edu%20",
+]
+NAMES = [
+    "Prof. Dr.-Ing. Anna Müller", "Dr. rer. nat. Ben Schmidt", "Clara Weber, M.Sc.", "Professor David Fischer",
+    "Dipl.-Ing. Eva Wagner", "Felix Becker", "PhD Greta Hoffmann", "Prof. Hans Schulz",
+]
+FIELD_TEXTS = [
+    "Professor of Power Electronics and Electrical Drives",
+    "Research Associate, Smart Grids and Renewable Energy Systems",
+    "Postdoc, Battery Management and Energy Storage",
+    "Lecturer in Control Systems and Automation",
+    "Wissenschaftlicher Mitarbeiter, Institut für Elektrotechnik",
+    "Department of History and Philosophy",
+]
+
+# name -> setup; the setup builds the inputs and returns the callable that is timed
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def bench(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _register_extraction():
+    for layout, build in LAYOUTS.items():
+        def setup(build=build, layout=layout):
+            html = build(PAGE_SIZE)
+            return lambda: extract_contacts_from_html(html, f"https://example.edu/{layout}")
+        bench(f"extract.{layout}")(setup)
+
+        def setup_text(build=build):
+            tree = HTMLParser(build(PAGE_SIZE))
+            return lambda: _collect_page_text(tree)
+        bench(f"page_text.{layout}")(setup_text)
+
+
+_register_extraction()
+
+
+@bench("extract.huge_directory")
+def _extract_huge():
+    html = table_page(HUGE_SIZE)
+    return lambda: extract_contacts_from_html(html, "https://example.edu/huge")
+
+
+@bench("stream.huge_directory")
+def _stream_huge():
+    html = table_page(HUGE_SIZE)
+    chunks = [html[i:i + 64 * 1024] for i in range(0, len(html), 64 * 1024)]
+
+    def run():
+        stream = StreamingDirectoryExtractor("https://example.edu/huge")
+        for chunk in chunks:
+            stream.feed(chunk)
+        return stream.finish()
+    return run
+
+
+@bench("clean_email")
+def _clean_email():
+    return lambda: [clean_email(raw) for raw in RAW_EMAILS]
+
+
+@bench("academic_title")
+def _academic_title():
+    return lambda: [_extract_academic_title(name) for name in NAMES]
+
+
+@bench("guess_field.cold")
+def _guess_field_cold():
+    def run():
+        FIELD_MEMO.clear()
+        return [_guess_field_from_text(text) for text in FIELD_TEXTS]
+    return run
+
+
+@bench("guess_field.warm")
+def _guess_field_warm():
+    return lambda: [_guess_field_from_text(text) for text in FIELD_TEXTS]
+
+
+@bench("university_field.cold")
+def _university_field_cold():
+    tree = HTMLParser(LAYOUTS["table"](PAGE_SIZE))
+    text = _collect_page_text(tree)
+
+    def run():
+        FIELD_MEMO.clear()
+        return _detect_university_field("https://www.eti.kit.edu/mitarbeiter.php", "Mitarbeiter - ETI", text)
+    return run
+
+
+@bench("keyword_scoring")
+def _keyword_scoring():
+    contacts = extract_contacts_from_html(LAYOUTS["cards"](PAGE_SIZE), "https://example.edu/cards")
+    for contact in contacts:
+        contact.Country = "Germany"
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return asyncio.run(ai_evaluate_contacts(contacts, False, None, "", 0, 0.5))
+    return run
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """Best seconds per call over `repeat` runs of an auto-ranged loop."""
+    timer = timeit.Timer(fn)
+    number, total = timer.autorange()
+    if total / number > SLOW_CALL:
+        repeat = min(repeat, 3)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks with baseline regression check")
+    parser.add_argument("-k", dest="pattern", default="", help="only benchmarks whose name contains this")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help=f"runs per benchmark (default: {REPEAT})")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    results = {}
+    regressions = []
+    print(f"{'benchmark':28s} {'baseline µs':>12s} {'now µs':>12s} {'change':>8s}")
+    for name, setup in BENCHMARKS.items():
+        if args.pattern not in name:
+            continue
+        seconds = measure(setup(), args.repeat)
+        results[name] = seconds
+        base = baseline.get(name)
+        if base:
+            change = seconds / base - 1
+            flag = "  REGRESSION" if change > args.threshold else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:28s} {base * 1e6:12.1f} {seconds * 1e6:12.1f} {change:+8.1%}{flag}")
+        else:
+            print(f"{name:28s} {'-':>12s} {seconds * 1e6:12.1f} {'new':>8s}")
+
+    if args.save:
+        saved = dict(baseline, **results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.platform(), "results": saved},
+                      f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,28 @@ EXPLORE_SUBDOMAINS = True  # Follow department/institute subdomains
 # HTTP retry settings
 MAX_RETRIES = 3  # number of retry attempts for failed HTTP requests
 RETRY_DELAY = 1.0  # initial retry delay in seconds (exponential backoff)
+MAX_RETRY_AFTER = 60  # longest Retry-After (429/503) honored, in seconds
+
+# Adaptive concurrency per host (AIMD, academic_lead_extractor/concurrency.py)
+CONCURRENCY_INITIAL = 2  # requests in flight per host at the start
+CONCURRENCY_MIN = 1  # floor after repeated backoffs
+CONCURRENCY_MAX = 8  # ceiling for fast, healthy servers
+CONCURRENCY_INCREASE = 1.0  # added to the limit per round of fast, successful responses
+CONCURRENCY_BACKOFF = 0.5  # limit multiplied by this after a timeout, connection error, 429 or 5xx
+CONCURRENCY_LATENCY_TOLERANCE = 2.0  # response time above this multiple of the host's best counts as congestion
+CONCURRENCY_LATENCY_BACKOFF = 0.9  # limit multiplied by this when response times rise
+
+# Metrics and tracing (results/metrics.json, results/metrics.prom)
+METRICS_MAX_SPANS = 50000  # spans kept for the trace; later ones only count in the histograms
+
+# Sampling profiler (--profile; results/profile.folded, results/profile.txt)
+PROFILE_INTERVAL = 0.005  # seconds between stack samples (busy CPU-bound code stretches this; ~1% overhead)
+PROFILE_TOP_N = 15  # functions listed per stage in profile.txt
+
+# Live status (academic_lead_extractor/dashboard.py; --status serves it on http://127.0.0.1:<port>/)
+STATUS_PORT = 8765  # default port for --status
+STATUS_LOG_INTERVAL = 30  # seconds between status lines in the log (0 = off)
+STATUS_RATE_WINDOW = 60  # seconds over which the current rates are measured
 
 # AI Token Pricing (per 1M tokens) - Updated as of 2024
 AI_PRICING = {
@@ -92,8 +114,14 @@ from keywords_multilingual import KEYWORDS_BY_LANGUAGE, COUNTRY_LANGUAGE, FIELD_
 # SCRAPER CONFIGURATION
 # ---------------------------
 
-# Debug mode for verbose output
-DEBUG = True
+# Logging (academic_lead_extractor/log.py)
+LOG_LEVEL = "INFO"  # "DEBUG" logs every URL, classification and extraction
+DEBUG = LOG_LEVEL == "DEBUG"  # verbose per-URL output
+LOG_FILE = ""  # optional JSON Lines log file (all records that pass LOG_LEVEL), e.g. "results/run.log.jsonl"
+LOG_RATE_LIMIT = 50  # max DEBUG records per second per category (0 = unlimited); INFO and above are never dropped
+LOG_SAMPLING = {  # fraction of DEBUG records kept per category
+    "classify": 0.25,  # keyword/department matches on every URL
+}
 
 # Staff page detection keywords (for URL and page title matching)
 STAFF_PAGE_KEYWORDS = [
@@ -120,6 +148,29 @@ STAFF_PAGE_KEYWORDS = [
     "professoren", "forschende", "team"
 ]
 
+# URL patterns for department/institute/research group homepages (explored for staff pages)
+DEPARTMENT_URL_PATTERNS = [
+    # English
+    '/institut', '/institute', '/faculty', '/department', '/school',
+    '/group', '/lab', '/laboratory', '/center', '/centre',
+    # German
+    '/fachgebiet', '/lehrstuhl', '/arbeitsgruppe', '/fachbereich', '/abteilung',
+    # French
+    '/laboratoire', '/équipe', '/département',
+    # Italian
+    '/dipartimento', '/laboratorio',
+    # Spanish
+    '/departamento', '/grupo',
+]
+
+# Seed discovery before crawling: robots.txt (disallow rules, crawl-delay) and sitemaps
+USE_ROBOTS_TXT = True  # skip URLs disallowed by robots.txt and honour its crawl-delay
+USE_SITEMAPS = True  # seed the crawl with staff/department URLs listed in the sitemaps
+MAX_SITEMAP_FILES = 20  # sitemap files (incl. sitemap index children) read per university
+MAX_SITEMAP_URLS = 50000  # sitemap entries scanned per university
+MAX_SITEMAP_SEEDS = 50  # staff/department URLs injected into the crawl
+MAX_CRAWL_DELAY = 10.0  # cap on a robots.txt crawl-delay (seconds)
+
 # URL patterns to exclude from crawling
 EXCLUDE_URL_PATTERNS = [
     "/press", "/news", "/events", "/calendar", "/media", "/gallery",
@@ -151,9 +202,49 @@ EXCLUDE_EMAIL_PATTERNS = [
 ]
 
 # Crawling limits
-MAX_PAGES_PER_DOMAIN = 200  # Maximum pages to crawl per university
+MAX_PAGES_PER_DOMAIN = 200  # Starting page budget per university (adapted to its yield, see below)
 MAX_CRAWL_DEPTH = 3  # Maximum recursive depth for crawling
 
+# Adaptive crawl budget: yield = new contacts per page over the last CRAWL_BUDGET_WINDOW pages
+CRAWL_BUDGET_WINDOW = 30  # pages over which yield and staff page rate are measured
+CRAWL_BUDGET_EXTEND_YIELD = 1.0  # budget used up at this yield or more: extend it
+CRAWL_BUDGET_EXTEND_STEP = 100  # pages added per extension
+CRAWL_BUDGET_MAX_PAGES = 600  # ceiling for extended budgets
+CRAWL_BUDGET_MIN_PAGES = 60  # pages crawled before a low yield narrows the crawl
+CRAWL_BUDGET_MIN_YIELD = 0.1  # below this yield only the homepage's links are still fetched
+CRAWL_BUDGET_DEEP_STAFF_RATE = 0.5  # staff page share that allows one level beyond MAX_CRAWL_DEPTH
+CRAWL_RUN_MAX_PAGES = 0  # pages for the whole run (0 = unlimited)
+CRAWL_RUN_MAX_SECONDS = 0  # run deadline: running crawls are cancelled (keeping their contacts), no new ones start (0 = none)
+UNIVERSITY_TIMEOUT = 1200  # seconds one university may crawl before it is cancelled, keeping its contacts (0 = none)
+
+# Paginated staff directories: query parameters (and path segments) that select a page of the listing
+PAGINATION_PAGE_PARAMS = ["page", "p", "pg", "paged", "pagenum", "page_num", "currentpage", "seite", "pagina", "strona"]
+PAGINATION_OFFSET_PARAMS = ["start", "offset", "from", "skip", "begin", "startrow"]
+PAGINATION_LETTER_PARAMS = ["letter", "initial", "char", "alpha", "az", "buchstabe", "anfangsbuchstabe", "lettre", "lettera", "letra"]
+MAX_PAGINATION_PAGES = 100  # directory pages enumerated per listing
+
+# Duplicate pages: URL variants and near-identical staff pages are skipped
+URL_IGNORED_PARAMS = [
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "mc_cid", "mc_eid", "_ga", "_gl", "igshid",  # tracking
+    "sessionid", "sid", "phpsessid", "jsessionid", "cfid", "cftoken",  # sessions
+    "print", "printview", "printable",  # print views
+]  # plus every "utm_*" parameter
+SIMHASH_MAX_DISTANCE = 3  # max differing bits (of 64) between near-duplicate page texts
+
+# Streaming fetch: responses are read in chunks up to a hard cap per page
+MAX_PAGE_BYTES = 8_000_000  # bytes read per page at most (longer responses are truncated)
+STREAM_CHUNK_BYTES = 64 * 1024  # read size while streaming a response
+STREAMING_EXTRACTION_CHARS = 1_000_000  # staff directories larger than this are extracted row by row while downloading
+
+# Memoized field classifications (LRU entries, keyed by a digest of the normalized text)
+FIELD_CACHE_SIZE = 4096
+
+# Cross-run state used by --incremental (staff pages, validators, content hashes, contacts)
+RUN_STATE_FILE = "results/run_state.json.gz"
+
+# SQLite lead history written with --store (leads upserted by email across runs)
+LEAD_STORE_FILE = "results/leads.sqlite"
+
 # User agents for rotation (helps avoid blocking)
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
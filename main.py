@@ -38,16 +38,19 @@ if USE_AI and not OPENAI_API_KEY:
     USE_AI = False
 
 if USE_AI:
-    from openai import OpenAI
-    client = OpenAI(api_key=OPENAI_API_KEY)
     print(f"✅ AI Filtering: ENABLED (Model: {AI_MODEL}, Min Score: {AI_MIN_SCORE})")
 else:
-    client = None
     print("ℹ️  AI Filtering: DISABLED (using keyword matching only)")
 
 # Import config for depth settings
-from config import MAX_FACULTY_LINKS, MAX_DEPARTMENT_LINKS
-from academic_lead_extractor.processor import main as run_pipeline
+from config import MAX_FACULTY_LINKS, MAX_DEPARTMENT_LINKS, LEAD_STORE_FILE, STATUS_PORT
+from academic_lead_extractor.log import setup_logging
+
+
+def create_ai_client():
+    """OpenAI client, created only when AI is used (importing openai alone takes about a second)."""
+    from openai import OpenAI
+    return OpenAI(api_key=OPENAI_API_KEY)
 
 
 def parse_arguments():
@@ -74,6 +77,25 @@ Examples:
   
   # Fine-tune limits
   python3 main.py --max-faculty-links 100 --max-department-links 25
+  
+  # Weekly refresh: re-check only the staff pages found last run
+  python3 main.py --incremental
+  
+  # Also write a Parquet dataset (results/dataset/Country=.../University=...)
+  python3 main.py --columnar parquet
+  
+  # Merge this run into the SQLite lead history (results/leads.sqlite)
+  python3 main.py --store
+  
+  # Watch a long run live in the browser (http://127.0.0.1:8765/)
+  python3 main.py --status
+  
+  # Profile a slow run: top functions per stage + flamegraph input in results/
+  python3 main.py --urls https://www.kit.edu --profile
+  
+  # Record the crawl to a corpus, later replay it offline (no network)
+  python3 main.py --urls https://www.kit.edu --record corpus/kit
+  python3 main.py --urls https://www.kit.edu --replay corpus/kit
         """
     )
     
@@ -118,6 +140,62 @@ Examples:
         help='Enable AI-based individual profile page detection (slower but may catch edge cases)'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only re-check staff pages found on the previous run (conditional requests); writes results/changes.json'
+    )
+    
+    parser.add_argument(
+        '--columnar',
+        choices=['parquet', 'arrow'],
+        metavar='FORMAT',
+        help='Also write a columnar dataset (parquet or arrow) to results/dataset/, partitioned by Country/University (requires pyarrow)'
+    )
+    
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const=LEAD_STORE_FILE,
+        metavar='PATH',
+        help=f'Upsert leads into a SQLite history across runs (default path: {LEAD_STORE_FILE})'
+    )
+    
+    parser.add_argument(
+        '--otlp',
+        nargs='?',
+        const='http://localhost:4318',
+        metavar='URL',
+        help='Also send the run trace to an OpenTelemetry collector (OTLP/HTTP, default: http://localhost:4318)'
+    )
+    
+    parser.add_argument(
+        '--status',
+        nargs='?',
+        type=int,
+        const=STATUS_PORT,
+        metavar='PORT',
+        help=f'Serve a live status page (throughput, queue, requests in flight, AI spend, ETA) on http://127.0.0.1:PORT/ (default port: {STATUS_PORT})'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Sample where CPU time goes; writes results/profile.txt (top functions per stage) and results/profile.folded (flamegraph)'
+    )
+    
+    traffic_group = parser.add_mutually_exclusive_group()
+    traffic_group.add_argument(
+        '--record',
+        metavar='DIR',
+        help='Save every crawler HTTP response to a replay corpus in DIR'
+    )
+    traffic_group.add_argument(
+        '--replay',
+        metavar='DIR',
+        help='Serve the crawler from a corpus recorded with --record instead of the network'
+    )
+    
     # Exploration depth options
     depth_group = parser.add_argument_group('exploration depth')
     depth_group.add_argument(
@@ -147,14 +225,12 @@ def main():
     """Entry point for script execution."""
     # Parse command-line arguments
     args = parse_arguments()
+    setup_logging()
     
     # Override AI settings if specified
     use_ai = USE_AI
     if args.no_ai:
         use_ai = False
-        client_obj = None
-    else:
-        client_obj = client
     
     ai_min_score = AI_MIN_SCORE
     if args.ai_score is not None:
@@ -211,6 +287,18 @@ def main():
     config.MAX_FACULTY_LINKS = max_faculty
     config.MAX_DEPARTMENT_LINKS = max_dept
     
+    # The pipeline (aiohttp, selectolax, ...) is imported only once the arguments are valid
+    from academic_lead_extractor.processor import main as run_pipeline
+    from academic_lead_extractor import replay
+    
+    if args.record or args.replay:
+        try:
+            replay.configure(record_dir=args.record or "", replay_dir=args.replay or "")
+        except FileNotFoundError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"📼 {'Recording crawl traffic to' if args.record else 'Replaying crawl traffic from'} {args.record or args.replay}")
+    
     # Prepare university list
     university_urls = None
     
@@ -250,11 +338,17 @@ def main():
     asyncio.run(run_pipeline(
         university_urls=university_urls,
         use_ai=use_ai,
-        client=client_obj,
+        client=create_ai_client() if use_ai else None,
         ai_model=ai_model,
         ai_batch_size=AI_BATCH_SIZE,
         ai_min_score=ai_min_score,
-        use_ai_profile_detection=use_ai_profile_detection
+        use_ai_profile_detection=use_ai_profile_detection,
+        columnar_format=args.columnar,
+        incremental=args.incremental,
+        store_path=args.store,
+        otlp_endpoint=args.otlp,
+        profile=args.profile,
+        status_port=args.status
     ))
 
 
@@ -12,6 +12,7 @@ Usage:
   python3 run_with_ai.py --urls https://www.kit.edu        # Single URL
   python3 run_with_ai.py --urls URL1 URL2 URL3             # Multiple URLs
   python3 run_with_ai.py --csv my_universities.csv         # Custom CSV
+  python3 run_with_ai.py --urls URL --profile               # Profile: results/profile.txt, profile.folded
 """
 
 import os
@@ -34,13 +35,11 @@ university_count = 0
 if temp_args.urls:
     university_count = len(temp_args.urls)
 else:
-    # Load from CSV
-    import pandas as pd
+    # Count CSV rows without loading pandas (only needed for the estimate)
+    from academic_lead_extractor.utils import count_csv_rows
     csv_file = temp_args.csv
     if os.path.exists(csv_file):
-        df = pd.read_csv(csv_file)
-        if 'Website' in df.columns:
-            university_count = df['Website'].notna().sum()
+        university_count = count_csv_rows(csv_file, 'Website')
 
 # Calculate dynamic estimates based on actual count
 cost_min = max(0.02, university_count * 0.02)
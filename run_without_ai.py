@@ -11,6 +11,7 @@ Usage:
   python3 run_without_ai.py --urls https://www.kit.edu        # Single URL
   python3 run_without_ai.py --urls URL1 URL2 URL3             # Multiple URLs
   python3 run_without_ai.py --csv my_universities.csv         # Custom CSV
+  python3 run_without_ai.py --urls URL --profile               # Profile: results/profile.txt, profile.folded
 """
 
 import os